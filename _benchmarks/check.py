@@ -0,0 +1,63 @@
+'''
+	Sends the request of every scenario (see `scenarios.SCENARIOS`) once at each log level, and reports every request
+	that did not get the response the scenario expects. The pipeline builds (and logs) a lot more at the DEBUG and TRACE
+	levels than it does at INFO, so a mistake in a log call only shows up when that level is turned on.
+
+	Usage:
+		python _benchmarks/check.py [--level trace|debug|info ...] [--scenario NAME ...] [--project DIR]
+'''
+import sys
+import argparse
+
+import harness
+import scenarios
+
+#The levels checked by default, from the one that logs the most
+DEFAULT_LEVELS = ['trace', 'debug', 'info']
+
+
+
+def checkScenarios(selected, level):
+	'''
+	@FUNC	Sends the request of every scenario once, with every logger at the given level
+	@PARAM	selected : List of Dictionaries, see `scenarios.SCENARIOS`
+	@PARAM	level : String, see `system.util.setLogLevel`
+	@RETURN	List of Strings, a description of every unexpected response
+	'''
+	harness.setLogLevel(level)
+	failures = []
+	for scenario in selected:
+		request, response = harness.sendRequest(scenario)
+		if not harness.isExpectedResponse(scenario, request, response):
+			failures.append("[{!s}] {!s}: expected {!s}{!s}, got {!s} {!s}".format(
+				level, scenario['name'], scenario['status'],
+				(" (success={!r})".format(scenario['success']) if 'success' in scenario else ''),
+				request['servletResponse'].getStatus(), repr(response)[:200]
+			))
+	#END FOR
+	return failures
+#END DEF
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="Checks every scenario gets the response it expects, at each log level.")
+	parser.add_argument('--project', default=None, help="the folder holding project.json [DEFAULT: this project]")
+	parser.add_argument('--level', action='append', default=None, help="check at this log level (repeatable) "+
+		"[DEFAULT: {!s}]".format(', '.join(DEFAULT_LEVELS)))
+	parser.add_argument('--scenario', action='append', default=None, help="only check this scenario (repeatable)")
+	args = parser.parse_args(argv)
+
+	harness.loadProject(args.project)
+	selected = [scenarios.getScenario(name) for name in args.scenario] if args.scenario else scenarios.SCENARIOS
+	failures = []
+	for level in (args.level or DEFAULT_LEVELS):
+		failures.extend(checkScenarios(selected, level))
+	#END FOR
+	for failure in failures:
+		print failure
+	#END FOR
+	print "{!s} unexpected responses".format(len(failures))
+	return 1 if failures else 0
+#END DEF
+
+if __name__ == '__main__':
+	sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,239 @@
+'''
+	The pieces shared by the benchmarks: loading the project under the `ignition_shim` stand-ins, sending a scenario
+	through `__swagger2__.requests.processRequest`, recording the stage times of each request, and summarizing (and
+	saving) the results.
+'''
+import os
+import sys
+import json
+import time
+import platform
+import timeit
+from collections import OrderedDict
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+#The project this folder lives in (the folder holding `project.json`)
+DEFAULT_PROJECT_DIR = os.path.dirname(BENCHMARKS_DIR)
+
+if BENCHMARKS_DIR not in sys.path:
+	sys.path.insert(0, BENCHMARKS_DIR)
+import ignition_shim
+ignition_shim.install()
+from ignition_shim import loader, webdev
+
+#The best timer for the interpreter (wall clock time, in seconds)
+clock = timeit.default_timer
+
+#The percentiles reported by `summarize`
+PERCENTILES = OrderedDict([('p50', 0.50), ('p90', 0.90), ('p95', 0.95), ('p99', 0.99)])
+
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# LOADING THE PROJECT and SENDING REQUESTS
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+def loadProject(projectDir=None, logLevel='info', logSink=None):
+	'''
+	@FUNC	Loads the project's Script Library under the stand-ins, the way the gateway does
+	@PARAM	projectDir : String/None, the folder holding `project.json` [DEFAULT: the project this folder lives in]
+	@PARAM	logLevel : String, the level of every logger (see `system.util.setLogLevel`). The level changes how much
+				work the project does, so runs should only be compared when they used the same level.
+	@PARAM	logSink : Function/None, called with `(loggerName, level, message)` for every message logged. The
+				messages are dropped when None, but they are still built (when the level is enabled).
+	@RETURN	Dictionary, mapping every full resource name to its Script Package/Module
+	'''
+	setLogLevel(logLevel, logSink)
+	return loader.loadProject(projectDir or DEFAULT_PROJECT_DIR)
+#END DEF
+
+def setLogLevel(logLevel, logSink=None):
+	'''
+	@FUNC	Changes the level of every logger (see `loadProject`), without reloading the project
+	'''
+	import system
+	system.util.setLogLevel(logLevel, logSink if logSink is not None else _dropMessage)
+#END DEF
+
+def _dropMessage(loggerName, level, message):
+	pass
+#END DEF
+
+def sendRequest(scenario):
+	'''
+	@FUNC	Sends the request of a scenario through the project's request pipeline
+	@PARAM	scenario : Dictionary, see `scenarios.SCENARIOS`
+	@RETURN	Tuple, (WebDev Request Python Dictionary, what `processRequest` returned). The status is in
+				`request['servletResponse'].getStatus()`.
+	'''
+	import __swagger2__
+	request, session = webdev.makeRequest(
+		scenario['method'], scenario['path'], scenario.get('query'), scenario.get('headers'), scenario.get('body'),
+		projectName = scenario.get('projectName', None) or webdev.DEFAULT_PROJECT_NAME
+	)
+	return request, __swagger2__.requests.processRequest(request, session)
+#END DEF
+
+def isExpectedResponse(scenario, request, response):
+	'''
+	@FUNC	Checks whether a scenario's request got the response it expects: its HTTP Status and, when the scenario
+			gives one, the 'success' of its JSON
+	@PARAM	scenario : Dictionary, see `scenarios.SCENARIOS`
+	@PARAM	request, response : see `sendRequest`
+	@RETURN	Boolean
+	'''
+	if request['servletResponse'].getStatus() != scenario['status']:
+		return False
+	if 'success' not in scenario:
+		return True
+	body = None
+	if isinstance(response, dict) and 'json' in response:
+		body = response['json']
+	elif isinstance(response, dict) and isinstance(response.get('response', None), basestring):
+		#The JSON has already been serialized (eg. by the response cache)
+		try:
+			body = json.loads(response['response'])
+		except ValueError:
+			pass
+	#END IF/ELIF
+	return isinstance(body, dict) and body.get('success', None) == scenario['success']
+#END DEF
+
+class StageRecorder(object):
+	'''
+	@CLASS	Keeps the `StageTimer` of every request handled while it is installed, by standing in for the
+			`__swagger2__.metrics.StageTimer` class that `processRequest` creates the timers from.
+	@ATTR	timers : List of StageTimer objects
+	'''
+	def __init__(self):
+		self.timers = []
+		self.__originalClass = None
+	#END DEF
+
+	def install(self):
+		import __swagger2__
+		metrics = __swagger2__.metrics
+		self.__originalClass = metrics.StageTimer
+		recorder = self
+		class RecordingStageTimer(self.__originalClass):
+			def __init__(self):
+				super(RecordingStageTimer, self).__init__()
+				recorder.timers.append(self)
+			#END DEF
+		#END CLASS
+		metrics.StageTimer = RecordingStageTimer
+		return self
+	#END DEF
+
+	def uninstall(self):
+		import __swagger2__
+		if self.__originalClass is not None:
+			__swagger2__.metrics.StageTimer = self.__originalClass
+			self.__originalClass = None
+	#END DEF
+
+	def clear(self):
+		del self.timers[:]
+	#END DEF
+
+	def stageTimes(self):
+		'''
+		@FUNC	Gets the times of every stage, across the requests recorded
+		@RETURN	OrderedDict, mapping each stage to a List of times (in milliseconds). Requests that never reached a
+					stage add nothing to its List.
+		'''
+		import __swagger2__
+		times = OrderedDict([(stage, []) for stage in __swagger2__.metrics.STAGES])
+		for timer in self.timers:
+			for stage, milliseconds in timer.stageTimes.items():
+				times.setdefault(stage, []).append(milliseconds)
+			#END FOR
+		#END FOR
+		return OrderedDict([(stage, values) for stage, values in times.items() if values])
+	#END DEF
+#END CLASS
+
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# RESULTS
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+def percentile(sortedValues, fraction):
+	'''
+	@FUNC	Gets a percentile of the values (using the nearest rank)
+	@PARAM	sortedValues : List of numbers, sorted
+	@PARAM	fraction : Float, between 0 and 1 (eg. 0.95 for the 95th percentile)
+	@RETURN	Number/None, None when there are no values
+	'''
+	if not sortedValues:
+		return None
+	index = max(0, min(len(sortedValues) - 1, int(round(fraction * len(sortedValues) + 0.5)) - 1))
+	return sortedValues[index]
+#END DEF
+
+def summarize(values, digits=4):
+	'''
+	@FUNC	Summarizes a List of measurements
+	@PARAM	values : List of numbers
+	@PARAM	digits : Integer, the number of decimal places kept
+	@RETURN	OrderedDict, with the keys 'count', 'mean', 'min', the `PERCENTILES`, and 'max'
+	'''
+	sortedValues = sorted(values)
+	summary = OrderedDict([('count', len(sortedValues))])
+	if not sortedValues:
+		return summary
+	summary['mean'] = round(sum(sortedValues) / float(len(sortedValues)), digits)
+	summary['min'] = round(sortedValues[0], digits)
+	for name, fraction in PERCENTILES.items():
+		summary[name] = round(percentile(sortedValues, fraction), digits)
+	summary['max'] = round(sortedValues[-1], digits)
+	return summary
+#END DEF
+
+def environmentInfo(**extra):
+	'''
+	@FUNC	Describes where (and how) the benchmark was run, so that results from different runs can be compared
+	@PARAM	**extra : any other settings of the run to include
+	@RETURN	OrderedDict
+	'''
+	info = OrderedDict([
+		('timestamp', time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())),
+		('python', '{!s} {!s}'.format(platform.python_implementation(), platform.python_version())),
+		('platform', platform.platform()),
+	])
+	info.update(sorted(extra.items()))
+	return info
+#END DEF
+
+def writeJson(results, path):
+	'''
+	@FUNC	Writes the results as JSON
+	@PARAM	results : Dictionary
+	@PARAM	path : String, the file to write, or '-' for stdout
+	'''
+	text = json.dumps(results, indent=2, separators=(',', ': '))
+	if path == '-':
+		sys.stdout.write(text + '\n')
+	else:
+		with open(path, 'w') as f:
+			f.write(text + '\n')
+#END DEF
+
+def formatTable(headers, rows):
+	'''
+	@FUNC	Lines up the columns of a table, for printing
+	@PARAM	headers : List of Strings
+	@PARAM	rows : List of Lists
+	@RETURN	String
+	'''
+	cells = [[str(header) for header in headers]] + [[('-' if value is None else str(value)) for value in row] for row in rows]
+	widths = [max(len(row[i]) for row in cells) for i in range(len(headers))]
+	lines = []
+	for i, row in enumerate(cells):
+		lines.append('  '.join(
+			(value.ljust(widths[j]) if j == 0 else value.rjust(widths[j])) for j, value in enumerate(row)
+		))
+		if i == 0:
+			lines.append('  '.join('-' * width for width in widths))
+	#END FOR
+	return '\n'.join(lines)
+#END DEF
\ No newline at end of file
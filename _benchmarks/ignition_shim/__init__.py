@@ -0,0 +1,20 @@
+'''
+	A stand-in for the pieces of an Ignition Gateway that the IgnitionSwagger project scripts need, so that
+	the request pipeline can be exercised (and timed) with a plain CPython 2.7 interpreter.
+
+	Call `install()` before anything else; it puts the stand-in `system`, `java` and `com.inductiveautomation`
+	modules on the path. `loader.loadProject` then loads the project's Script Library the way the gateway
+	does, and `webdev` builds fake WebDev `request`/`session` objects.
+'''
+import os
+import sys
+
+SHIM_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def install():
+	'''
+	@FUNC	Puts the stand-in modules on the path, ahead of anything else with the same name
+	'''
+	if SHIM_DIR not in sys.path:
+		sys.path.insert(0, SHIM_DIR)
+#END DEF
\ No newline at end of file
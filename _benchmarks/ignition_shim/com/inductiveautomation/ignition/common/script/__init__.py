@@ -0,0 +1,21 @@
+'''
+	Stand-in for Ignition's `ScriptPackage`. Packages are module objects whose `__dict__` holds the child
+	packages and script modules, which is how the Swagger magic walks the project library.
+'''
+import types
+
+__all__ = ['ScriptPackage']
+
+class ScriptPackage(types.ModuleType):
+	def __init__(self, fullName):
+		types.ModuleType.__init__(self, fullName.rsplit('.', 1)[-1])
+		self.name = self.__name__
+		self.fullName = fullName
+		#Needed so that Python 2's import machinery treats the package as a package
+		self.__path__ = []
+	#END DEF
+	
+	def __repr__(self):
+		return "<ScriptPackage {!s}>".format(self.fullName)
+	#END DEF
+#END CLASS
\ No newline at end of file
@@ -0,0 +1,12 @@
+'''
+	Stand-in for Jython's `jarray` module. Java arrays are represented by Python Lists.
+'''
+_ZEROS = {'c': u'\x00', 'b': 0, 'h': 0, 'i': 0, 'l': 0, 'f': 0.0, 'd': 0.0, 'z': False}
+
+def zeros(length, typecode):
+	return [_ZEROS.get(typecode, None)] * length
+#END DEF
+
+def array(sequence, typecode):
+	return list(sequence)
+#END DEF
\ No newline at end of file
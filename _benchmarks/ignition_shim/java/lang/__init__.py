@@ -0,0 +1,89 @@
+'''
+	Stand-in for the handful of `java.lang` classes the project scripts touch. Java exceptions are NOT
+	Python `Exception` subclasses under Jython, so the stand-in derives from `BaseException` to keep the
+	`except (Exception, java.lang.Exception), e` blocks honest.
+'''
+from __future__ import absolute_import
+import time
+
+__all__ = ['Exception', 'StackTraceElement', 'String', 'Double', 'System']
+
+class Exception(BaseException):
+	def __init__(self, message=None, cause=None):
+		BaseException.__init__(self, message)
+		self._message = message
+		self._cause = cause
+		self._stackTrace = []
+	#END DEF
+	
+	def getMessage(self):
+		return self._message
+	#END DEF
+	
+	def getCause(self):
+		return self._cause
+	#END DEF
+	
+	def getStackTrace(self):
+		return list(self._stackTrace)
+	#END DEF
+	
+	def setStackTrace(self, stackTrace):
+		self._stackTrace = list(stackTrace)
+	#END DEF
+#END CLASS
+
+class StackTraceElement(object):
+	def __init__(self, declaringClass, methodName, fileName, lineNumber):
+		self.declaringClass = declaringClass
+		self.methodName = methodName
+		self.fileName = fileName
+		self.lineNumber = lineNumber
+	#END DEF
+	
+	def getClassName(self):
+		return self.declaringClass
+	#END DEF
+	
+	def getMethodName(self):
+		return self.methodName
+	#END DEF
+	
+	def getFileName(self):
+		return self.fileName
+	#END DEF
+	
+	def getLineNumber(self):
+		return self.lineNumber
+	#END DEF
+#END CLASS
+
+class String(unicode):
+	def __new__(cls, value=u'', offset=None, count=None):
+		#`new String(char[] value, int offset, int count)`
+		if offset is not None:
+			value = u''.join(value[offset:offset + count])
+		return unicode.__new__(cls, value)
+	#END DEF
+#END CLASS
+
+class Double(float):
+	pass
+#END CLASS
+
+class System(object):
+	@staticmethod
+	def nanoTime():
+		return int(time.time() * 1e9)
+	#END DEF
+	
+	@staticmethod
+	def currentTimeMillis():
+		return int(time.time() * 1000)
+	#END DEF
+#END CLASS
+
+#Jython lets scripts `import java.lang.Exception` as if the class were a module; mirroring that here.
+import sys as _sys
+for _name in __all__:
+	_sys.modules[__name__ + '.' + _name] = globals()[_name]
\ No newline at end of file
@@ -0,0 +1,57 @@
+'''
+	Stand-in for `java.util.Date`, holding milliseconds since epoch like the real class.
+'''
+from __future__ import absolute_import
+import time
+import datetime
+
+__all__ = ['Date', 'Map', 'Collection']
+
+class Date(object):
+	def __init__(self, millis=None):
+		self._millis = int(time.time() * 1000) if millis is None else int(millis)
+	#END DEF
+	
+	def getTime(self):
+		return self._millis
+	#END DEF
+	
+	def toDatetime(self):
+		return datetime.datetime.utcfromtimestamp(self._millis / 1000.0)
+	#END DEF
+	
+	def __eq__(self, other):
+		return isinstance(other, Date) and other._millis == self._millis
+	#END DEF
+	
+	def __ne__(self, other):
+		return not self.__eq__(other)
+	#END DEF
+	
+	def __hash__(self):
+		return hash(self._millis)
+	#END DEF
+	
+	def __repr__(self):
+		return "Date({!s})".format(self.toDatetime().isoformat())
+	#END DEF
+#END CLASS
+
+class Map(object):
+	'''Stand-in for the `java.util.Map` interface. Only used for `isinstance` checks.'''
+	def entrySet(self):
+		raise NotImplementedError
+	#END DEF
+#END CLASS
+
+class Collection(object):
+	'''Stand-in for the `java.util.Collection` interface. Only used for `isinstance` checks.'''
+	def __iter__(self):
+		raise NotImplementedError
+	#END DEF
+#END CLASS
+
+#Jython lets scripts `import java.lang.Exception` as if the class were a module; mirroring that here.
+import sys as _sys
+for _name in __all__:
+	_sys.modules[__name__ + '.' + _name] = globals()[_name]
\ No newline at end of file
@@ -0,0 +1,66 @@
+'''
+	Stand-ins for the `java.util.concurrent.atomic` classes (backed by a lock instead of CPU atomics).
+'''
+import threading
+
+class AtomicLong(object):
+	def __init__(self, value=0):
+		self._value = long(value)
+		self._lock = threading.Lock()
+	#END DEF
+	
+	def get(self):
+		return self._value
+	#END DEF
+	
+	def set(self, value):
+		self._value = long(value)
+	#END DEF
+	
+	def addAndGet(self, delta):
+		with self._lock:
+			self._value += delta
+			return self._value
+	#END DEF
+	
+	def incrementAndGet(self):
+		return self.addAndGet(1)
+	#END DEF
+	
+	def getAndIncrement(self):
+		return self.addAndGet(1) - 1
+	#END DEF
+	
+	def compareAndSet(self, expect, update):
+		with self._lock:
+			if self._value == expect:
+				self._value = long(update)
+				return True
+			return False
+	#END DEF
+#END CLASS
+
+class AtomicLongArray(object):
+	def __init__(self, length):
+		self._values = [0L] * length
+		self._lock = threading.Lock()
+	#END DEF
+	
+	def length(self):
+		return len(self._values)
+	#END DEF
+	
+	def get(self, i):
+		return self._values[i]
+	#END DEF
+	
+	def addAndGet(self, i, delta):
+		with self._lock:
+			self._values[i] += delta
+			return self._values[i]
+	#END DEF
+	
+	def incrementAndGet(self, i):
+		return self.addAndGet(i, 1)
+	#END DEF
+#END CLASS
\ No newline at end of file
@@ -0,0 +1,97 @@
+'''
+	Loads an Ignition project's Script Library (`ignition/script-python`) into `sys.modules`.
+
+	Every folder containing a `code.py` is a Script Module and every other folder is a Script Package, just
+	like on the gateway. Package and module names may contain hyphens (eg. `is-x-integer-petId`), so they
+	are loaded through a `sys.meta_path` hook rather than the normal file-system importer. As on the gateway,
+	the top-level packages and modules (eg. `server`, `__swagger2__`) are visible inside every script module
+	without an explicit import.
+'''
+from __future__ import absolute_import
+import os
+import sys
+import imp
+
+import system
+from com.inductiveautomation.ignition.common.script import ScriptPackage
+
+SCRIPT_LIBRARY_DIR = os.path.join('ignition', 'script-python')
+MODULE_FILE = 'code.py'
+
+class ScriptLibraryImporter(object):
+	'''
+	@CLASS	A PEP-302 finder/loader for the Script Modules of one project.
+	'''
+	def __init__(self, moduleFiles, topLevelNames):
+		self.moduleFiles = moduleFiles
+		self.topLevelNames = topLevelNames
+		self.loading = set()
+	#END DEF
+	
+	def find_module(self, fullname, path=None):
+		return self if fullname in self.moduleFiles else None
+	#END DEF
+	
+	def load_module(self, fullname):
+		if fullname in sys.modules:
+			return sys.modules[fullname]
+		mod = imp.new_module(fullname)
+		mod.__file__ = self.moduleFiles[fullname]
+		mod.__loader__ = self
+		#Project scripts reference the other top-level resources without importing them first
+		self.loading.add(fullname)
+		mod.__dict__["system"] = sys.modules["system"]
+		for name in self.topLevelNames:
+			if name not in self.loading:
+				mod.__dict__[name] = sys.modules[name] if name in sys.modules else self.load_module(name)
+		sys.modules[fullname] = mod
+		try:
+			with open(self.moduleFiles[fullname]) as f:
+				source = f.read()
+			exec compile(source, self.moduleFiles[fullname], 'exec') in mod.__dict__
+		except:
+			sys.modules.pop(fullname, None)
+			raise
+		finally:
+			self.loading.discard(fullname)
+		if '.' in fullname:
+			parentName, childName = fullname.rsplit('.', 1)
+			setattr(sys.modules[parentName], childName, mod)
+		return mod
+	#END DEF
+#END CLASS
+
+def loadProject(projectDir):
+	'''
+	@FUNC	Registers every Script Package/Module under the project's Script Library and executes the modules.
+	@PARAM	projectDir : String, the root of the project (the folder holding `project.json`)
+	@RETURN	Dictionary mapping every full resource name to its Script Package/Module
+	'''
+	libraryDir = os.path.join(projectDir, SCRIPT_LIBRARY_DIR)
+	moduleFiles = {}
+	packageNames = []
+	for dirPath, dirNames, fileNames in os.walk(libraryDir):
+		dirNames.sort()
+		if dirPath == libraryDir:
+			continue
+		fullName = os.path.relpath(dirPath, libraryDir).replace(os.sep, '.')
+		if MODULE_FILE in fileNames:
+			moduleFiles[fullName] = os.path.join(dirPath, MODULE_FILE)
+		else:
+			packageNames.append(fullName)
+	#END FOR
+	topLevelNames = sorted([n for n in packageNames + moduleFiles.keys() if '.' not in n])
+	
+	for fullName in sorted(packageNames):
+		pkg = ScriptPackage(fullName)
+		sys.modules[fullName] = pkg
+		if '.' in fullName:
+			parentName, childName = fullName.rsplit('.', 1)
+			setattr(sys.modules[parentName], childName, pkg)
+	#END FOR
+	importer = ScriptLibraryImporter(moduleFiles, topLevelNames)
+	sys.meta_path.insert(0, importer)
+	for fullName in sorted(moduleFiles.keys()):
+		importer.load_module(fullName)
+	return dict((name, sys.modules[name]) for name in packageNames + moduleFiles.keys())
+#END DEF
\ No newline at end of file
@@ -0,0 +1,7 @@
+'''
+	Stand-in for the parts of Ignition's `system` scripting module used by the project scripts.
+'''
+from __future__ import absolute_import
+from system import util, project, date, tag, db
+
+__all__ = ['util', 'project', 'date', 'tag', 'db']
\ No newline at end of file
@@ -0,0 +1,72 @@
+'''
+	Stand-in for `system.date.format` and `system.date.parse`, supporting the Java `SimpleDateFormat`
+	letters used by the project ('yyyy', 'MM', 'dd', 'HH', 'mm', 'ss', 'XXX' and quoted literals).
+'''
+from __future__ import absolute_import
+import re
+import calendar
+import datetime
+import java.util
+
+_TOKEN_REGEX = re.compile(r"'[^']*'|yyyy|MM|dd|HH|mm|ss|XXX|.", re.DOTALL)
+_TOKEN_PATTERNS = {
+	'yyyy': r'(?P<year>\d{4})',
+	'MM': r'(?P<month>\d{2})',
+	'dd': r'(?P<day>\d{2})',
+	'HH': r'(?P<hour>\d{2})',
+	'mm': r'(?P<minute>\d{2})',
+	'ss': r'(?P<second>\d{2})',
+	'XXX': r'(?P<tz>Z|[+-]\d{2}:\d{2})',
+}
+_COMPILED = {}
+
+def _compile(fmt):
+	if fmt not in _COMPILED:
+		tokens = _TOKEN_REGEX.findall(fmt)
+		regex = ''
+		for tok in tokens:
+			if tok in _TOKEN_PATTERNS:
+				regex += _TOKEN_PATTERNS[tok]
+			elif tok.startswith("'"):
+				regex += re.escape(tok[1:-1])
+			else:
+				regex += re.escape(tok)
+		_COMPILED[fmt] = (tokens, re.compile('^' + regex + '$'))
+	return _COMPILED[fmt]
+#END DEF
+
+def parse(dateString, fmt="yyyy-MM-dd HH:mm:ss"):
+	tokens, regex = _compile(fmt)
+	mObj = regex.match(dateString)
+	if mObj is None:
+		raise ValueError("Unparseable date: {!r}".format(dateString))
+	g = mObj.groupdict()
+	dt = datetime.datetime(
+		int(g.get('year') or 1970), int(g.get('month') or 1), int(g.get('day') or 1),
+		int(g.get('hour') or 0), int(g.get('minute') or 0), int(g.get('second') or 0)
+	)
+	offsetMinutes = 0
+	if g.get('tz') not in (None, 'Z'):
+		sign = -1 if g['tz'][0] == '-' else 1
+		offsetMinutes = sign * (int(g['tz'][1:3]) * 60 + int(g['tz'][4:6]))
+	millis = (calendar.timegm(dt.timetuple()) - offsetMinutes * 60) * 1000
+	return java.util.Date(millis)
+#END DEF
+
+def format(date, fmt="yyyy-MM-dd HH:mm:ss"):
+	tokens, regex = _compile(fmt)
+	dt = date.toDatetime()
+	values = {
+		'yyyy': '%04d' % dt.year, 'MM': '%02d' % dt.month, 'dd': '%02d' % dt.day,
+		'HH': '%02d' % dt.hour, 'mm': '%02d' % dt.minute, 'ss': '%02d' % dt.second, 'XXX': 'Z',
+	}
+	out = ''
+	for tok in tokens:
+		if tok in values:
+			out += values[tok]
+		elif tok.startswith("'"):
+			out += tok[1:-1]
+		else:
+			out += tok
+	return out
+#END DEF
\ No newline at end of file
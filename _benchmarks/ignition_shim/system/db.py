@@ -0,0 +1,10 @@
+'''
+	Stand-in for `system.db`. Statements are recorded instead of executed.
+'''
+from __future__ import absolute_import
+EXECUTED = []
+
+def runPrepUpdate(query, args=None, database='', tx=None, getKey=False, skipAudit=True):
+	EXECUTED.append((query, list(args or []), database))
+	return 1
+#END DEF
\ No newline at end of file
@@ -0,0 +1,9 @@
+'''
+	Stand-in for `system.project`.
+'''
+from __future__ import absolute_import
+PROJECT_NAME = ['IgnitionSwagger']
+
+def getProjectName():
+	return PROJECT_NAME[0]
+#END DEF
\ No newline at end of file
@@ -0,0 +1,31 @@
+'''
+	Stand-in for `system.tag`. Only the gateway's System tags are provided.
+'''
+from __future__ import absolute_import
+import java.util
+
+TAGS = {
+	'[System]Gateway/SystemName': 'Ignition-Benchmark',
+}
+READ_COUNT = [0]
+
+class QualifiedValue(object):
+	def __init__(self, value, quality='Good'):
+		self.value = value
+		self.quality = quality
+		self.timestamp = java.util.Date()
+	#END DEF
+	
+	def getValue(self):
+		return self.value
+	#END DEF
+#END CLASS
+
+def read(tagPath):
+	READ_COUNT[0] += 1
+	return QualifiedValue(TAGS.get(tagPath, None), 'Good' if tagPath in TAGS else 'Bad_NotFound')
+#END DEF
+
+def readBlocking(tagPaths, timeout=45000):
+	return [read(tagPath) for tagPath in tagPaths]
+#END DEF
\ No newline at end of file
@@ -0,0 +1,116 @@
+'''
+	Stand-in for `system.util`: loggers with a configurable level, JSON helpers and the persistent globals.
+'''
+from __future__ import absolute_import
+import json
+import threading
+import java.util
+
+LEVELS = ['trace', 'debug', 'info', 'warn', 'error', 'fatal']
+#The level that newly-created and existing stand-in loggers log at. Use `setLogLevel` to change it.
+_STATE = {'level': 'info', 'sink': None}
+_GLOBALS = {}
+_GLOBALS_LOCK = threading.Lock()
+
+def setLogLevel(level, sink=None):
+	'''
+	@FUNC	Sets the level of every stand-in logger, and where their messages go (a callable taking
+			`(loggerName, level, message)`; messages are dropped when `None`).
+	'''
+	if level not in LEVELS:
+		raise ValueError("Unknown log level {!r}".format(level))
+	_STATE['level'] = level
+	_STATE['sink'] = sink
+#END DEF
+
+class ShimLogger(object):
+	def __init__(self, name):
+		self._name = name
+	#END DEF
+	
+	def getName(self):
+		return self._name
+	#END DEF
+	
+	def _enabled(self, level):
+		return LEVELS.index(level) >= LEVELS.index(_STATE['level'])
+	#END DEF
+	
+	def _log(self, level, message, throwable=None):
+		if self._enabled(level) and _STATE['sink'] is not None:
+			_STATE['sink'](self._name, level, message)
+	#END DEF
+	
+	def trace(self, message, throwable=None):
+		self._log('trace', message, throwable)
+	#END DEF
+	
+	def debug(self, message, throwable=None):
+		self._log('debug', message, throwable)
+	#END DEF
+	
+	def info(self, message, throwable=None):
+		self._log('info', message, throwable)
+	#END DEF
+	
+	def warn(self, message, throwable=None):
+		self._log('warn', message, throwable)
+	#END DEF
+	
+	def error(self, message, throwable=None):
+		self._log('error', message, throwable)
+	#END DEF
+	
+	def fatal(self, message, throwable=None):
+		self._log('fatal', message, throwable)
+	#END DEF
+	
+	def isTraceEnabled(self):
+		return self._enabled('trace')
+	#END DEF
+	
+	def isDebugEnabled(self):
+		return self._enabled('debug')
+	#END DEF
+	
+	def isInfoEnabled(self):
+		return self._enabled('info')
+	#END DEF
+	
+	def isWarnEnabled(self):
+		return self._enabled('warn')
+	#END DEF
+	
+	def isErrorEnabled(self):
+		return self._enabled('error')
+	#END DEF
+#END CLASS
+
+def getLogger(name):
+	return ShimLogger(name)
+#END DEF
+
+def _jsonDefault(obj):
+	if isinstance(obj, java.util.Date):
+		return obj.getTime()
+	if isinstance(obj, (set, frozenset)):
+		return list(obj)
+	return repr(obj)
+#END DEF
+
+def jsonEncode(obj, indentFactor=None):
+	return json.dumps(obj, default=_jsonDefault, indent=indentFactor)
+#END DEF
+
+def jsonDecode(jsonString):
+	return json.loads(jsonString)
+#END DEF
+
+def getGlobals():
+	with _GLOBALS_LOCK:
+		return _GLOBALS
+#END DEF
+
+def getSystemFlags():
+	return 0
+#END DEF
\ No newline at end of file
@@ -0,0 +1,286 @@
+'''
+	Fake WebDev `request`/`session` objects, including the Java servlet request and response they wrap.
+'''
+from __future__ import absolute_import
+import io
+import json
+import urllib
+import urlparse
+
+GATEWAY_WEBDEV_BASE = '/system/webdev'
+DEFAULT_PROJECT_NAME = 'IgnitionSwagger'
+
+class FakeReader(object):
+	'''A `java.io.BufferedReader` over the request body.'''
+	def __init__(self, text):
+		self._buf = io.StringIO(text)
+	#END DEF
+	
+	def readLine(self):
+		line = self._buf.readline()
+		if line == u'':
+			return None
+		return line.rstrip(u'\r\n')
+	#END DEF
+	
+	def read(self, cbuf=None, off=0, length=None):
+		if cbuf is None:
+			c = self._buf.read(1)
+			return -1 if c == u'' else ord(c)
+		chunk = self._buf.read(length if length is not None else len(cbuf) - off)
+		if not chunk:
+			return -1
+		for i, c in enumerate(chunk):
+			cbuf[off + i] = c
+		return len(chunk)
+	#END DEF
+#END CLASS
+
+class FakeInputStream(object):
+	'''A `javax.servlet.ServletInputStream` over the request body.'''
+	def __init__(self, data):
+		self._buf = io.BytesIO(data)
+	#END DEF
+	
+	def read(self, buf=None, off=0, length=None):
+		if buf is None:
+			c = self._buf.read(1)
+			return -1 if c == b'' else ord(c)
+		chunk = self._buf.read(length if length is not None else len(buf) - off)
+		if not chunk:
+			return -1
+		buf[off:off + len(chunk)] = bytearray(chunk)
+		return len(chunk)
+	#END DEF
+#END CLASS
+
+class FakeServletRequest(object):
+	def __init__(self, method, uri, queryString, headers, body, characterEncoding='UTF-8'):
+		self._method = method
+		self._uri = uri
+		self._queryString = queryString
+		self._headers = dict((k.lower(), v) for k, v in headers.items())
+		self._body = body if body is not None else b''
+		self._characterEncoding = characterEncoding
+	#END DEF
+	
+	def getMethod(self):
+		return self._method
+	#END DEF
+	
+	def getRequestURI(self):
+		return self._uri
+	#END DEF
+	
+	def getQueryString(self):
+		return self._queryString
+	#END DEF
+	
+	def getHeader(self, name):
+		return self._headers.get(name.lower(), None)
+	#END DEF
+	
+	def getContentType(self):
+		return self.getHeader('content-type')
+	#END DEF
+	
+	def getContentLength(self):
+		return len(self._body) if self._body else -1
+	#END DEF
+	
+	def getContentLengthLong(self):
+		return self.getContentLength()
+	#END DEF
+	
+	def getCharacterEncoding(self):
+		return self._characterEncoding
+	#END DEF
+	
+	def getReader(self):
+		return FakeReader(self._body.decode(self._characterEncoding))
+	#END DEF
+	
+	def getInputStream(self):
+		return FakeInputStream(self._body)
+	#END DEF
+#END CLASS
+
+class FakeWriter(object):
+	def __init__(self, response):
+		self._response = response
+	#END DEF
+	
+	def write(self, s, off=None, length=None):
+		if off is not None:
+			s = s[off:off + length]
+		self._response.body.write(s.encode('utf-8') if isinstance(s, unicode) else s)
+	#END DEF
+	
+	def flush(self):
+		pass
+	#END DEF
+	
+	def close(self):
+		pass
+	#END DEF
+#END CLASS
+
+class FakeOutputStream(object):
+	def __init__(self, response):
+		self._response = response
+	#END DEF
+	
+	def write(self, data, off=None, length=None):
+		data = bytes(bytearray(data))
+		if off is not None:
+			data = data[off:off + length]
+		self._response.body.write(data)
+	#END DEF
+	
+	def flush(self):
+		pass
+	#END DEF
+	
+	def close(self):
+		pass
+	#END DEF
+#END CLASS
+
+class FakeServletResponse(object):
+	def __init__(self):
+		self.status = 200
+		self.headers = {}
+		self.contentType = None
+		self.contentLength = None
+		self.body = io.BytesIO()
+	#END DEF
+	
+	def setStatus(self, code):
+		self.status = int(code)
+	#END DEF
+	
+	def getStatus(self):
+		return self.status
+	#END DEF
+	
+	def setHeader(self, name, value):
+		self.headers[name.lower()] = value
+	#END DEF
+	
+	def addHeader(self, name, value):
+		self.headers[name.lower()] = value
+	#END DEF
+	
+	def getHeader(self, name):
+		return self.headers.get(name.lower(), None)
+	#END DEF
+	
+	def containsHeader(self, name):
+		return name.lower() in self.headers
+	#END DEF
+	
+	def getHeaderNames(self):
+		return list(self.headers.keys())
+	#END DEF
+	
+	def setContentType(self, contentType):
+		self.contentType = contentType
+	#END DEF
+	
+	def getContentType(self):
+		return self.contentType
+	#END DEF
+	
+	def setContentLength(self, length):
+		self.contentLength = int(length)
+	#END DEF
+	
+	def setContentLengthLong(self, length):
+		self.contentLength = int(length)
+	#END DEF
+	
+	def setCharacterEncoding(self, charset):
+		pass
+	#END DEF
+	
+	def getWriter(self):
+		return FakeWriter(self)
+	#END DEF
+	
+	def getOutputStream(self):
+		return FakeOutputStream(self)
+	#END DEF
+#END CLASS
+
+def makeRequest(method, path, query=None, headers=None, body=None, projectName=DEFAULT_PROJECT_NAME,
+				remoteAddr='127.0.0.1', preparseBody=False):
+	'''
+	@FUNC	Builds the WebDev `request` and `session` Python Dictionaries for a call to the given path.
+	@PARAM	method : String, the HTTP Method
+	@PARAM	path : String, the path after the project (eg. '/v1/petstore/pet/5')
+	@PARAM	query : Dictionary/String/None, the URL query parameters
+	@PARAM	headers : Dictionary/None
+	@PARAM	body : String/Python Object/None. Non-string objects are JSON encoded.
+	@PARAM	projectName : String, the name of the project the WebDev resource belongs to
+	@PARAM	preparseBody : Boolean, whether the WebDev Module already decoded a JSON body into `request['data']`
+	@RETURN	Tuple, (request, session)
+	'''
+	headers = dict(headers or {})
+	if isinstance(query, dict):
+		queryString = urllib.urlencode(query)
+	else:
+		queryString = query or ''
+	params = dict(urlparse.parse_qsl(queryString, keep_blank_values=True))
+	rawBody = body
+	if body is not None and not isinstance(body, basestring):
+		rawBody = json.dumps(body)
+		headers.setdefault('Content-Type', 'application/json')
+	if isinstance(rawBody, unicode):
+		rawBody = rawBody.encode('utf-8')
+	uri = '{!s}/{!s}{!s}'.format(GATEWAY_WEBDEV_BASE, projectName, path)
+	resourceName = path.lstrip('/').split('/')[0].split('.')[0]
+	remainingPath = path[len('/' + resourceName):]
+	
+	data = None
+	contentType = headers.get('Content-Type', headers.get('content-type', '')) or ''
+	if rawBody is not None and contentType.startswith('application/json') and preparseBody:
+		data = json.loads(rawBody)
+	elif rawBody is not None and contentType.startswith('text/plain'):
+		data = rawBody
+	elif contentType.startswith('application/x-www-form-urlencoded') and rawBody:
+		data = dict(urlparse.parse_qsl(rawBody, keep_blank_values=True))
+	
+	request = {
+		'servletRequest': FakeServletRequest(method, uri, queryString, headers, rawBody),
+		'servletResponse': FakeServletResponse(),
+		'remainingPath': remainingPath,
+		'headers': headers,
+		'params': params,
+		'data': data,
+		'remoteAddr': remoteAddr,
+		'remoteHost': remoteAddr,
+		'context': None,
+	}
+	session = {'id': 'benchmark-session'}
+	return request, session
+#END DEF
+
+def responseBody(request, webdevResponse):
+	'''
+	@FUNC	Produces the bytes that the WebDev Module would have written for the given resource's return value.
+	@RETURN	String of bytes
+	'''
+	written = request['servletResponse'].body.getvalue()
+	if webdevResponse is None:
+		return written
+	if 'json' in webdevResponse:
+		import system
+		return system.util.jsonEncode(webdevResponse['json'])
+	for key in ('html', 'response'):
+		if key in webdevResponse:
+			value = webdevResponse[key]
+			return value.encode('utf-8') if isinstance(value, unicode) else str(value)
+	if 'bytes' in webdevResponse:
+		return bytes(bytearray(webdevResponse['bytes']))
+	return written
+#END DEF
\ No newline at end of file
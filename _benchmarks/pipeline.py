@@ -0,0 +1,122 @@
+'''
+	Benchmarks the whole request pipeline: sends the request of every scenario (see `scenarios.SCENARIOS`) through
+	`__swagger2__.requests.processRequest` many times, and reports the throughput, the latency, and the time spent
+	in each stage of handling the request (see `__swagger2__.metrics.STAGES`).
+
+	Usage:
+		python _benchmarks/pipeline.py [--iterations 200] [--warmup 20] [--scenario NAME ...] [--log-level info]
+			[--project DIR] [--json FILE]
+'''
+import sys
+import argparse
+from collections import OrderedDict
+
+import harness
+import scenarios
+
+
+
+def runScenario(scenario, iterations, warmup, recorder):
+	'''
+	@FUNC	Sends the request of a scenario over and over, timing each one
+	@PARAM	scenario : Dictionary, see `scenarios.SCENARIOS`
+	@PARAM	iterations : Integer, the number of requests timed
+	@PARAM	warmup : Integer, the number of requests sent (and not timed) first
+	@PARAM	recorder : harness.StageRecorder object, installed
+	@RETURN	OrderedDict, the results of the scenario
+	'''
+	for i in range(warmup):
+		harness.sendRequest(scenario)
+	#END FOR
+	recorder.clear()
+	latencies = []
+	unexpected = 0
+	started = harness.clock()
+	for i in range(iterations):
+		start = harness.clock()
+		request, response = harness.sendRequest(scenario)
+		latencies.append((harness.clock() - start) * 1000.0)
+		if not harness.isExpectedResponse(scenario, request, response):
+			unexpected += 1
+	#END FOR
+	elapsed = harness.clock() - started
+	return OrderedDict([
+		('name', scenario['name']),
+		('method', scenario['method']),
+		('path', scenario['path']),
+		('iterations', iterations),
+		('unexpected-status', unexpected),
+		('requests-per-second', round(iterations / elapsed, 2) if elapsed else None),
+		('latency-ms', harness.summarize(latencies)),
+		('stages-ms', OrderedDict([
+			(stage, harness.summarize(times)) for stage, times in recorder.stageTimes().items()
+		])),
+	])
+#END DEF
+
+def printResults(results):
+	'''
+	@FUNC	Prints the results as two tables: the latency of each scenario, and the mean time of each stage
+	@PARAM	results : OrderedDict, see `main`
+	'''
+	rows = []
+	for result in results['scenarios']:
+		latency = result['latency-ms']
+		rows.append([
+			result['name'], result['requests-per-second'], latency.get('mean'), latency.get('p50'),
+			latency.get('p95'), latency.get('p99'), result['unexpected-status'],
+		])
+	#END FOR
+	print harness.formatTable(['scenario', 'req/s', 'mean ms', 'p50 ms', 'p95 ms', 'p99 ms', 'bad status'], rows)
+	print
+	stages = []
+	for result in results['scenarios']:
+		for stage in result['stages-ms']:
+			if stage not in stages:
+				stages.append(stage)
+		#END FOR
+	#END FOR
+	rows = [
+		[result['name']] + [result['stages-ms'].get(stage, {}).get('mean') for stage in stages]
+		for result in results['scenarios']
+	]
+	print "Mean time (ms) of each stage:"
+	print harness.formatTable(['scenario'] + stages, rows)
+#END DEF
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="Benchmarks the request pipeline of the project, without a gateway.")
+	parser.add_argument('--project', default=None, help="the folder holding project.json [DEFAULT: this project]")
+	parser.add_argument('--iterations', type=int, default=200, help="timed requests per scenario [DEFAULT: 200]")
+	parser.add_argument('--warmup', type=int, default=20, help="untimed requests sent first [DEFAULT: 20]")
+	parser.add_argument('--scenario', action='append', default=None, help="only run this scenario (repeatable)")
+	parser.add_argument('--log-level', default='info', help="level of every logger [DEFAULT: info]")
+	parser.add_argument('--json', default=None, help="also write the results as JSON to this file ('-' for stdout)")
+	args = parser.parse_args(argv)
+
+	modules = harness.loadProject(args.project, args.log_level)
+	missing = scenarios.findMissingScenarios(modules)
+	if missing:
+		sys.stderr.write("No scenario for: {!s}\n".format(', '.join('{!s} {!s}'.format(m, r) for r, m in missing)))
+	selected = [scenarios.getScenario(name) for name in args.scenario] if args.scenario else scenarios.SCENARIOS
+
+	recorder = harness.StageRecorder().install()
+	try:
+		results = OrderedDict([
+			('benchmark', 'pipeline'),
+			('environment', harness.environmentInfo(
+				iterations=args.iterations, warmup=args.warmup, logLevel=args.log_level
+			)),
+			('scenarios', [runScenario(scenario, args.iterations, args.warmup, recorder) for scenario in selected]),
+		])
+	finally:
+		recorder.uninstall()
+	if args.json != '-':
+		printResults(results)
+	if args.json:
+		harness.writeJson(results, args.json)
+	return 1 if any(result['unexpected-status'] for result in results['scenarios']) else 0
+#END DEF
+
+if __name__ == '__main__':
+	sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,164 @@
+'''
+	Reads the Postman exports in `_postman_exports` (a v2.1 collection and an environment), and turns every request
+	in the collection into a scenario (see `scenarios.SCENARIOS`) that can be sent to a gateway over HTTP, or through
+	`processRequest` with the `ignition_shim` stand-ins.
+'''
+import os
+import re
+import json
+import urllib
+import urlparse
+import fnmatch
+
+import harness
+from ignition_shim import webdev
+
+POSTMAN_EXPORTS_DIR = os.path.join(harness.DEFAULT_PROJECT_DIR, '_postman_exports')
+DEFAULT_COLLECTION = os.path.join(POSTMAN_EXPORTS_DIR, 'IgnitionSwagger.postman_collection.json')
+DEFAULT_ENVIRONMENT = os.path.join(POSTMAN_EXPORTS_DIR, 'IgnitionSwagger Local.postman_environment.json')
+
+VARIABLE_REGEX = re.compile(r'\{\{([^{}]+)\}\}')
+#The requests that are expected to fail have the expected status in their name, eg. "pet (fail 405)"
+EXPECTED_STATUS_REGEX = re.compile(r'\(fail (\d{3})\)')
+#The Content-Type Postman sends for each 'raw' body language
+RAW_LANGUAGE_CONTENT_TYPES = {
+	'json': 'application/json',
+	'text': 'text/plain',
+	'javascript': 'application/javascript',
+	'html': 'text/html',
+	'xml': 'application/xml',
+}
+
+
+
+def loadEnvironment(path=DEFAULT_ENVIRONMENT, overrides=None):
+	'''
+	@FUNC	Reads the enabled variables of a Postman environment export
+	@PARAM	path : String/None, the environment file. No variables are read when None.
+	@PARAM	overrides : Dictionary/None, variables that replace (or add to) the ones in the file
+	@RETURN	Dictionary, mapping each variable name to its value
+	'''
+	variables = {}
+	if path:
+		with open(path) as f:
+			environment = json.load(f)
+		for value in environment.get('values', []):
+			if value.get('enabled', True):
+				variables[value['key']] = value.get('value', '')
+		#END FOR
+	variables.update(overrides or {})
+	return variables
+#END DEF
+
+def substitute(text, variables):
+	'''
+	@FUNC	Replaces the `{{NAME}}` variables in the text. Unknown variables are left as they are.
+	@PARAM	text : String
+	@PARAM	variables : Dictionary
+	@RETURN	String
+	'''
+	return VARIABLE_REGEX.sub(lambda match: variables.get(match.group(1), match.group(0)), text)
+#END DEF
+
+def _iterItems(items, folders):
+	for item in items:
+		if 'item' in item:
+			for found in _iterItems(item['item'], folders + [item['name']]):
+				yield found
+		else:
+			yield folders, item
+	#END FOR
+#END DEF
+
+def _buildBody(body, variables):
+	'''
+	@FUNC	Converts the body of a Postman request into the raw body and its Content-Type
+	@RETURN	Tuple, (String/None, String/None)
+	'''
+	if not body:
+		return None, None
+	mode = body.get('mode', None)
+	if mode == 'raw':
+		language = body.get('options', {}).get('raw', {}).get('language', 'text')
+		return substitute(body.get('raw', ''), variables), RAW_LANGUAGE_CONTENT_TYPES.get(language, 'text/plain')
+	if mode == 'urlencoded':
+		fields = [
+			(substitute(field['key'], variables), substitute(field.get('value', ''), variables))
+			for field in body.get('urlencoded', []) if not field.get('disabled', False)
+		]
+		return urllib.urlencode(fields), 'application/x-www-form-urlencoded'
+	if mode == 'formdata':
+		#Files are not sent; the request goes out with an empty multipart body
+		return '', 'multipart/form-data'
+	return None, None
+#END DEF
+
+def loadCollection(path=DEFAULT_COLLECTION, variables=None):
+	'''
+	@FUNC	Turns every request in a Postman collection export into a scenario
+	@PARAM	path : String, the collection file
+	@PARAM	variables : Dictionary/None, see `loadEnvironment`
+	@RETURN	List of Dictionaries, with the keys of `scenarios.SCENARIOS` (except 'route'), plus 'url' (the full URL,
+				with the variables replaced) and 'projectName'. 'status' is None unless the name of the request
+				says what it is expected to fail with.
+	'''
+	variables = variables or {}
+	with open(path) as f:
+		collection = json.load(f)
+	scenarios = []
+	nameCounts = {}
+	for folders, item in _iterItems(collection.get('item', []), []):
+		request = item['request']
+		url = request['url']['raw'] if isinstance(request['url'], dict) else request['url']
+		url = substitute(url, variables)
+		parsedUrl = urlparse.urlsplit(url)
+		#Turning the path of the gateway URL back into the path the WebDev resource sees
+		projectName, path = None, parsedUrl.path
+		if path.startswith(webdev.GATEWAY_WEBDEV_BASE + '/'):
+			projectName, path = path[len(webdev.GATEWAY_WEBDEV_BASE) + 1:].split('/', 1)
+			path = '/' + path
+		headers = {}
+		for header in request.get('header', []):
+			if not header.get('disabled', False):
+				headers[substitute(header['key'], variables)] = substitute(header.get('value', ''), variables)
+		#END FOR
+		body, contentType = _buildBody(request.get('body', None), variables)
+		if contentType is not None and not any(key.lower() == 'content-type' for key in headers):
+			headers['Content-Type'] = contentType
+		name = '{!s} {!s}'.format(request['method'], '/'.join(folders + [item['name']]))
+		nameCounts[name] = nameCounts.get(name, 0) + 1
+		if nameCounts[name] > 1:
+			name = '{!s} #{!s}'.format(name, nameCounts[name])
+		expected = EXPECTED_STATUS_REGEX.search(item['name'])
+		scenarios.append({
+			'name': name,
+			'method': request['method'],
+			'url': url,
+			'projectName': projectName,
+			'path': path,
+			'query': parsedUrl.query,
+			'headers': headers,
+			'body': body,
+			'status': int(expected.group(1)) if expected else None,
+			'weight': 1,
+		})
+	#END FOR
+	return scenarios
+#END DEF
+
+def applyWeights(scenarios, weights):
+	'''
+	@FUNC	Sets the weights of the scenarios whose names match the given patterns
+	@PARAM	scenarios : List of Dictionaries, see `loadCollection`
+	@PARAM	weights : List of Tuples, (pattern, weight). The patterns use shell-style wildcards (see `fnmatch`), and
+				the last pattern to match a name wins. A weight of 0 leaves the scenario out of the mix.
+	@RETURN	List of Dictionaries, the scenarios
+	'''
+	for scenario in scenarios:
+		for pattern, weight in weights:
+			if fnmatch.fnmatchcase(scenario['name'], pattern):
+				scenario['weight'] = weight
+		#END FOR
+	#END FOR
+	return scenarios
+#END DEF
\ No newline at end of file
@@ -0,0 +1,304 @@
+'''
+	A load generator that replays the requests of the Postman collection (see `postman.py`) as a weighted mix, from
+	several worker threads at a target rate, for a set duration. The requests are either sent over HTTP to a gateway,
+	or through `processRequest` in this process (with the `ignition_shim` stand-ins). Reports the latency percentiles,
+	error rates and throughput, overall and for every request in the collection.
+	
+	Usage:
+		python _benchmarks/replay.py [--target in-process|http] [--workers 4] [--rps 0] [--duration 10]
+			[--weight PATTERN=N ...] [--set VARIABLE=VALUE ...] [--collection FILE] [--environment FILE] [--json FILE]
+'''
+import sys
+import time
+import random
+import argparse
+import threading
+import urllib2
+from collections import OrderedDict
+
+import harness
+import postman
+
+TARGETS = ['in-process', 'http']
+
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# SENDING REQUESTS
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+def sendInProcess(scenario, timeout=None):
+	'''
+	@FUNC	Sends the request of a scenario through `processRequest`
+	@RETURN	Integer, the HTTP Status of the response
+	'''
+	request, response = harness.sendRequest(scenario)
+	return request['servletResponse'].getStatus()
+#END DEF
+
+def sendHttp(scenario, timeout=30):
+	'''
+	@FUNC	Sends the request of a scenario to its URL
+	@PARAM	timeout : Number, seconds to wait for the response
+	@RETURN	Integer, the HTTP Status of the response
+	@RAISES	urllib2.URLError (and the like), when no response was received
+	'''
+	body = scenario['body']
+	if isinstance(body, unicode):
+		body = body.encode('utf-8')
+	request = urllib2.Request(scenario['url'], data=body, headers=scenario['headers'])
+	request.get_method = lambda: scenario['method']
+	try:
+		response = urllib2.urlopen(request, timeout=timeout)
+	except urllib2.HTTPError, e:
+		#Any response (even a failure) is a response, so it is read like any other
+		response = e
+	try:
+		response.read()
+		return response.getcode()
+	finally:
+		response.close()
+#END DEF
+
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# PACING and RESULTS
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+class Pacer(object):
+	'''
+	@CLASS	Hands out the times the requests should be sent at, shared by every worker, so that together they send
+			`rps` requests per second. Without a rate, the requests are sent as quickly as the workers can send them.
+	@ATTR	rps : Number, the target requests per second. 0 for no limit.
+	@ATTR	endTime : Float, when (see `harness.clock`) no more requests are handed out
+	@ATTR	maxRequests : Integer/None, the most requests handed out
+	'''
+	def __init__(self, rps, duration, maxRequests=None):
+		self.rps = rps
+		self.startTime = harness.clock()
+		self.endTime = self.startTime + duration
+		self.maxRequests = maxRequests
+		self.__handedOut = 0
+		self.__lock = threading.Lock()
+	#END DEF
+	
+	def next(self):
+		'''
+		@FUNC	Gets the time the next request should be sent at
+		@RETURN	Float/None, None when the run is over
+		'''
+		with self.__lock:
+			if self.maxRequests is not None and self.__handedOut >= self.maxRequests:
+				return None
+			sendTime = self.startTime + (self.__handedOut / float(self.rps)) if self.rps else harness.clock()
+			if sendTime >= self.endTime:
+				return None
+			self.__handedOut += 1
+			return sendTime
+	#END DEF
+#END CLASS
+
+class ReplayResults(object):
+	'''
+	@CLASS	Collects the outcome of every request sent, for each scenario. Thread-safe.
+	'''
+	def __init__(self):
+		self.__scenarios = OrderedDict()
+		self.__lock = threading.Lock()
+	#END DEF
+	
+	def record(self, scenario, latency, status, error=None):
+		'''
+		@FUNC	Records the outcome of one request
+		@PARAM	scenario : Dictionary, see `postman.loadCollection`
+		@PARAM	latency : Float, in milliseconds
+		@PARAM	status : Integer/None, the HTTP Status. None when no response was received.
+		@PARAM	error : String/None, why no response was received
+		'''
+		with self.__lock:
+			results = self.__scenarios.get(scenario['name'], None)
+			if results is None:
+				results = {'latencies': [], 'statuses': {}, 'errors': 0, 'unexpected': 0, 'lastError': None}
+				self.__scenarios[scenario['name']] = results
+			results['latencies'].append(latency)
+			results['statuses'][status] = results['statuses'].get(status, 0) + 1
+			if status is None or status >= 500:
+				results['errors'] += 1
+				results['lastError'] = error
+			if scenario['status'] is not None and status != scenario['status']:
+				results['unexpected'] += 1
+	#END DEF
+	
+	def summarize(self, elapsed):
+		'''
+		@FUNC	Summarizes the results
+		@PARAM	elapsed : Float, the seconds the run took
+		@RETURN	OrderedDict, with the keys 'overall' and 'scenarios'
+		'''
+		with self.__lock:
+			allLatencies = []
+			totalErrors = 0
+			scenarios = []
+			for name, results in self.__scenarios.items():
+				count = len(results['latencies'])
+				allLatencies.extend(results['latencies'])
+				totalErrors += results['errors']
+				scenarios.append(OrderedDict([
+					('name', name),
+					('requests', count),
+					('requests-per-second', round(count / elapsed, 2) if elapsed else None),
+					('error-rate', round(results['errors'] / float(count), 4)),
+					('unexpected-status', results['unexpected']),
+					('statuses', OrderedDict([(str(status), n) for status, n in sorted(results['statuses'].items())])),
+					('last-error', results['lastError']),
+					('latency-ms', harness.summarize(results['latencies'])),
+				]))
+			#END FOR
+		return OrderedDict([
+			('overall', OrderedDict([
+				('requests', len(allLatencies)),
+				('seconds', round(elapsed, 3)),
+				('requests-per-second', round(len(allLatencies) / elapsed, 2) if elapsed else None),
+				('error-rate', round(totalErrors / float(len(allLatencies)), 4) if allLatencies else None),
+				('latency-ms', harness.summarize(allLatencies)),
+			])),
+			('scenarios', scenarios),
+		])
+	#END DEF
+#END CLASS
+
+def worker(number, mix, send, pacer, results, seed, timeout):
+	'''
+	@FUNC	Sends requests picked from the mix, at the times handed out by the pacer, until the run is over
+	@PARAM	number : Integer, the worker's number (used with the seed, so every worker picks differently)
+	@PARAM	mix : List of Dictionaries, the scenarios repeated by their weights
+	@PARAM	send : Function, `sendInProcess` or `sendHttp`
+	'''
+	picker = random.Random(seed + number)
+	while True:
+		sendTime = pacer.next()
+		if sendTime is None:
+			break
+		delay = sendTime - harness.clock()
+		if delay > 0:
+			time.sleep(delay)
+		scenario = picker.choice(mix)
+		start = harness.clock()
+		try:
+			status = send(scenario, timeout)
+			error = None
+		except Exception, e:
+			status = None
+			error = '{!s}: {!s}'.format(type(e).__name__, e)
+		results.record(scenario, (harness.clock() - start) * 1000.0, status, error)
+	#END WHILE
+#END DEF
+
+
+
+def printResults(summary):
+	'''
+	@FUNC	Prints the overall results, then a table of the results of each request
+	@PARAM	summary : OrderedDict, see `ReplayResults.summarize`
+	'''
+	overall = summary['overall']
+	print "{!s} requests in {!s} s ({!s} req/s), error rate {!s}, latency p50 {!s} ms, p95 {!s} ms, p99 {!s} ms".format(
+		overall['requests'], overall['seconds'], overall['requests-per-second'], overall['error-rate'],
+		overall['latency-ms'].get('p50'), overall['latency-ms'].get('p95'), overall['latency-ms'].get('p99')
+	)
+	print
+	rows = [
+		[
+			result['name'], result['requests'], result['requests-per-second'], result['error-rate'],
+			result['unexpected-status'], result['latency-ms'].get('p50'), result['latency-ms'].get('p95'),
+			result['latency-ms'].get('p99'),
+		]
+		for result in summary['scenarios']
+	]
+	print harness.formatTable(['request', 'count', 'req/s', 'errors', 'bad status', 'p50 ms', 'p95 ms', 'p99 ms'], rows)
+#END DEF
+
+def _parseAssignment(text, valueType=str):
+	'''
+	@FUNC	Parses a `NAME=VALUE` command line argument
+	@RETURN	Tuple, (String, the value converted to `valueType`)
+	'''
+	name, sep, value = text.rpartition('=')
+	if not sep:
+		raise argparse.ArgumentTypeError("expected NAME=VALUE, got {!r}".format(text))
+	return name, valueType(value)
+#END DEF
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="Replays the Postman collection as a load test.")
+	parser.add_argument('--target', choices=TARGETS, default='in-process',
+		help="send the requests through processRequest in this process, or over HTTP [DEFAULT: in-process]")
+	parser.add_argument('--workers', type=int, default=4, help="threads sending requests [DEFAULT: 4]")
+	parser.add_argument('--rps', type=float, default=0, help="target requests per second, 0 for no limit [DEFAULT: 0]")
+	parser.add_argument('--duration', type=float, default=10, help="seconds to send requests for [DEFAULT: 10]")
+	parser.add_argument('--requests', type=int, default=None, help="stop after this many requests")
+	parser.add_argument('--weight', action='append', default=[], type=lambda t: _parseAssignment(t, int),
+		metavar='PATTERN=N', help="weight of the requests whose names match the pattern (repeatable)")
+	parser.add_argument('--set', action='append', default=[], type=_parseAssignment, metavar='VARIABLE=VALUE',
+		help="set a Postman variable, eg. BASEURL=http://gateway (repeatable)")
+	parser.add_argument('--collection', default=postman.DEFAULT_COLLECTION, help="the Postman collection export")
+	parser.add_argument('--environment', default=postman.DEFAULT_ENVIRONMENT, help="the Postman environment export")
+	parser.add_argument('--timeout', type=float, default=30, help="seconds to wait for a response over HTTP")
+	parser.add_argument('--seed', type=int, default=0, help="seed of the request picker [DEFAULT: 0]")
+	parser.add_argument('--project', default=None, help="the folder holding project.json, when in-process")
+	parser.add_argument('--log-level', default='info', help="level of every logger, when in-process [DEFAULT: info]")
+	parser.add_argument('--list', action='store_true', help="list the requests (and their weights), then exit")
+	parser.add_argument('--json', default=None, help="also write the results as JSON to this file ('-' for stdout)")
+	args = parser.parse_args(argv)
+	
+	variables = postman.loadEnvironment(args.environment, dict(args.set))
+	scenarios = postman.applyWeights(postman.loadCollection(args.collection, variables), args.weight)
+	if args.list:
+		for scenario in scenarios:
+			print "{!s:>3}  {!s}".format(scenario['weight'], scenario['name'])
+		return 0
+	mix = [scenario for scenario in scenarios for i in range(scenario['weight'])]
+	if not mix:
+		sys.stderr.write("Every request has a weight of 0\n")
+		return 2
+	if args.target == 'in-process':
+		harness.loadProject(args.project, args.log_level)
+		send = sendInProcess
+	else:
+		send = sendHttp
+	
+	results = ReplayResults()
+	pacer = Pacer(args.rps, args.duration, args.requests)
+	workers = [
+		threading.Thread(
+			target=worker, name='replay-{!s}'.format(number),
+			args=(number, mix, send, pacer, results, args.seed, args.timeout)
+		)
+		for number in range(args.workers)
+	]
+	for thread in workers:
+		thread.daemon = True
+		thread.start()
+	#END FOR
+	for thread in workers:
+		#Joining with a timeout, so that Ctrl+C still stops the run
+		while thread.is_alive():
+			thread.join(0.5)
+		#END WHILE
+	#END FOR
+	summary = results.summarize(harness.clock() - pacer.startTime)
+	if args.json != '-':
+		printResults(summary)
+	if args.json:
+		harness.writeJson(OrderedDict([
+			('benchmark', 'replay'),
+			('environment', harness.environmentInfo(
+				target=args.target, workers=args.workers, rps=args.rps, duration=args.duration,
+				weights=OrderedDict((scenario['name'], scenario['weight']) for scenario in scenarios),
+			)),
+			('results', summary),
+		]), args.json)
+	return 0
+#END DEF
+
+if __name__ == '__main__':
+	sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,251 @@
+'''
+	The synthetic requests used by the benchmarks. There is (at least) one scenario for every HTTP Method of every
+	endpoint in the `v1` tree, and `findMissingScenarios` checks that it stays that way as endpoints are added.
+'''
+import json
+import inspect
+
+#The API Key accepted by `apiAuth.simple.allowWithApiKeyHeader`
+API_KEY_HEADERS = {'IS-API-Key': 'abcd1234'}
+JSON_HEADERS = {'Content-Type': 'application/json'}
+FORM_HEADERS = {'Content-Type': 'application/x-www-form-urlencoded'}
+
+PET = {
+	'id': 5,
+	'category': {'id': 1, 'name': 'Dogs'},
+	'name': 'doggie',
+	'photoUrls': ['https://example.com/doggie.png'],
+	'tags': [{'id': 1, 'name': 'tag1'}],
+	'status': 'available',
+}
+ORDER = {
+	'id': 5,
+	'petId': 5,
+	'quantity': 1,
+	'shipDate': '2021-06-01T12:00:00Z',
+	'status': 'placed',
+	'complete': False,
+}
+USER = {
+	'id': 1,
+	'username': 'user1',
+	'firstName': 'First',
+	'lastName': 'Last',
+	'email': 'user1@example.com',
+	'password': 'password',
+	'phone': '555-555-5555',
+	'userStatus': 1,
+}
+
+#Each scenario is a Dictionary with the keys:
+#	- name : String, unique, used to report the results
+#	- route : String, the full name of the endpoint's Script Package
+#	- method, path, query, headers, body : see `ignition_shim.webdev.makeRequest`
+#	- status : Integer, the HTTP Status the request is expected to get
+#	- success : Boolean, the 'success' the JSON response is expected to have. Left out when it does not matter.
+#	- weight : Integer, how often the scenario is picked relative to the others (see `weightedScenarios`)
+SCENARIOS = [
+	{'name': 'docs', 'route': 'v1.docs', 'method': 'GET', 'path': '/v1/docs.html', 'status': 200},
+	{'name': 'swagger', 'route': 'v1.swagger', 'method': 'GET', 'path': '/v1/swagger.json', 'status': 200},
+	{'name': 'metrics', 'route': 'v1.metrics', 'method': 'GET', 'path': '/v1/metrics', 'status': 200},
+	{'name': 'profiles', 'route': 'v1.profiles', 'method': 'GET', 'path': '/v1/profiles', 'status': 200},
+	{
+		'name': 'pet-add', 'route': 'v1.petstore.pet', 'method': 'POST', 'path': '/v1/petstore/pet',
+		'headers': JSON_HEADERS, 'body': PET, 'status': 200, 'weight': 5,
+	},
+	{
+		'name': 'pet-update', 'route': 'v1.petstore.pet', 'method': 'PUT', 'path': '/v1/petstore/pet',
+		'headers': JSON_HEADERS, 'body': dict(PET, id=12345), 'status': 200, 'weight': 3,
+	},
+	{
+		'name': 'pet-find-by-status', 'route': 'v1.petstore.pet.findByStatus', 'method': 'GET',
+		'path': '/v1/petstore/pet/findByStatus', 'query': 'status=available', 'status': 200, 'weight': 10,
+	},
+	{
+		'name': 'pet-find-by-tags', 'route': 'v1.petstore.pet.findByTags', 'method': 'GET',
+		'path': '/v1/petstore/pet/findByTags', 'query': 'tags=tag1,tag2', 'status': 200, 'weight': 5,
+	},
+	{
+		'name': 'pet-get', 'route': 'v1.petstore.pet.is-x-integer-petId', 'method': 'GET',
+		'path': '/v1/petstore/pet/12345', 'status': 200, 'weight': 20,
+	},
+	{
+		'name': 'pet-update-form', 'route': 'v1.petstore.pet.is-x-integer-petId', 'method': 'POST',
+		'path': '/v1/petstore/pet/1', 'headers': FORM_HEADERS,
+		'body': 'name=doggie&status=sold', 'status': 200, 'weight': 2,
+	},
+	{
+		'name': 'pet-delete', 'route': 'v1.petstore.pet.is-x-integer-petId', 'method': 'DELETE',
+		'path': '/v1/petstore/pet/12345', 'headers': dict(FORM_HEADERS, api_key='abcd1234'), 'status': 200,
+	},
+	#Multipart bodies are not parsed (yet), so the request fails. It is kept to time the failure path.
+	{
+		'name': 'pet-upload-image', 'route': 'v1.petstore.pet.is-x-integer-petId.uploadImage', 'method': 'POST',
+		'path': '/v1/petstore/pet/1/uploadImage', 'headers': {'Content-Type': 'multipart/form-data'},
+		'status': 500,
+	},
+	{
+		'name': 'store-inventory', 'route': 'v1.petstore.store.inventory', 'method': 'GET',
+		'path': '/v1/petstore/store/inventory', 'status': 200, 'weight': 5,
+	},
+	{
+		'name': 'store-order-place', 'route': 'v1.petstore.store.order', 'method': 'POST',
+		'path': '/v1/petstore/store/order', 'headers': JSON_HEADERS, 'body': ORDER, 'status': 200, 'weight': 3,
+	},
+	{
+		'name': 'store-order-get', 'route': 'v1.petstore.store.order.is-x-integer-orderId', 'method': 'GET',
+		'path': '/v1/petstore/store/order/5', 'status': 200, 'weight': 5,
+	},
+	{
+		'name': 'store-order-delete', 'route': 'v1.petstore.store.order.is-x-integer-orderId', 'method': 'DELETE',
+		'path': '/v1/petstore/store/order/5', 'headers': FORM_HEADERS, 'status': 200,
+	},
+	{
+		'name': 'user-create', 'route': 'v1.petstore.user', 'method': 'POST', 'path': '/v1/petstore/user',
+		'headers': JSON_HEADERS, 'body': USER, 'status': 200, 'weight': 2,
+	},
+	{
+		'name': 'user-create-with-array', 'route': 'v1.petstore.user.createWithArray', 'method': 'POST',
+		'path': '/v1/petstore/user/createWithArray', 'headers': JSON_HEADERS, 'body': [USER] * 10, 'status': 200,
+		'success': True,
+	},
+	#The body of 'createWithArray' is streamed. Whatever follows the array must still be read, and be whitespace.
+	{
+		'name': 'user-create-with-array-trailing-space', 'route': 'v1.petstore.user.createWithArray',
+		'method': 'POST', 'path': '/v1/petstore/user/createWithArray', 'headers': JSON_HEADERS,
+		'body': json.dumps([USER]) + ' \r\n', 'status': 200, 'success': True, 'weight': 0,
+	},
+	{
+		'name': 'user-create-with-array-trailing-data', 'route': 'v1.petstore.user.createWithArray',
+		'method': 'POST', 'path': '/v1/petstore/user/createWithArray', 'headers': JSON_HEADERS,
+		'body': json.dumps([USER]) + ' trailing garbage', 'status': 200, 'success': False, 'weight': 0,
+	},
+	{
+		'name': 'user-create-with-array-bad-item', 'route': 'v1.petstore.user.createWithArray',
+		'method': 'POST', 'path': '/v1/petstore/user/createWithArray', 'headers': JSON_HEADERS,
+		'body': '[' + json.dumps(USER) + ', {"id": 2,}]', 'status': 200, 'success': False, 'weight': 0,
+	},
+	{
+		'name': 'user-create-with-list', 'route': 'v1.petstore.user.createWithList', 'method': 'POST',
+		'path': '/v1/petstore/user/createWithList', 'headers': JSON_HEADERS, 'body': [USER] * 10, 'status': 200,
+	},
+	{
+		'name': 'user-get', 'route': 'v1.petstore.user.is-x-string-username', 'method': 'GET',
+		'path': '/v1/petstore/user/user1', 'status': 200, 'weight': 5,
+	},
+	{
+		'name': 'user-update', 'route': 'v1.petstore.user.is-x-string-username', 'method': 'PUT',
+		'path': '/v1/petstore/user/user1', 'headers': JSON_HEADERS, 'body': USER, 'status': 200, 'weight': 2,
+	},
+	{
+		'name': 'user-delete', 'route': 'v1.petstore.user.is-x-string-username', 'method': 'DELETE',
+		'path': '/v1/petstore/user/user1', 'headers': FORM_HEADERS, 'status': 200,
+	},
+	{
+		'name': 'user-login', 'route': 'v1.petstore.user.login', 'method': 'GET', 'path': '/v1/petstore/user/login',
+		'query': 'username=someone&password=mypassword', 'status': 200, 'weight': 5,
+	},
+	{
+		'name': 'user-logout', 'route': 'v1.petstore.user.logout', 'method': 'GET',
+		'path': '/v1/petstore/user/logout', 'status': 200, 'weight': 2,
+	},
+	{
+		'name': 'tests-auth-alwaysfail-get', 'route': 'v1.tests.auth-alwaysfail', 'method': 'GET',
+		'path': '/v1/tests/auth-alwaysfail', 'status': 200,
+	},
+	{
+		'name': 'tests-auth-alwaysfail-post', 'route': 'v1.tests.auth-alwaysfail', 'method': 'POST',
+		'path': '/v1/tests/auth-alwaysfail', 'headers': JSON_HEADERS, 'body': {}, 'status': 200,
+	},
+	{
+		'name': 'tests-auth-simple-get', 'route': 'v1.tests.auth-simple', 'method': 'GET',
+		'path': '/v1/tests/auth-simple', 'headers': API_KEY_HEADERS, 'status': 200,
+	},
+	{
+		'name': 'tests-auth-simple-post', 'route': 'v1.tests.auth-simple', 'method': 'POST',
+		'path': '/v1/tests/auth-simple', 'headers': dict(API_KEY_HEADERS, **JSON_HEADERS), 'body': {},
+		'status': 200,
+	},
+	{
+		'name': 'tests-validation-get', 'route': 'v1.tests.validation', 'method': 'GET',
+		'path': '/v1/tests/validation.json', 'query': 'arg1=5&arg2=helo&arg3=7,8,9,10', 'status': 200,
+	},
+	{
+		'name': 'tests-validation-post', 'route': 'v1.tests.validation', 'method': 'POST',
+		'path': '/v1/tests/validation', 'headers': JSON_HEADERS,
+		'body': {'arg_string': 'x', 'arg_boolean': True, 'arg_int': 42}, 'status': 200,
+	},
+	{
+		'name': 'tests-validation-path-get', 'route': 'v1.tests.validation.is-x-integer-paramName', 'method': 'GET',
+		'path': '/v1/tests/validation/4', 'status': 200,
+	},
+	{
+		'name': 'tests-validation-path-post', 'route': 'v1.tests.validation.is-x-integer-paramName',
+		'method': 'POST', 'path': '/v1/tests/validation/4', 'headers': JSON_HEADERS, 'body': {}, 'status': 200,
+	},
+	{
+		'name': 'tests-validation-paths-get',
+		'route': 'v1.tests.validation.is-x-integer-paramName.is-x-string-otherParam', 'method': 'GET',
+		'path': '/v1/tests/validation/4/asdf', 'status': 200,
+	},
+	{
+		'name': 'tests-validation-paths-post',
+		'route': 'v1.tests.validation.is-x-integer-paramName.is-x-string-otherParam', 'method': 'POST',
+		'path': '/v1/tests/validation/4/asdf', 'headers': JSON_HEADERS, 'body': {}, 'status': 200,
+	},
+	{
+		'name': 'tests-validation-plan', 'route': 'v1.tests.validation-plan', 'method': 'GET',
+		'path': '/v1/tests/validation-plan', 'status': 200,
+	},
+	{'name': 'not-found', 'route': None, 'method': 'GET', 'path': '/v1/nothing/here', 'status': 404},
+]
+
+
+
+def getScenario(name):
+	'''
+	@FUNC	Gets the scenario with the given name
+	@PARAM	name : String
+	@RETURN	Dictionary
+	@RAISES	KeyError, when there is no scenario with that name
+	'''
+	for scenario in SCENARIOS:
+		if scenario['name'] == name:
+			return scenario
+	#END FOR
+	raise KeyError("No scenario named {!r}".format(name))
+#END DEF
+
+def weightedScenarios(scenarios=None):
+	'''
+	@FUNC	Repeats each scenario by its weight, so that picking from the List at random gives the request mix
+	@PARAM	scenarios : List of Dictionaries/None, defaults to every scenario
+	@RETURN	List of Dictionaries
+	'''
+	weighted = []
+	for scenario in (scenarios if scenarios is not None else SCENARIOS):
+		weighted.extend([scenario] * scenario.get('weight', 1))
+	#END FOR
+	return weighted
+#END DEF
+
+def findMissingScenarios(modules, rootName='v1'):
+	'''
+	@FUNC	Finds the endpoints (and HTTP Methods) in the loaded project that have no scenario
+	@PARAM	modules : Dictionary, see `ignition_shim.loader.loadProject`
+	@PARAM	rootName : String, the root Script Package of the API
+	@RETURN	List of Tuples, (route, HTTP Method)
+	'''
+	covered = set((scenario['route'], scenario['method']) for scenario in SCENARIOS)
+	missing = []
+	for fullName in sorted(modules):
+		if not (fullName.startswith(rootName + '.') and fullName.endswith('.__logic__')):
+			continue
+		route = fullName[:-len('.__logic__')]
+		for name, obj in sorted(vars(modules[fullName]).items()):
+			if inspect.isclass(obj) and name.isupper() and hasattr(obj, 'SWAGGER') and (route, name) not in covered:
+				missing.append((route, name))
+		#END FOR
+	#END FOR
+	return missing
+#END DEF
\ No newline at end of file
@@ -0,0 +1,272 @@
+'''
+	Micro-benchmarks for the validation engine: times `__swagger2__.requests.validate`, a compiled `ValidationPlan`,
+	and `obscure` against payloads of different shapes and sizes, with every combination of `doTypeCasting` and
+	`isForResponse`. The results are written as JSON, so that runs can be compared over time.
+	
+	Usage:
+		python _benchmarks/validation.py [--json FILE] [--case NAME ...] [--function validate|plan|obscure ...]
+			[--max-size 100000] [--min-time 0.5] [--baseline FILE [--threshold 1.25]] [--project DIR]
+'''
+import sys
+import copy
+import json
+import argparse
+from collections import OrderedDict
+
+import harness
+from scenarios import PET, ORDER, USER
+
+#The functions that can be timed, see `timeCase`
+FUNCTIONS = ['validate', 'plan', 'obscure']
+#Every combination of (doTypeCasting, isForResponse)
+MODES = [(False, False), (True, False), (False, True), (True, True)]
+
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# CASES
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+def _body(properties, required=[]):
+	return [{'in': 'body', 'schema': {'type': 'object', 'properties': properties, 'required': required}}]
+#END DEF
+
+def _nested(depth):
+	'''
+	@FUNC	Builds the schema properties, and matching data, of an object nested `depth` levels deep
+	@RETURN	Tuple, (properties, data)
+	'''
+	properties = {'name': {'type': 'string'}, 'level': {'type': 'integer', 'minimum': 0}}
+	data = {'name': 'leaf', 'level': depth + 1}
+	for level in range(depth, 0, -1):
+		properties = {
+			'name': {'type': 'string'},
+			'level': {'type': 'integer', 'minimum': 0},
+			'child': {'type': 'object', 'properties': properties},
+		}
+		data = {'name': 'level-{!s}'.format(level), 'level': level, 'child': data}
+	#END FOR
+	return properties, data
+#END DEF
+
+def _arrayOf(items, values):
+	return _body({'values': {'type': 'array', 'items': items}}, ['values']), {'values': values}
+#END DEF
+
+def buildCases(obscureKey):
+	'''
+	@FUNC	Builds every benchmark case
+	@PARAM	obscureKey : String, the Swagger key that marks a property to be obscured (the custom prefix + 'obscure')
+	@RETURN	List of Dictionaries, with the keys 'name', 'size' (the number of values in the payload), 'parameters'
+				(the Swagger parameters the signature is built from), and 'data'
+	'''
+	cases = []
+	
+	def addCase(name, size, parameters, data):
+		cases.append({'name': name, 'size': size, 'parameters': parameters, 'data': data})
+	#END DEF
+	
+	addCase('flat-object', 10, _body({
+		'id': {'type': 'integer', 'minimum': 1},
+		'name': {'type': 'string', 'minLength': 1, 'maxLength': 64},
+		'email': {'type': 'string', 'pattern': r'^[^@\s]+@[^@\s]+$'},
+		'password': {'type': 'string', obscureKey: True},
+		'active': {'type': 'boolean'},
+		'score': {'type': 'number', 'format': 'float', 'minimum': 0, 'maximum': 100},
+		'count': {'type': 'integer', 'format': 'int64'},
+		'status': {'type': 'string', 'enum': ['available', 'pending', 'sold']},
+		'born': {'type': 'string', 'format': 'date'},
+		'tags': {'type': 'array', 'items': {'type': 'string'}},
+	}, ['id', 'name']), {
+		'id': 5, 'name': 'doggie', 'email': 'doggie@example.com', 'password': 'secret', 'active': True,
+		'score': 42.5, 'count': 1000, 'status': 'available', 'born': '2019-01-01', 'tags': ['a', 'b'],
+	})
+	for depth in (5, 25):
+		properties, data = _nested(depth)
+		addCase('nested-object-{!s}'.format(depth), depth * 2, _body(properties), data)
+	#END FOR
+	for size in (10, 1000, 100000):
+		parameters, data = _arrayOf({'type': 'integer', 'minimum': 0}, range(1, size + 1))
+		addCase('array-integer-{!s}'.format(size), size, parameters, data)
+	#END FOR
+	#The 'datetime' format needs a space before the time zone
+	order = dict(ORDER, shipDate='2021-06-01T12:00:00 Z')
+	for name, item in (('pet', PET), ('order', order), ('user', USER)):
+		parameters, data = _arrayOf(
+			{'$ref': '#/definitions/{!s}'.format(name.capitalize())}, [copy.deepcopy(item) for i in range(100)]
+		)
+		addCase('array-{!s}-100'.format(name), 100, parameters, data)
+	#END FOR
+	parameters, data = _arrayOf(
+		{'type': 'string', 'format': 'date'}, ['2019-01-{:02d}'.format(i % 28 + 1) for i in range(1000)]
+	)
+	addCase('array-date-1000', 1000, parameters, data)
+	parameters, data = _arrayOf(
+		{'type': 'string', 'pattern': r'^[A-Z]{3}-\d{4}$'}, ['ABC-{:04d}'.format(i) for i in range(1000)]
+	)
+	addCase('array-pattern-1000', 1000, parameters, data)
+	return cases
+#END DEF
+
+class BenchmarkDefinitions(object):
+	'''
+	@CLASS	Stands in for the project's "Swagger Definitions" module when building the signatures. The `Order`
+			definition uses the format 'date-time', which the validation engine does not accept ('datetime' is its
+			name for it), so the definitions are copied with that format renamed.
+	'''
+	def __init__(self, swagDf):
+		self.DEFINITIONS = self.__renameFormat(copy.deepcopy(swagDf.DEFINITIONS))
+		self.PARAMETERS = copy.deepcopy(getattr(swagDf, 'PARAMETERS', {}))
+	#END DEF
+	
+	def __renameFormat(self, obj):
+		if isinstance(obj, dict):
+			if obj.get('format', None) == 'date-time':
+				obj['format'] = 'datetime'
+			for value in obj.values():
+				self.__renameFormat(value)
+			#END FOR
+		elif isinstance(obj, list):
+			for value in obj:
+				self.__renameFormat(value)
+			#END FOR
+		return obj
+	#END DEF
+#END CLASS
+
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# TIMING
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+def timeCase(case, function, doTypeCasting, isForResponse, minTime, minRuns=3, maxRuns=1000):
+	'''
+	@FUNC	Times one function against one case, running it until at least `minTime` seconds (and `minRuns` runs)
+			have been timed. Every run gets its own copy of the data (made outside of the timing), since validation
+			changes the data it is given.
+	@PARAM	case : Dictionary, see `buildCases`, with the keys 'signature', 'plan' and 'redaction' added
+	@PARAM	function : String, see `FUNCTIONS`
+	@RETURN	OrderedDict, the results
+	'''
+	import __swagger2__
+	requests = __swagger2__.requests
+	signature = case['signature']
+	plan = case['plan']
+	times = []
+	valid = None
+	while len(times) < maxRuns and (len(times) < minRuns or sum(times) < minTime):
+		data = copy.deepcopy(case['data'])
+		start = harness.clock()
+		if function == 'validate':
+			result = requests.validate(data, signature, doTypeCasting=doTypeCasting, isForResponse=isForResponse)
+		elif function == 'plan':
+			result = plan.validate(data, doTypeCasting=doTypeCasting, isForResponse=isForResponse)
+		else:
+			result = requests.obscure(data, case['redaction'])
+		times.append(harness.clock() - start)
+		if function != 'obscure':
+			valid = result.ALL_VALID
+		#Freeing the result (which can share the data) outside of the timing
+		result = None
+	#END WHILE
+	return OrderedDict([
+		('case', case['name']),
+		('size', case['size']),
+		('function', function),
+		('doTypeCasting', doTypeCasting),
+		('isForResponse', isForResponse),
+		('valid', valid),
+		('runs', len(times)),
+		('ms', harness.summarize([t * 1000.0 for t in times])),
+	])
+#END DEF
+
+def _resultKey(result):
+	return (result['case'], result['function'], result['doTypeCasting'], result['isForResponse'])
+#END DEF
+
+def findRegressions(baseline, results, threshold):
+	'''
+	@FUNC	Compares the results with the results of an earlier run
+	@PARAM	baseline : Dictionary, the JSON written by an earlier run
+	@PARAM	results : List of OrderedDicts, see `timeCase`
+	@PARAM	threshold : Float, how many times slower (by the median) a result must be to count as a regression
+	@RETURN	List of Strings, a description of every regression
+	'''
+	baselineMedians = dict((_resultKey(result), result['ms'].get('p50')) for result in baseline.get('results', []))
+	regressions = []
+	for result in results:
+		before = baselineMedians.get(_resultKey(result), None)
+		after = result['ms'].get('p50')
+		if before and after and after / before > threshold:
+			regressions.append("{!s} {!s} (tc={!r}, fr={!r}): median {!s} ms -> {!s} ms ({:.2f}x)".format(
+				result['case'], result['function'], result['doTypeCasting'], result['isForResponse'],
+				before, after, after / before
+			))
+	#END FOR
+	return regressions
+#END DEF
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="Benchmarks validate(), compiled validation plans, and obscure().")
+	parser.add_argument('--project', default=None, help="the folder holding project.json [DEFAULT: this project]")
+	parser.add_argument('--case', action='append', default=None, help="only run this case (repeatable)")
+	parser.add_argument('--function', action='append', default=None, choices=FUNCTIONS,
+		help="only time this function (repeatable)")
+	parser.add_argument('--max-size', type=int, default=None, help="skip the cases with more values than this")
+	parser.add_argument('--min-time', type=float, default=0.5, help="seconds timed for each result [DEFAULT: 0.5]")
+	parser.add_argument('--log-level', default='info', help="level of every logger [DEFAULT: info]")
+	parser.add_argument('--json', default='-', help="the file to write the results to [DEFAULT: stdout]")
+	parser.add_argument('--baseline', default=None, help="the JSON of an earlier run, to compare the results with")
+	parser.add_argument('--threshold', type=float, default=1.25,
+		help="how many times slower a result can get before it counts as a regression [DEFAULT: 1.25]")
+	args = parser.parse_args(argv)
+	
+	harness.loadProject(args.project, args.log_level)
+	import __swagger2__
+	import v1
+	swagStc = v1.statics
+	swagDf = BenchmarkDefinitions(v1.definitions)
+	cases = buildCases(swagStc.IGNITION_SWAGGER_CUSTOM_PREFIX + 'obscure')
+	if args.case:
+		cases = [case for case in cases if case['name'] in args.case]
+	if args.max_size is not None:
+		cases = [case for case in cases if case['size'] <= args.max_size]
+	functions = args.function or FUNCTIONS
+	
+	results = []
+	for case in cases:
+		case['signature'] = __swagger2__.requests.getDataSignatureFromSwagger(
+			{'parameters': copy.deepcopy(case['parameters'])}, 'incoming', 'body', swagStc, swagDf
+		)
+		case['plan'] = __swagger2__.requests.compileSignature(case['signature'])
+		case['redaction'] = __swagger2__.requests.compileRedaction(case['signature'])
+		for function in functions:
+			#`obscure` has no modes, so it is only timed once
+			for doTypeCasting, isForResponse in (MODES if function != 'obscure' else MODES[:1]):
+				result = timeCase(case, function, doTypeCasting, isForResponse, args.min_time)
+				results.append(result)
+				if args.json != '-':
+					print "{!s:<22} {!s:<9} tc={!s:<5} fr={!s:<5} mean {!s:>10} ms  p95 {!s:>10} ms".format(
+						result['case'], function, doTypeCasting, isForResponse,
+						result['ms']['mean'], result['ms']['p95']
+					)
+			#END FOR
+		#END FOR
+	#END FOR
+	harness.writeJson(OrderedDict([
+		('benchmark', 'validation'),
+		('environment', harness.environmentInfo(minTime=args.min_time, logLevel=args.log_level)),
+		('results', results),
+	]), args.json)
+	if args.baseline:
+		with open(args.baseline) as f:
+			regressions = findRegressions(json.load(f), results, args.threshold)
+		for regression in regressions:
+			sys.stderr.write("REGRESSION: {!s}\n".format(regression))
+		#END FOR
+		return 1 if regressions else 0
+	return 0
+#END DEF
+
+if __name__ == '__main__':
+	sys.exit(main())
\ No newline at end of file
@@ -122,6 +122,9 @@ When creating a WebDev Resource, you will notice that only the following HTTP Me
 Your Endpoints can support any and every HTTP Method, given that the incoming request specifies a value in
 the `X-HTTP-Method-Override` Header. For example, if a POST request with the `X-HTTP-Method-Override` header has
 the value 'COPY' specified, then the Swagger Magic will attempt to find a Class with the name 'COPY' instead of 'POST'.
+An Endpoint does not need a HEAD Class. A HEAD request to an Endpoint without one is answered by its GET Class, with
+the headers (and 'Content-Length') of the GET response, but without validating or sending the body. The GET Class
+can tell it is answering a HEAD request, as `wdr.swag['http-method']` is still 'HEAD'.
 
 
 ## 4. Define logic and Swagger in HTTP Method Class(es)
@@ -245,6 +248,37 @@ class HTTP_METHOD_NAME: #eg. GET, POST, DELETE, PATH, OPTIONS
 		PREFIX+'includeHeaders': {
 			'My-Custom-Header': 'value'
 		},
+		#Boolean (default=False): Whether to write a 'json' response straight into the Servlet Response (using
+		# `__swagger2__.serializer`), rather than having the WebDev Module encode it. Helpful for large responses.
+		PREFIX+'streamResponse': False,
+		#Integer/None (default=`statics.MAX_REQUEST_BODY_SIZE`): The largest request body (in bytes) this endpoint will
+		# accept. Bulk endpoints can raise the limit, or remove it with `None`.
+		PREFIX+'maxBodySize': 10 * 1024 * 1024,
+		#Boolean (default=False): Whether to keep the original (un-parsed) request body in `wdr.swag['original-data']`.
+		PREFIX+'keepOriginalData': False,
+		#Boolean (default=False): Whether the request body is a JSON array that is read one item at a time. The 'body'
+		# parameter's schema should then be of type 'array', and `wdr.swag['data']` will be an iterator of the items,
+		# each one validated against the schema's 'items' as it is read. An invalid item stops the iteration, and the
+		# endpoint responds as if the request had failed validation.
+		PREFIX+'streamBody': False,
+		#Boolean/Dictionary (default=`statics.PROFILE`): Whether to profile this endpoint. A Dictionary (with the keys
+		# 'sampleRate', 'slowThreshold', and 'frames') runs 1 in 'sampleRate' requests under the Python profiler, and
+		# keeps the stage times of requests slower than 'slowThreshold' milliseconds. See `__swagger2__.profiler`.
+		PREFIX+'profile': {'sampleRate': 100, 'slowThreshold': 500},
+		#Boolean/Dictionary (default=False): Whether to cache the successful responses of this GET endpoint. A cached
+		# response is returned right after authentication, without validating the request or running the logic. The
+		# Dictionary can have the keys 'ttl' (seconds), 'maxEntries', 'varyHeaders', 'varyQuery' (None for every query
+		# parameter), 'varyAuth' (an authentication function can return a 'principal', eg. the user name, to get
+		# responses cached per user; without one, responses are cached per value of the 'credentialHeaders'), and
+		# 'credentialHeaders'. See `__swagger2__.cache.DEFAULT_CACHE_SETTINGS`.
+		PREFIX+'cache': {'ttl': 30, 'maxEntries': 100, 'varyHeaders': ['Accept-Language'], 'varyQuery': ['status']},
+		#Boolean (default=False): Whether to give the successful 'json' responses of this GET endpoint an 'ETag' header
+		# (a hash of the JSON). A request whose 'If-None-Match' header matches it gets "304 Not Modified" and no body.
+		PREFIX+'etag': True,
+		#Boolean (default=`statics.COMPRESS_RESPONSES`): Whether to compress the responses of this endpoint (with gzip
+		# or deflate, as the client's 'Accept-Encoding' header asks) when they are at least `statics.COMPRESSION_MIN_SIZE`
+		# bytes. Use False for endpoints whose responses are already compressed (eg. images). See `__swagger2__.compression`.
+		PREFIX+'compress': True,
 	
 		# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 		# ACTUAL SWAGGER DEFINITION
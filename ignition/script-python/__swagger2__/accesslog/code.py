@@ -0,0 +1,377 @@
+'''
+	This script contains the access log, which records a small event for every request handled. The request thread only
+	puts the event in a bounded queue; a background thread takes the events off the queue in batches and passes them to
+	the configured sinks (the gateway logs, a rolling file, a database table, or anything with a `write` function).
+'''
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# IMPORTS
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+import system
+import os
+import types
+import threading
+import Queue
+from collections import OrderedDict
+import java.lang.Exception
+#Other Ignition Project Script Modules that we will use
+import server
+from __swagger2__ import serializer as swagSer
+
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# LOGGER and CONSTANTS
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+LIBRARY_LOGGER = server.getLogger("IgnitionSwagger2.accesslog")
+
+#The access logs (and their background threads) are kept in the Gateway's persistent globals, so that saving the
+# project scripts does not lose track of a thread that is still running. There is one access log for every Project and
+# root Script Package, under this key followed by their names (see `_getAccessLogKey`).
+ACCESS_LOG_GLOBALS_KEY = 'IgnitionSwagger2.accessLog'
+_ACCESS_LOG_LOCK = threading.Lock()
+DEFAULT_QUEUE_SIZE = 10000
+DEFAULT_BATCH_SIZE = 100
+#The most seconds an event waits in the queue before the background thread writes whatever batch it has
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+#The keys of every access log event, in the order they are written by the sinks
+EVENT_KEYS = [
+	'timestamp', 'method', 'route', 'uri', 'status', 'latency-ms',
+	'request-size', 'response-size', 'authenticated', 'auth-method', 'request-valid', 'response-valid', 'from-ip',
+]
+
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# SINKS
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+class LoggerSink(object):
+	'''
+	@CLASS	Writes every access log event as a single line in the gateway logs
+	@ATTR	logger : Logger object, see `server.Logger`
+	@ATTR	level : String, the level the lines are logged at
+	'''
+	def __init__(self, loggerName='IgnitionSwagger2.access', level='info'):
+		self.logger = server.getLogger(loggerName)
+		self.level = level
+	#END DEF
+	
+	def write(self, events):
+		'''
+		@FUNC	Logs the given events
+		@PARAM	events : List of Dictionaries, the access log events
+		'''
+		if not self.logger.isEnabled(self.level):
+			return
+		for event in events:
+			self.logger.log(
+				(
+					"{!s} {!s} {!s} {!s}ms (route={!s}, authenticated={!s}, auth={!s}, request-valid={!s}, "+
+					"response-valid={!s}, from={!s})"
+				).format(
+					event['method'], event['uri'], event['status'], event['latency-ms'],
+					event['route'], event['authenticated'], event['auth-method'], event['request-valid'],
+					event['response-valid'], event['from-ip']
+				),
+				level=self.level
+			)
+		#END FOR
+	#END DEF
+#END CLASS
+
+class RollingFileSink(object):
+	'''
+	@CLASS	Appends every access log event to a file as a line of JSON. Once the file grows past `maxBytes`, it is
+			renamed (to `path`.1, with older files moving to `path`.2 and so on) and a new file is started.
+	@ATTR	path : String, the path of the file on the Gateway
+	@ATTR	maxBytes : Integer, the size the file may grow to before it is rolled over
+	@ATTR	backupCount : Integer, the number of rolled over files to keep
+	'''
+	def __init__(self, path, maxBytes=10*1024*1024, backupCount=5):
+		self.path = path
+		self.maxBytes = maxBytes
+		self.backupCount = backupCount
+	#END DEF
+	
+	def write(self, events):
+		'''
+		@FUNC	Appends the given events to the file, rolling it over first if it has grown too large
+		@PARAM	events : List of Dictionaries, the access log events
+		'''
+		if os.path.exists(self.path) and os.path.getsize(self.path) >= self.maxBytes:
+			self.__rollOver()
+		lines = [swagSer.dumps(OrderedDict([(key, event.get(key, None)) for key in EVENT_KEYS])) for event in events]
+		with open(self.path, 'a') as f:
+			f.write('\n'.join(lines) + '\n')
+	#END DEF
+	
+	def __rollOver(self):
+		for i in range(self.backupCount-1, 0, -1):
+			olderPath = "{!s}.{!s}".format(self.path, i)
+			if os.path.exists(olderPath):
+				newerPath = "{!s}.{!s}".format(self.path, i+1)
+				if os.path.exists(newerPath):
+					os.remove(newerPath)
+				os.rename(olderPath, newerPath)
+		#END FOR
+		if self.backupCount > 0:
+			if os.path.exists(self.path + '.1'):
+				os.remove(self.path + '.1')
+			os.rename(self.path, self.path + '.1')
+		else:
+			os.remove(self.path)
+	#END DEF
+#END CLASS
+
+class DatabaseSink(object):
+	'''
+	@CLASS	Inserts the access log events into a database table, with a single INSERT statement for each batch
+	@ATTR	table : String, the name of the table
+	@ATTR	database : String, the name of the Ignition Database Connection ('' uses the project's default)
+	@ATTR	columns : OrderedDict, mapping the key of an event to the column it is inserted into. By default, the
+				column is named after the key, with dashes replaced by underscores (eg. 'latency-ms' -> 'latency_ms').
+	'''
+	def __init__(self, table, database='', columns=None):
+		self.table = table
+		self.database = database
+		if columns is None:
+			columns = OrderedDict([(key, key.replace('-','_')) for key in EVENT_KEYS])
+		self.columns = columns
+	#END DEF
+	
+	def write(self, events):
+		'''
+		@FUNC	Inserts the given events
+		@PARAM	events : List of Dictionaries, the access log events
+		'''
+		rowPlaceholder = "(" + ",".join(["?"]*len(self.columns)) + ")"
+		query = "INSERT INTO {!s} ({!s}) VALUES {!s}".format(
+			self.table, ",".join(self.columns.values()), ",".join([rowPlaceholder]*len(events))
+		)
+		args = []
+		for event in events:
+			args.extend([event.get(key, None) for key in self.columns])
+		system.db.runPrepUpdate(query, args, self.database)
+	#END DEF
+#END CLASS
+
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# ACCESS LOG
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+class AccessLog(object):
+	'''
+	@CLASS	Takes access log events from request threads (without ever blocking them) and writes them to the sinks
+			in batches, from a single background thread.
+	@ATTR	sinks : List, objects with a `write` function that takes a List of events
+	@ATTR	maxSize : Integer, the most events the queue holds. Events recorded while the queue is full are dropped.
+	@ATTR	batchSize : Integer, the most events given to the sinks at once
+	@ATTR	flushInterval : Float, the most seconds an event waits before its (partial) batch is written
+	@ATTR	recorded : Integer, the number of events put in the queue
+	@ATTR	dropped : Integer, the number of events dropped because the queue was full
+	@ATTR	written : Integer, the number of events given to the sinks
+	@ATTR	sinkErrors : Integer, the number of times a sink failed to write a batch
+	'''
+	def __init__(self, sinks, maxSize=DEFAULT_QUEUE_SIZE, batchSize=DEFAULT_BATCH_SIZE,
+				flushInterval=DEFAULT_FLUSH_INTERVAL):
+		self.sinks = sinks
+		self.maxSize = maxSize
+		self.batchSize = batchSize
+		self.flushInterval = flushInterval
+		self.recorded = 0
+		self.dropped = 0
+		self.written = 0
+		self.sinkErrors = 0
+		self.__queue = Queue.Queue(maxSize)
+		self.__lock = threading.Lock()
+		self.__running = True
+		self.__worker = threading.Thread(target=self.__run, name='IgnitionSwagger2-AccessLog')
+		self.__worker.setDaemon(True)
+		self.__worker.start()
+	#END DEF
+	
+	def record(self, event):
+		'''
+		@FUNC	Queues the given event to be written by the background thread. Never blocks; if the queue is full,
+				the event is dropped (and counted).
+		@PARAM	event : Dictionary, see `EVENT_KEYS`
+		@RETURN	Boolean, whether the event was queued
+		'''
+		try:
+			self.__queue.put_nowait(event)
+		except Queue.Full:
+			with self.__lock:
+				self.dropped += 1
+			return False
+		with self.__lock:
+			self.recorded += 1
+		return True
+	#END DEF
+	
+	def stop(self):
+		'''
+		@FUNC	Stops the background thread, once it has written the events already in the queue
+		'''
+		self.__running = False
+	#END DEF
+	
+	def stats(self):
+		'''
+		@FUNC	Gets the size and counters of the access log
+		@RETURN	Python Dictionary, with the keys 'queued', 'maxSize', 'recorded', 'dropped', 'written', and 'sinkErrors'
+		'''
+		with self.__lock:
+			return {
+				'queued': self.__queue.qsize(),
+				'maxSize': self.maxSize,
+				'recorded': self.recorded,
+				'dropped': self.dropped,
+				'written': self.written,
+				'sinkErrors': self.sinkErrors,
+			}
+	#END DEF
+	
+	def __run(self):
+		logger = LIBRARY_LOGGER.getSubLogger('AccessLog')
+		while self.__running or not self.__queue.empty():
+			try:
+				batch = [self.__queue.get(True, self.flushInterval)]
+			except Queue.Empty:
+				continue
+			while len(batch) < self.batchSize:
+				try:
+					batch.append(self.__queue.get_nowait())
+				except Queue.Empty:
+					break
+			#END WHILE
+			for sink in list(self.sinks):
+				try:
+					sink.write(batch)
+				except (Exception, java.lang.Exception), e:
+					with self.__lock:
+						self.sinkErrors += 1
+					logger.warn("Access log sink {!r} failed to write {!s} events".format(sink, len(batch)), e)
+			#END FOR
+			with self.__lock:
+				self.written += len(batch)
+		#END WHILE
+	#END DEF
+#END CLASS
+
+
+
+def _getAccessLogKey(swagStc):
+	'''
+	@FUNC	Gets the Gateway globals key of the access log for the current Project and the root Script Package of the
+			given Statics Module
+	@PARAM	swagStc : Script Module, the "statics" module for the API
+	@RETURN	String
+	'''
+	rootPackageName = swagStc.__name__.rsplit('.', 1)[0]
+	return '{!s}.{!s}.{!s}'.format(ACCESS_LOG_GLOBALS_KEY, system.project.getProjectName(), rootPackageName)
+#END DEF
+
+def getAccessLog(swagStc):
+	'''
+	@FUNC	Gets the access log for the sinks configured in the given Statics Module, starting it the first time it
+			is needed. Returns None when no sinks are configured.
+			An access log started by the code from before the project scripts were last saved is stopped (once it has
+			written the events in its queue) and replaced, so that its thread does not keep running the old code.
+	@PARAM	swagStc : Script Module, the "statics" module for the API (see `ACCESS_LOG_SINKS`)
+	@RETURN	AccessLog object/None
+	'''
+	sinks = getattr(swagStc, 'ACCESS_LOG_SINKS', None)
+	if not sinks:
+		return None
+	sharedGlobals = system.util.getGlobals()
+	globalsKey = _getAccessLogKey(swagStc)
+	accessLog = sharedGlobals.get(globalsKey, None)
+	#Saving the project scripts runs this module again, which creates a new `AccessLog` class
+	if not isinstance(accessLog, AccessLog):
+		with _ACCESS_LOG_LOCK:
+			accessLog = sharedGlobals.get(globalsKey, None)
+			if not isinstance(accessLog, AccessLog):
+				if accessLog is not None:
+					LIBRARY_LOGGER.getSubLogger('getAccessLog').debug(
+						"Stopping the access log '{!s}' started before the project scripts were saved", args=(globalsKey,)
+					)
+					accessLog.stop()
+				#END IF
+				#Before there was one access log per root Script Package, there was one for the whole Gateway
+				sharedAccessLog = sharedGlobals.pop(ACCESS_LOG_GLOBALS_KEY, None)
+				if sharedAccessLog is not None:
+					sharedAccessLog.stop()
+				#END IF
+				accessLog = AccessLog(
+					sinks,
+					maxSize = getattr(swagStc, 'ACCESS_LOG_QUEUE_SIZE', DEFAULT_QUEUE_SIZE),
+					batchSize = getattr(swagStc, 'ACCESS_LOG_BATCH_SIZE', DEFAULT_BATCH_SIZE)
+				)
+				sharedGlobals[globalsKey] = accessLog
+			#END IF
+	#END IF
+	#Saving the statics module alone creates new sinks, which the running access log should start using
+	if accessLog.sinks is not sinks:
+		accessLog.sinks = sinks
+	return accessLog
+#END DEF
+
+def getAccessLogStats():
+	'''
+	@FUNC	Gets the counters of the access logs of the current Project (added together), without starting them
+	@RETURN	Python Dictionary/None, see `AccessLog.stats`. None if no access log has been started.
+	'''
+	projectPrefix = '{!s}.{!s}.'.format(ACCESS_LOG_GLOBALS_KEY, system.project.getProjectName())
+	totals = None
+	for key, accessLog in system.util.getGlobals().items():
+		if not (isinstance(key, types.StringTypes) and key.startswith(projectPrefix) and isinstance(accessLog, AccessLog)):
+			continue
+		stats = accessLog.stats()
+		if totals is None:
+			totals = stats
+		else:
+			for name in stats:
+				totals[name] += stats[name]
+		#END IF/ELSE
+	#END FOR
+	return totals
+#END DEF
+
+def buildEvent(wdr, response, startTime, endTime):
+	'''
+	@FUNC	Builds the access log event for a handled request. Only the values needed are gathered here; turning them
+			into text (or rows) is left to the sinks, on the background thread.
+	@PARAM	wdr : WebDevRequest object
+	@PARAM	response : Dictionary/None, the WebDev response returned for the request
+	@PARAM	startTime : Float, when the request was received (in seconds, see `time.time`)
+	@PARAM	endTime : Float, when the response was ready
+	@RETURN	Python Dictionary, see `EVENT_KEYS`
+	'''
+	responseSize = None
+	if isinstance(response, types.DictionaryType):
+		#The size of a 'json' response is not known until the WebDev Module has encoded it
+		for key in ('response', 'html', 'bytes'):
+			if response.get(key, None) is not None:
+				try:
+					responseSize = len(response[key])
+				except TypeError:
+					pass
+				break
+		#END FOR
+	#END IF
+	requestSize = wdr.request['servletRequest'].getContentLength()
+	event = {
+		'timestamp': int(startTime * 1000),
+		'method': wdr.swag['original-http-method'],
+		'uri': wdr.request['servletRequest'].getRequestURI(),
+		'status': wdr.request['servletResponse'].getStatus(),
+		'latency-ms': round((endTime - startTime) * 1000.0, 3),
+		'request-size': requestSize if requestSize >= 0 else None,
+		'response-size': responseSize,
+		'from-ip': wdr.swag['headers-lc'].get('x-real-ip', wdr.request['remoteAddr']),
+	}
+	event.update(wdr.accessInfo)
+	return event
+#END DEF
\ No newline at end of file
@@ -0,0 +1,317 @@
+'''
+	This script contains the response cache. A GET endpoint can ask (with its custom 'cache' SWAGGER key) for its
+	successful responses to be kept in memory for a number of seconds. While a response is cached, requests for it are
+	answered right after authentication, without validating the request or running the endpoint's logic.
+'''
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# IMPORTS
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+import time
+import types
+import hashlib
+import threading
+from java.util.concurrent.atomic import AtomicLong
+#Other Ignition Project Script Modules that we will use
+import server
+from __swagger2__ import globals as swagGl
+from __swagger2__ import serializer as swagSer
+
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# LOGGER and CONSTANTS
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+LIBRARY_LOGGER = server.getLogger("IgnitionSwagger2.cache")
+
+#The settings used for anything an endpoint's cache settings leave out
+#	- ttl : Number, the seconds a response is kept
+#	- maxEntries : Integer, the most responses kept for the endpoint. The least recently used is dropped first.
+#	- varyHeaders : List of Strings, the request headers whose values get their own cached response
+#	- varyQuery : List of Strings/None, the URL query parameters whose values get their own cached response. None
+#		means every query parameter.
+#	- varyAuth : Boolean, whether every authentication method (and the 'principal' its response gives) gets its own
+#		cached response. When the authentication method gives no 'principal', the values of the 'credentialHeaders'
+#		tell the callers apart instead (only a hash of them is kept).
+#	- credentialHeaders : List of Strings, the request headers that carry the caller's credentials. An authentication
+#		function that reads its credentials from any other header (eg. an API key) should return a 'principal', or
+#		have its header added here.
+DEFAULT_CACHE_SETTINGS = {
+	'ttl': 60,
+	'maxEntries': 100,
+	'varyHeaders': [],
+	'varyQuery': None,
+	'varyAuth': True,
+	'credentialHeaders': ['Authorization', 'Proxy-Authorization', 'Cookie'],
+}
+
+#Only the responses with these HTTP Status codes are cached
+CACHEABLE_STATUSES = (200,)
+#The WebDev response keys whose (String) values can be cached as they are
+TEXT_RESPONSE_KEYS = ('response', 'html')
+#The (lower case) names of the only response headers kept with a cached response. Every other header (eg. 'Set-Cookie',
+# or hop-by-hop headers like 'Connection') belongs to the one response, and must not be sent to every later client.
+CACHED_HEADERS = ('content-type', 'etag', 'cache-control', 'vary', 'last-modified')
+
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# CACHING RESPONSES
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+def getCacheSettings(endpointSetting):
+	'''
+	@FUNC	Works out the cache settings for an endpoint
+	@PARAM	endpointSetting : Boolean/Dictionary/None, the endpoint's custom 'cache' SWAGGER key. `True` uses the
+				defaults, and a Dictionary is merged over the defaults.
+	@RETURN	Python Dictionary/None, the settings (see `DEFAULT_CACHE_SETTINGS`). None if the endpoint is not cached.
+	'''
+	if not endpointSetting:
+		return None
+	settings = dict(DEFAULT_CACHE_SETTINGS)
+	if isinstance(endpointSetting, types.DictionaryType):
+		settings.update(endpointSetting)
+	if not settings['ttl'] or settings['ttl'] <= 0 or settings['maxEntries'] <= 0:
+		return None
+	settings['varyHeaders'] = [header.lower() for header in settings['varyHeaders']]
+	settings['credentialHeaders'] = [header.lower() for header in settings['credentialHeaders']]
+	return settings
+#END DEF
+
+def _hashable(value):
+	if isinstance(value, (types.ListType, types.TupleType)):
+		return tuple(_hashable(item) for item in value)
+	if isinstance(value, types.DictionaryType):
+		return tuple(sorted((key, _hashable(item)) for key, item in value.items()))
+	return value
+#END DEF
+
+def _hashCredentials(headersLc, credentialHeaders):
+	'''
+	@FUNC	Hashes the credentials a request gives, so that they can tell callers apart without being kept in memory
+	@PARAM	headersLc : Python Dictionary, the request headers, with the names lower case
+	@PARAM	credentialHeaders : List of Strings, the (lower case) names of the headers that carry credentials
+	@RETURN	String/None, the SHA-1 hex digest. None if the request gives none of the headers.
+	'''
+	values = [headersLc.get(header, None) for header in credentialHeaders]
+	if all(value is None for value in values):
+		return None
+	return hashlib.sha1(swagSer.dumps(values)).hexdigest()
+#END DEF
+
+class ResponseCache(object):
+	'''
+	@CLASS	The cached responses of a single endpoint (route and HTTP Method), in an `LruCache`. Every cached response
+			is kept until it expires, or until it is the least recently used one when the cache is full.
+	@ATTR	settings : Python Dictionary, see `getCacheSettings`
+	@ATTR	expirations : AtomicLong, the number of lookups that found a response that had expired
+	'''
+	def __init__(self, settings):
+		self.settings = settings
+		self.expirations = AtomicLong(0)
+		self.__entries = swagGl.LruCache(settings['maxEntries'])
+	#END DEF
+	
+	def makeKey(self, wdr):
+		'''
+		@FUNC	Gets what identifies the response to a request: the URI (which includes any Path Parameters), and the
+				query parameters, headers, and authentication (see `DEFAULT_CACHE_SETTINGS`) the settings vary by
+		@PARAM	wdr : WebDevRequest object, authenticated
+		@RETURN	Tuple
+		'''
+		params = wdr.request.get('params', None) or {}
+		varyQuery = self.settings['varyQuery']
+		if varyQuery is None:
+			query = _hashable(params)
+		else:
+			query = tuple(_hashable(params.get(name, None)) for name in varyQuery)
+		headers = tuple(wdr.swag['headers-lc'].get(header, None) for header in self.settings['varyHeaders'])
+		auth = None
+		if self.settings['varyAuth']:
+			principal = (wdr.swag.get('auth', None) or {}).get('principal', None)
+			if principal is None:
+				principal = _hashCredentials(wdr.swag['headers-lc'], self.settings['credentialHeaders'])
+			auth = (wdr.accessInfo.get('auth-method', None), _hashable(principal))
+		return (wdr.request['servletRequest'].getRequestURI(), query, headers, auth)
+	#END DEF
+	
+	def get(self, key):
+		'''
+		@FUNC	Gets the cached response for the given key, if it has not expired
+		@PARAM	key : Tuple, see `makeKey`
+		@RETURN	Python Dictionary/None, see `makeEntry`
+		'''
+		entry = self.__entries.get(key, None)
+		if entry is not None and entry['expires'] <= time.time():
+			self.__entries.pop(key, None)
+			self.expirations.incrementAndGet()
+			return None
+		return entry
+	#END DEF
+	
+	def put(self, key, entry):
+		'''
+		@FUNC	Caches a response
+		@PARAM	key : Tuple, see `makeKey`
+		@PARAM	entry : Python Dictionary, see `makeEntry`
+		'''
+		self.__entries.put(key, entry)
+	#END DEF
+	
+	def clear(self):
+		self.__entries.clear()
+	#END DEF
+	
+	def stats(self):
+		'''
+		@FUNC	Gets the size and counters of the cache. Finding an expired response counts as a miss.
+		@RETURN	Python Dictionary, see `LruCache.stats`, with the key 'expirations' added
+		'''
+		stats = self.__entries.stats()
+		expirations = self.expirations.get()
+		stats['hits'] -= expirations
+		stats['misses'] += expirations
+		stats['expirations'] = expirations
+		return stats
+	#END DEF
+#END CLASS
+
+def makeEntry(request, response, ttl):
+	'''
+	@FUNC	Turns an endpoint's response into what is cached: the body serialized into a String, along with the status
+			and the Servlet Response headers that describe the body (see `CACHED_HEADERS`). Responses that cannot be
+			cached give None.
+	@PARAM	request : WebDev Request object
+	@PARAM	response : Python Dictionary, the WebDev response
+	@PARAM	ttl : Number, the seconds the response is kept
+	@RETURN	Python Dictionary/None, with the keys 'key' (the WebDev response key the body is returned in), 'body',
+			'contentType', 'status', 'headers', 'expires', and 'encodedBodies' (see `getEncodedBody`)
+	'''
+	servletResponse = request['servletResponse']
+	status = servletResponse.getStatus()
+	if status not in CACHEABLE_STATUSES or not isinstance(response, types.DictionaryType):
+		return None
+	if 'json' in response:
+		#A failure reported in a "200 OK" response is not worth remembering
+		if isinstance(response['json'], types.DictionaryType) and response['json'].get('success', True) is False:
+			return None
+		key = 'response'
+		body = swagSer.dumps(response['json'])
+		contentType = response.get('contentType', 'application/json')
+	else:
+		textKeys = [
+			textKey for textKey in TEXT_RESPONSE_KEYS
+			if isinstance(response.get(textKey, None), types.StringTypes)
+		]
+		if not textKeys:
+			return None
+		key = textKeys[0]
+		body = response[key]
+		contentType = response.get('contentType', None)
+	#END IF/ELSE
+	return {
+		'key': key,
+		'body': body,
+		'contentType': contentType,
+		'status': status,
+		'headers': [
+			(name, servletResponse.getHeader(name)) for name in servletResponse.getHeaderNames()
+			if name.lower() in CACHED_HEADERS
+		],
+		'expires': time.time() + ttl,
+		'encodedBodies': {},
+	}
+#END DEF
+
+def respondWithEntry(request, entry):
+	'''
+	@FUNC	Sets the status and headers of a cached response on the Servlet Response
+	@PARAM	request : WebDev Request object
+	@PARAM	entry : Python Dictionary, see `makeEntry`
+	@RETURN	Python Dictionary, the WebDev response
+	'''
+	servletResponse = request['servletResponse']
+	servletResponse.setStatus(entry['status'])
+	for name, value in entry['headers']:
+		servletResponse.setHeader(name, value)
+	#END FOR
+	response = {entry['key']: entry['body']}
+	if entry['contentType'] is not None:
+		response['contentType'] = entry['contentType']
+	return response
+#END DEF
+
+def getEncodedBody(entry, encoding, encode):
+	'''
+	@FUNC	Gets the body of a cached response in an encoding (eg. gzip, see `__swagger2__.compression`), encoding it
+			the first time it is asked for, so that it is only encoded once for every request it answers
+	@PARAM	entry : Python Dictionary, see `makeEntry`
+	@PARAM	encoding : String, the name of the encoding
+	@PARAM	encode : Function, called with the body to encode it
+	@RETURN	String, the encoded body
+	'''
+	encodedBody = entry['encodedBodies'].get(encoding, None)
+	if encodedBody is None:
+		encodedBody = encode(entry['body'])
+		#Two requests encoding it at once is harmless, as they both get the same bytes
+		entry['encodedBodies'][encoding] = encodedBody
+	return encodedBody
+#END DEF
+
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# THE CACHES OF EVERY ENDPOINT
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#The ResponseCache of every cached endpoint, keyed by (route, HTTP Method). Saving the project reloads every Script
+# Module, which clears these along with the SWAGGER dictionaries they were made for.
+_RESPONSE_CACHES = {}
+_RESPONSE_CACHES_LOCK = threading.Lock()
+
+def getResponseCache(route, method, endpointSetting):
+	'''
+	@FUNC	Gets the ResponseCache of an endpoint, creating it the first time it is needed
+	@PARAM	route : String, the full name of the endpoint's Script Package
+	@PARAM	method : String, the HTTP Method
+	@PARAM	endpointSetting : Boolean/Dictionary/None, the endpoint's custom 'cache' SWAGGER key
+	@RETURN	ResponseCache/None, None when the endpoint is not cached
+	'''
+	cacheKey = (route, method)
+	responseCache = _RESPONSE_CACHES.get(cacheKey, None)
+	if responseCache is not None:
+		return responseCache
+	settings = getCacheSettings(endpointSetting)
+	if settings is None:
+		return None
+	with _RESPONSE_CACHES_LOCK:
+		responseCache = _RESPONSE_CACHES.get(cacheKey, None)
+		if responseCache is None:
+			LIBRARY_LOGGER.getSubLogger('getResponseCache').debug(
+				"Caching responses of '{!s} {!s}' (see details for settings)", settings, args=(method, route)
+			)
+			responseCache = ResponseCache(settings)
+			_RESPONSE_CACHES[cacheKey] = responseCache
+		return responseCache
+#END DEF
+
+def getCacheStats():
+	'''
+	@FUNC	Gets the size and counters of every endpoint's cache, added together
+	@RETURN	Python Dictionary, see `ResponseCache.stats`
+	'''
+	totals = {'size': 0, 'maxSize': 0, 'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0}
+	for responseCache in _RESPONSE_CACHES.values():
+		for key, value in responseCache.stats().items():
+			totals[key] += value
+		#END FOR
+	#END FOR
+	return totals
+#END DEF
+
+def clearResponseCaches():
+	'''
+	@FUNC	Forgets every cached response
+	'''
+	for responseCache in _RESPONSE_CACHES.values():
+		responseCache.clear()
+	#END FOR
+#END DEF
\ No newline at end of file
@@ -0,0 +1,188 @@
+'''
+	This script contains the response compression. The body of a response is compressed with gzip or deflate (whichever
+	the client prefers, according to its 'Accept-Encoding' header) when it is large enough to be worth it, and written
+	straight into the Servlet Response.
+'''
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# IMPORTS
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+import types
+import zlib
+import gzip
+from StringIO import StringIO
+#Other Ignition Project Script Modules that we will use
+import server
+from __swagger2__ import serializer as swagSer
+
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# LOGGER and CONSTANTS
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+LIBRARY_LOGGER = server.getLogger("IgnitionSwagger2.compression")
+
+#The encodings we can compress with, in the order we prefer them when the client likes them equally
+ENCODINGS = ['gzip', 'deflate']
+DEFAULT_MIN_SIZE = 1024
+DEFAULT_LEVEL = 6
+
+#The WebDev response keys whose bodies can be compressed, and the Content-Type of each when the response does not
+# give one
+RESPONSE_BODY_KEYS = ('json', 'response', 'html')
+DEFAULT_CONTENT_TYPES = {
+	'json': 'application/json',
+	'html': 'text/html',
+	'response': 'text/plain',
+}
+
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# NEGOTIATING and COMPRESSING
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+def getCompressionSettings(endpointSetting, swagStc):
+	'''
+	@FUNC	Works out the compression settings for an endpoint
+	@PARAM	endpointSetting : Boolean/None, the endpoint's custom 'compress' SWAGGER key. `False` turns compression
+				off for the endpoint, and `True` turns it on even when the statics turn it off.
+	@PARAM	swagStc : Reference to a Script Module for the "Swagger Statics"
+	@RETURN	Python Dictionary/None, with the keys 'minSize' and 'level'. None if the endpoint's responses are not
+			compressed.
+	'''
+	if endpointSetting is False or (endpointSetting is None and not getattr(swagStc, 'COMPRESS_RESPONSES', True)):
+		return None
+	return {
+		'minSize': getattr(swagStc, 'COMPRESSION_MIN_SIZE', DEFAULT_MIN_SIZE),
+		'level': getattr(swagStc, 'COMPRESSION_LEVEL', DEFAULT_LEVEL),
+	}
+#END DEF
+
+def chooseEncoding(acceptEncoding):
+	'''
+	@FUNC	Chooses the encoding to compress a response with, from the value of the request's 'Accept-Encoding' header
+	@PARAM	acceptEncoding : String/None, eg. 'gzip, deflate;q=0.5'
+	@RETURN	String/None, one of `ENCODINGS`. None if the client did not ask for any of them.
+	'''
+	if not acceptEncoding:
+		return None
+	qualities = {}
+	for part in acceptEncoding.split(','):
+		name, sep, params = part.partition(';')
+		quality = 1.0
+		for param in params.split(';'):
+			key, sep, value = param.partition('=')
+			if key.strip().lower() == 'q':
+				try:
+					quality = float(value)
+				except ValueError:
+					quality = 0.0
+				#END TRY/EXCEPT
+		#END FOR
+		qualities[name.strip().lower()] = quality
+	#END FOR
+	bestEncoding = None
+	bestQuality = 0.0
+	for encoding in ENCODINGS:
+		quality = qualities.get(encoding, qualities.get('*', 0.0))
+		if quality > bestQuality:
+			bestEncoding = encoding
+			bestQuality = quality
+	#END FOR
+	return bestEncoding
+#END DEF
+
+def hasResponseBody(response):
+	'''
+	@FUNC	Checks whether a WebDev response has a body that could be compressed, without serializing it
+	@PARAM	response : Python Dictionary/None, the WebDev response
+	@RETURN	Boolean
+	'''
+	return isinstance(response, types.DictionaryType) and any(key in response for key in RESPONSE_BODY_KEYS)
+#END DEF
+
+def getResponseBody(response):
+	'''
+	@FUNC	Gets the body of a WebDev response, as the String that would be sent. A 'json' response is serialized (see
+			`__swagger2__.serializer`).
+	@PARAM	response : Python Dictionary/None, the WebDev response
+	@RETURN	Tuple/None, (String body, String Content-Type). None for the responses whose body cannot be compressed
+			(eg. 'file' or 'bytes' responses, or responses already written into the Servlet Response).
+	'''
+	if not isinstance(response, types.DictionaryType):
+		return None
+	for key in RESPONSE_BODY_KEYS:
+		if key not in response:
+			continue
+		contentType = response.get('contentType', None) or DEFAULT_CONTENT_TYPES[key]
+		if key == 'json':
+			return swagSer.dumps(response['json']), contentType
+		body = response[key]
+		if isinstance(body, types.UnicodeType):
+			body = body.encode('utf-8')
+			if 'charset' not in contentType.lower():
+				contentType += '; charset=utf-8'
+		elif not isinstance(body, types.StringType):
+			return None
+		return body, contentType
+	#END FOR
+	return None
+#END DEF
+
+def compress(body, encoding, level=DEFAULT_LEVEL):
+	'''
+	@FUNC	Compresses a body
+	@PARAM	body : String (of bytes)
+	@PARAM	encoding : String, one of `ENCODINGS`
+	@PARAM	level : Integer, from 1 (quickest) to 9 (smallest)
+	@RETURN	String (of bytes)
+	'''
+	if encoding == 'deflate':
+		#The 'deflate' Content-Encoding is the zlib format, not a raw deflate stream
+		return zlib.compress(body, level)
+	buffer = StringIO()
+	#Leaving the time out of the gzip header, so that compressing the same body always gives the same bytes
+	gzipFile = gzip.GzipFile(fileobj=buffer, mode='wb', compresslevel=level, mtime=0)
+	try:
+		gzipFile.write(body)
+	finally:
+		gzipFile.close()
+	return buffer.getvalue()
+#END DEF
+
+def setCompressedHeaders(request, encoding, contentType, contentLength):
+	'''
+	@FUNC	Sets the headers of a compressed response on the Servlet Response
+	@PARAM	request : WebDev Request object
+	@PARAM	encoding : String, the encoding the body was compressed with
+	@PARAM	contentType : String, the Content-Type of the (uncompressed) body
+	@PARAM	contentLength : Integer, the length of the compressed body
+	'''
+	servletResponse = request['servletResponse']
+	servletResponse.setHeader('Content-Encoding', encoding)
+	#The compressed body is a different representation, so a strong Entity Tag becomes a weak one
+	etag = servletResponse.getHeader('ETag')
+	if etag and not etag.startswith('W/'):
+		servletResponse.setHeader('ETag', 'W/' + etag)
+	servletResponse.setContentType(contentType)
+	servletResponse.setContentLength(contentLength)
+#END DEF
+
+def writeCompressed(request, compressedBody, encoding, contentType):
+	'''
+	@FUNC	Writes a compressed body straight into the Servlet Response
+	@PARAM	request : WebDev Request object
+	@PARAM	compressedBody : String (of bytes), see `compress`
+	@PARAM	encoding : String, the encoding the body was compressed with
+	@PARAM	contentType : String, the Content-Type of the (uncompressed) body
+	@RETURN	None, which tells the WebDev Module that the response has already been written
+	'''
+	setCompressedHeaders(request, encoding, contentType, len(compressedBody))
+	outputStream = request['servletResponse'].getOutputStream()
+	outputStream.write(compressedBody)
+	outputStream.flush()
+	LIBRARY_LOGGER.getSubLogger('writeCompressed').trace(
+		"Wrote {!s} bytes of '{!s}' response", args=(len(compressedBody), encoding)
+	)
+	return None
+#END DEF
\ No newline at end of file
@@ -11,9 +11,12 @@ import sys
 import types
 import re
 import copy
+import threading
 from collections import OrderedDict
 import pprint
+import jarray
 import java.lang.Exception
+import java.lang.String
 import java.lang.Double
 import java.util.Date
 
@@ -42,14 +45,15 @@ def getUriBase(request):
 	requestPath = request['servletRequest'].getRequestURI()
 	projName = system.project.getProjectName()
 	logger.trace(
-		"Determined request path to be '{!s}'. The Ignition Project's name is '{!s}'".format(
+		"Determined request path to be '{!s}'. The Ignition Project's name is '{!s}'",
+		args=(
 			requestPath, projName
 		)
 	)
 	#This line will throw an exception if the Project Name is not found
 	projNameIndex = requestPath.index(projName)
 	basePath = requestPath[:(projNameIndex+len(projName))]
-	logger.debug("Determined URI Base to be '{!s}'".format(basePath))
+	logger.debug("Determined URI Base to be '{!s}'", args=(basePath,))
 	return basePath
 #END DEF
 
@@ -65,18 +69,20 @@ def getRootPackage(request):
 	uriBase = getUriBase(request)
 	fullRequestPath = request['servletRequest'].getRequestURI()
 	logger.trace(
-		"Processing a request to '{!s}'. URI Base was determined to be '{!s}'".format(
+		"Processing a request to '{!s}'. URI Base was determined to be '{!s}'",
+		args=(
 			fullRequestPath, uriBase
 		)
 	)
 	cleanRequestPath = fullRequestPath.replace(uriBase+'/','')
 	logger.trace(
-		"Path with Base removed = '{!s}'. Remaining Path = '{!s}'".format(
+		"Path with Base removed = '{!s}'. Remaining Path = '{!s}'",
+		args=(
 			cleanRequestPath, request['remainingPath']
 		)
 	)
 	webdevResourceName = cleanRequestPath.replace(request['remainingPath'],'')
-	logger.trace("The actual WebDev Resource should be named '{!s}'".format(webdevResourceName))
+	logger.trace("The actual WebDev Resource should be named '{!s}'", args=(webdevResourceName,))
 	if webdevResourceName not in sys.modules:
 		raise Exception("Unable to find matching Script Package with name '{!s}'".format(webdevResourceName))
 	return sys.modules[webdevResourceName]
@@ -91,13 +97,372 @@ def getNamedModuleFromRoot(rootPackage, moduleName):
 	@RAISES	Exception, when the Script Package does not contain the appropriate Script Module resource
 	'''
 	logger = LIBRARY_LOGGER.getSubLogger('getNamedModuleFromRoot')
-	logger.trace("Testing if given Root Package contains '{!s}'".format(moduleName))
+	logger.trace("Testing if given Root Package contains '{!s}'", args=(moduleName,))
 	if moduleName not in rootPackage.__dict__:
 		raise Exception("The Root Package must contain a module named '{!s}'".format(moduleName))
 	return rootPackage.__dict__.get(moduleName, None)
 #END DEF
 
 
+#The name of the Gateway this code is running on. It does not change while the Gateway is running, so it is read
+# (from the '[System]Gateway/SystemName' tag) only the first time it is needed.
+GATEWAY_NAME_TAG_PATH = "[System]Gateway/SystemName"
+_GATEWAY_IDENTITY = {'name': None}
+
+def getGatewayName(refresh=False):
+	'''
+	@FUNC	Gets the name of the Gateway, reading it from the System tag only if it has not already been read
+	@PARAM	refresh : Boolean, whether to read the tag again, even if the name is known [DEFAULT: False]
+	@RETURN	String, the name of the Gateway
+	'''
+	if refresh or _GATEWAY_IDENTITY['name'] is None:
+		_GATEWAY_IDENTITY['name'] = system.tag.read(GATEWAY_NAME_TAG_PATH).value
+	return _GATEWAY_IDENTITY['name']
+#END DEF
+
+def refreshGatewayName():
+	'''
+	@FUNC	Reads the name of the Gateway again (eg. after the Gateway has been renamed)
+	@RETURN	String, the name of the Gateway
+	'''
+	return getGatewayName(refresh=True)
+#END DEF
+
+
+class LruCache(object):
+	'''
+	@CLASS	A small, thread-safe "Least Recently Used" cache. Once the cache holds `maxSize` items, adding another item
+			evicts the item that was used the longest time ago.
+	@ATTR	maxSize : Integer, the most items the cache will hold
+	@ATTR	hits : Integer, the number of lookups that found an item
+	@ATTR	misses : Integer, the number of lookups that did not find an item
+	@ATTR	evictions : Integer, the number of items removed to make room for new items
+	'''
+	def __init__(self, maxSize):
+		self.maxSize = maxSize
+		self.hits = 0
+		self.misses = 0
+		self.evictions = 0
+		self.__items = OrderedDict()
+		self.__lock = threading.Lock()
+	#END DEF
+	
+	def get(self, key, default=None):
+		'''
+		@FUNC	Gets the item cached for the given key, marking it as the most recently used
+		@PARAM	key : Object, any hashable object
+		@PARAM	default : Object, what to return if there is no item cached for the key
+		@RETURN	Object, the cached item or `default`
+		'''
+		with self.__lock:
+			if key not in self.__items:
+				self.misses += 1
+				return default
+			value = self.__items.pop(key)
+			self.__items[key] = value
+			self.hits += 1
+			return value
+	#END DEF
+	
+	def put(self, key, value):
+		'''
+		@FUNC	Caches the given item, evicting the least recently used item if the cache is full
+		@PARAM	key : Object, any hashable object
+		@PARAM	value : Object
+		'''
+		with self.__lock:
+			self.__items.pop(key, None)
+			self.__items[key] = value
+			while len(self.__items) > self.maxSize:
+				self.__items.popitem(last=False)
+				self.evictions += 1
+	#END DEF
+	
+	def pop(self, key, default=None):
+		'''
+		@FUNC	Removes the item cached for the given key
+		@PARAM	key : Object, any hashable object
+		@PARAM	default : Object, what to return if there is no item cached for the key
+		@RETURN	Object, the removed item or `default`
+		'''
+		with self.__lock:
+			return self.__items.pop(key, default)
+	#END DEF
+	
+	def clear(self):
+		'''
+		@FUNC	Removes every item from the cache. The counters are not reset.
+		'''
+		with self.__lock:
+			self.__items.clear()
+	#END DEF
+	
+	def __len__(self):
+		return len(self.__items)
+	#END DEF
+	
+	def stats(self):
+		'''
+		@FUNC	Gets the size and counters of the cache
+		@RETURN	Python Dictionary, with the keys 'size', 'maxSize', 'hits', 'misses', and 'evictions'
+		'''
+		return {
+			'size': len(self.__items),
+			'maxSize': self.maxSize,
+			'hits': self.hits,
+			'misses': self.misses,
+			'evictions': self.evictions,
+		}
+	#END DEF
+#END CLASS
+
+#Compiling a regular expression is expensive (especially in Jython), so every pattern used by the library
+# (eg. the 'pattern' of a string parameter) is compiled once and shared through this cache.
+REGEX_CACHE_SIZE = 256
+REGEX_CACHE = LruCache(REGEX_CACHE_SIZE)
+
+def compileRegex(pattern, flags=0):
+	'''
+	@FUNC	Gets the compiled regular expression for the given pattern, compiling it if it is not already cached
+	@PARAM	pattern : String, the regular expression
+	@PARAM	flags : Integer, the flags to compile the pattern with (eg. `re.IGNORECASE`)
+	@RETURN	Compiled regular expression object
+	@RAISES	re.error, if the pattern is not a valid regular expression
+	'''
+	cacheKey = (pattern, flags)
+	regex = REGEX_CACHE.get(cacheKey, None)
+	if regex is None:
+		regex = re.compile(pattern, flags)
+		REGEX_CACHE.put(cacheKey, regex)
+	return regex
+#END DEF
+
+def getRegexCacheStats():
+	'''
+	@FUNC	Gets the size and hit/miss counters of the regular expression cache
+	@RETURN	Python Dictionary, see `LruCache.stats`
+	'''
+	return REGEX_CACHE.stats()
+#END DEF
+
+#When the size of a request body is not given (in the 'Content-Length' header), it is read in chunks of this many
+# characters. When it is given, the whole body is read into a single buffer of that size.
+READ_CHUNK_SIZE = 64 * 1024
+
+class RequestBodyTooLargeException(Exception):
+	pass
+#END CLASS
+
+def readRequestBody(servletRequest, maxSize=None):
+	'''
+	@FUNC	Reads the body of the HTTP Servlet Request, in bulk, from its Buffered Reader
+	@PARAM	servletRequest : HTTP Servlet Request object
+	@PARAM	maxSize : Integer/None, the largest body (in bytes, or characters when no 'Content-Length' was given)
+				that will be read. `None` means there is no limit. [DEFAULT: None]
+	@RETURN	Unicode, the body of the request
+	@RAISES	RequestBodyTooLargeException, if the body is larger than `maxSize`. When the request gives a
+				'Content-Length', this is raised before any of the body is read.
+	'''
+	logger = LIBRARY_LOGGER.getSubLogger('readRequestBody')
+	contentLength = servletRequest.getContentLength()
+	if maxSize is not None and contentLength > maxSize:
+		raise RequestBodyTooLargeException(
+			"Request body of {!s} bytes is larger than the limit of {!s} bytes".format(contentLength, maxSize)
+		)
+	#END IF
+	bReader = servletRequest.getReader()
+	if contentLength >= 0:
+		#A body never has more characters than bytes, so a buffer the size of 'Content-Length' will hold all of it
+		buffer = jarray.zeros(contentLength, 'c')
+		totalRead = 0
+		while totalRead < contentLength:
+			count = bReader.read(buffer, totalRead, contentLength - totalRead)
+			if count < 0:
+				break
+			totalRead += count
+		#END WHILE
+		body = unicode(java.lang.String(buffer, 0, totalRead))
+	else:
+		buffer = jarray.zeros(READ_CHUNK_SIZE, 'c')
+		chunks = []
+		totalRead = 0
+		count = bReader.read(buffer, 0, READ_CHUNK_SIZE)
+		while count >= 0:
+			totalRead += count
+			if maxSize is not None and totalRead > maxSize:
+				raise RequestBodyTooLargeException(
+					"Request body is larger than the limit of {!s} characters".format(maxSize)
+				)
+			chunks.append(unicode(java.lang.String(buffer, 0, count)))
+			count = bReader.read(buffer, 0, READ_CHUNK_SIZE)
+		#END WHILE
+		body = u''.join(chunks)
+	#END IF/ELSE
+	logger.trace("Read {!s} characters (Content-Length was {!s})", args=(totalRead, contentLength))
+	return body
+#END DEF
+
+class JsonArrayStream(object):
+	'''
+	@CLASS	Iterates over the items of the JSON array in the body of an HTTP Servlet Request, reading the body in chunks
+			and decoding each item as soon as all of it has been read. Only the item being decoded (and the chunk it
+			ends in) is held in memory, rather than the whole body and all of the decoded items.
+	@ATTR	itemCount : Integer, the number of items returned so far
+	@ATTR	charactersRead : Integer, the number of characters of the body read so far
+	'''
+	#The only characters that matter when finding where an item ends. Everything else is part of the item.
+	STRUCTURE_REGEX = re.compile(r'["\[\]{},]')
+	STRING_REGEX = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+	
+	def __init__(self, servletRequest, maxSize=None, chunkSize=READ_CHUNK_SIZE):
+		'''
+		@FUNC	Prepares to read the body of the given request. Nothing is read until the first item is asked for.
+		@PARAM	servletRequest : HTTP Servlet Request object
+		@PARAM	maxSize : Integer/None, the largest body (see `readRequestBody`). `None` means there is no limit.
+		@PARAM	chunkSize : Integer, the number of characters to read at a time
+		@RAISES	RequestBodyTooLargeException, if the 'Content-Length' of the request is larger than `maxSize`
+		'''
+		contentLength = servletRequest.getContentLength()
+		if maxSize is not None and contentLength > maxSize:
+			raise RequestBodyTooLargeException(
+				"Request body of {!s} bytes is larger than the limit of {!s} bytes".format(contentLength, maxSize)
+			)
+		self.__reader = servletRequest.getReader()
+		self.__maxSize = maxSize
+		self.__chunk = jarray.zeros(chunkSize, 'c')
+		self.__text = u''
+		self.__position = 0
+		self.__itemStart = None
+		self.__depth = 0
+		self.__endOfBody = False
+		self.__finished = False
+		self.itemCount = 0
+		self.charactersRead = 0
+	#END DEF
+	
+	def __iter__(self):
+		return self
+	#END DEF
+	
+	def __readMore(self):
+		'''
+		@FUNC	Reads the next chunk of the body, dropping the text that has already been turned into items
+		@RETURN	Boolean, False if there was nothing left to read
+		'''
+		keepFrom = self.__position if self.__itemStart is None else self.__itemStart
+		count = self.__reader.read(self.__chunk, 0, len(self.__chunk))
+		if count < 0:
+			self.__endOfBody = True
+			return False
+		self.charactersRead += count
+		if self.__maxSize is not None and self.charactersRead > self.__maxSize:
+			raise RequestBodyTooLargeException(
+				"Request body is larger than the limit of {!s} characters".format(self.__maxSize)
+			)
+		self.__text = self.__text[keepFrom:] + unicode(java.lang.String(self.__chunk, 0, count))
+		self.__position -= keepFrom
+		if self.__itemStart is not None:
+			self.__itemStart -= keepFrom
+		return True
+	#END DEF
+	
+	def __readToEnd(self):
+		'''
+		@FUNC	Reads the rest of the body, after the end of the array, where there should be nothing but whitespace
+		@RAISES	ValueError, if anything else follows the array
+		'''
+		#Nothing after the array is kept, so every chunk can be dropped once it has been checked
+		self.__itemStart = None
+		while True:
+			if self.__text[self.__position:].strip():
+				raise ValueError("Unexpected data after the end of the JSON array in the request body")
+			self.__position = len(self.__text)
+			if not self.__readMore():
+				return
+		#END WHILE
+	#END DEF
+	
+	def __decodeItem(self, end):
+		itemText = self.__text[self.__itemStart:end].strip()
+		if not itemText:
+			raise ValueError("Empty item at index {!s} of the JSON array in the request body".format(self.itemCount))
+		try:
+			#Wrapping the item in an array, so that simple values (eg. numbers) can be decoded as well as objects
+			item = system.util.jsonDecode(u'[' + itemText + u']')[0]
+		except (ValueError, java.lang.Exception), e:
+			#On a gateway, `jsonDecode` raises a Java exception for invalid JSON
+			raise ValueError(
+				"Item at index {!s} of the JSON array in the request body is not valid JSON ({!s})".format(self.itemCount, e)
+			)
+		#END TRY/EXCEPT
+		self.itemCount += 1
+		return item
+	#END DEF
+	
+	def next(self):
+		'''
+		@FUNC	Gets the next item in the array
+		@RETURN	Object, the decoded item
+		@RAISES	StopIteration, once every item has been returned
+		@RAISES	ValueError, if the body is not a JSON array (or has more than whitespace after it)
+		@RAISES	RequestBodyTooLargeException, if the body is larger than the `maxSize` given
+		'''
+		while not self.__finished:
+			match = self.STRUCTURE_REGEX.search(self.__text, self.__position)
+			if match is None:
+				if self.__itemStart is None and self.__text[self.__position:].strip():
+					raise ValueError("The request body is not a JSON array")
+				self.__position = len(self.__text)
+				if not self.__readMore():
+					raise ValueError("The request body ended before the end of the JSON array")
+				continue
+			#END IF
+			char = match.group(0)
+			index = match.start()
+			if self.__itemStart is None:
+				#The array has not started yet, so there should be nothing but whitespace before the opening bracket
+				if char != '[' or self.__text[self.__position:index].strip():
+					raise ValueError("The request body is not a JSON array")
+				self.__position = self.__itemStart = index + 1
+			elif char == '"':
+				stringMatch = self.STRING_REGEX.match(self.__text, index)
+				if stringMatch is None:
+					#The string continues into the next chunk, so we look at it again once that has been read
+					self.__position = index
+					if not self.__readMore():
+						raise ValueError("The request body ended inside of a JSON string")
+					continue
+				self.__position = stringMatch.end()
+			elif char in '[{':
+				self.__depth += 1
+				self.__position = index + 1
+			elif char in ']}' and self.__depth > 0:
+				self.__depth -= 1
+				self.__position = index + 1
+			elif char == ',' and self.__depth > 0:
+				self.__position = index + 1
+			elif char == ',':
+				item = self.__decodeItem(index)
+				self.__position = self.__itemStart = index + 1
+				return item
+			elif char == ']':
+				self.__finished = True
+				self.__position = index + 1
+				#An empty array has no items, but `[1,]` is missing its last item
+				if self.itemCount == 0 and not self.__text[self.__itemStart:index].strip():
+					continue
+				return self.__decodeItem(index)
+			else:
+				raise ValueError("Unexpected '{!s}' in the JSON array in the request body".format(char))
+			#END IF/ELIF
+		#END WHILE
+		if not self.__endOfBody:
+			self.__readToEnd()
+		raise StopIteration
+	#END DEF
+#END CLASS
+
+
 
 class dataParsers:
 	'''
@@ -118,33 +483,29 @@ class dataParsers:
 			return isinstance(obj, types.DictionaryType)
 		#END DEF
 		@staticmethod
-		def parse(request):
+		def parse(request, maxBodySize=None, keepOriginalData=True):
 			'''
 			@FUNC	Using the given WebDev Request Python Dictionary, parses the body as JSON. Assumes that
 					the original data is still in the HTTP Servlet Request's Buffered Reader.
 			@PARAM	request : WebDev Request Python Dictionary
+			@PARAM	maxBodySize : Integer/None, the largest body that will be read (see `readRequestBody`)
+			@PARAM	keepOriginalData : Boolean, whether to return the original HTTP Body. When False, the
+						'original-data' key will be None, so that the body can be freed once it is parsed.
 			@RETURN	Python Dictionary of parsed data. Keys include:
 					- 'data' : Should be a Python Dictionary, but could be a String
-					- 'original-body' : String, the original HTTP Body
+					- 'original-data' : String/None, the original HTTP Body
+			@RAISES	RequestBodyTooLargeException, if the body is larger than `maxBodySize`
 			'''
 			logger = LIBRARY_LOGGER.getSubLogger('dataParsers.Type_JSON__parse')
 			logger.trace("Starting parsing of data as JSON")
-			bReader = request['servletRequest'].getReader() #Gets a buffered reader for the body of the request
-			body = ''
-			line = bReader.readLine()
-			while line is not None:
-				body += line+"\n"
-				line = bReader.readLine()
-			#END WHILE
-			logger.trace("Read the body as {!r}".format(body))
-			#Returning both the parsed data and the original data, in case the endpoint implementation
+			body = readRequestBody(request['servletRequest'], maxBodySize)
+			#Returning both the parsed data and the original data (if asked for), in case the endpoint implementation
 			# needs to access the original content.
 			res = {
 				'data': system.util.jsonDecode(body),
-				'original-data': body
+				'original-data': body if keepOriginalData else None
 			}
-			logger.trace("Returning {!r}".format(res))
-			logger.trace("res['data'] is {!s}".format(type(res['data'])))
+			logger.trace("res['data'] is {!s}", args=(type(res['data']),))
 			return res
 		#END DEF
 	#END CLASS
@@ -163,10 +524,12 @@ class dataParsers:
 			return True
 		#END DEF
 		@staticmethod
-		def parse(request):
+		def parse(request, maxBodySize=None, keepOriginalData=True):
 			logger = LIBRARY_LOGGER.getSubLogger('dataParsers.Type_URLEncoded__parse')
 			logger.trace("Copying URL Params, making sure keys are all strings (and not unicode)")
-			newdata = copy.deepcopy(request.get('params',{}))
+			#A shallow copy is enough, since validation only ever replaces the top-level values (a List of values is
+			# always rebuilt when it is validated)
+			newdata = dict(request.get('params',{}))
 			for key in newdata.keys():
 				if (isinstance(newdata[key], types.ListType) or
 					isinstance(newdata[key], types.TupleType)
@@ -178,10 +541,10 @@ class dataParsers:
 			logger.trace("Cleaned up URL Param keys, if necessary")
 			res = {
 				'data': newdata,
-				'original-data': request.get('params',{}),
+				'original-data': request.get('params',{}) if keepOriginalData else None,
 			}
-			logger.trace("Returning {!r}".format(res))
-			logger.trace("res['data'] is {!s}".format(type(res['data'])))
+			logger.trace("Returning {!r}", args=(res,))
+			logger.trace("res['data'] is {!s}", args=(type(res['data']),))
 			return res
 		#END DEF
 	#END CLASS
@@ -195,11 +558,12 @@ class dataParsers:
 			return isinstance(obj, types.StringTypes)
 		#END DEF
 		@staticmethod
-		def parse(request):
-			#If `parse` happens to be called, we'll just return the already-present data
+		def parse(request, maxBodySize=None, keepOriginalData=True):
+			#If `parse` happens to be called, we'll just return the already-present data. Strings can't be changed,
+			# so there is no need to copy it.
 			return {
-				'data': copy.deepcopy(request['data']),
-				'original-data': request['data'],
+				'data': request['data'],
+				'original-data': request['data'] if keepOriginalData else None,
 			}
 		#END DEF
 	#END CLASS
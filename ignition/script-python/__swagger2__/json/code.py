@@ -17,6 +17,8 @@ from com.inductiveautomation.ignition.common.script import ScriptPackage
 #Other Ignition Project Script Modules that we will use
 import server
 from __swagger2__ import requests as swagRq
+from __swagger2__ import responses as swagRsp
+from __swagger2__ import serializer as swagSer
 from __swagger2__ import globals as swagGl
 
 
@@ -105,6 +107,15 @@ def toDict(request, session):
 	swagStc = swagGl.getNamedModuleFromRoot(rootPackage, 'statics')
 	swagDf = swagGl.getNamedModuleFromRoot(rootPackage, 'definitions')
 	validEndpoints.update( getEndpoints(swagStc, rootPackage) )
+	#The regex that finds the Path Parameters in an endpoint's path (eg. '{is-x-integer-pathParam}'). It is the same
+	# for every path, so it is only built once.
+	pathParamRegex = swagGl.compileRegex(
+		'\{' +
+		'{}'.format(re.escape(swagStc.IGNITION_SWAGGER_CUSTOM_PREFIX)) +
+		'(?P<pathParamType>[a-z]+)\-'+
+		'(?P<pathParamName>[a-zA-Z0-9_\-]*)'+
+		'\}'
+	)
 	
 	pathSwag = OrderedDict()
 	for path in sorted(validEndpoints.keys()):
@@ -151,22 +162,15 @@ def toDict(request, session):
 			#Replacing the extra content that had to be added to the Script Package's name, so that we could
 			# correctly identify it as being a Path Parameter. For example, this will replace '{is-x-integer-pathParam}'
 			# with the string '{pathParam}'
-			pathParamRegex = (
-				'\{' +
-				'{}'.format(re.escape(swagStc.IGNITION_SWAGGER_CUSTOM_PREFIX)) +
-				'(?P<pathParamType>[a-z]+)\-'+
-				'(?P<pathParamName>[a-zA-Z0-9_\-]*)'+
-				'\}'
-			)
 			#We will need both the match object and the substitution string, since the substitution string is easier
 			# to build starting from the original string. The match object will allow us to build the Swagger
 			# definition for the path parameter.
-			cleanPath = re.sub(pathParamRegex, '{\g<pathParamName>}', path)
+			cleanPath = pathParamRegex.sub('{\g<pathParamName>}', path)
 			logger.trace("Original path={!r} | clean path={!r}".format(path, cleanPath))
 			
 			#Using the regex above, we need to create items in the Swagger's "parameter" key if the path
 			# defines some Path Parameters.
-			for mObj in re.finditer(pathParamRegex, path):
+			for mObj in pathParamRegex.finditer(path):
 				if 'parameters' not in endpointMethodSwagger:
 					endpointMethodSwagger['parameters'] = []
 				mGroups = mObj.groupdict()
@@ -224,37 +228,50 @@ def toDict(request, session):
 
 def toString(swagDef):
 	'''
-	@FUNC	Expecting an OrderDict, converts it into JSON manually, given that the system.util.jsonEncode
-			function does not expect an OrderedDict
+	@FUNC	Expecting an OrderDict, converts it into JSON (keeping the order of the keys), given that the
+			system.util.jsonEncode function does not expect an OrderedDict
 	@PARAM	swagDef : Ordered Dictionary, to become the Swagger JSON string
 	@RETURN	String, the JSON that is our Swagger Definition
 	'''
-	swaggerString = "{"
-	swaggerItems = []
-	def itemToString(item):
-		if isinstance(item, types.NoneType):
-			return 'null'
-		else:
-			return system.util.jsonEncode(item)
-	#END DEF
-	for key in swagDef.keys():
-		if isinstance(swagDef[key], types.DictionaryType):
-			swaggerItems.append( '"{}":{}'.format(key, toString(swagDef[key])) )
-		elif isinstance(swagDef[key], types.ListType):
-			listString = '"{}":'.format(key)
-			listItems = []
-			for listItem in swagDef[key]:
-				if isinstance(listItem, types.DictionaryType):
-					listItems.append(toString(listItem))
-				else:
-					listItems.append(itemToString(listItem))
-			#END FOR
-			listString += '[{}]'.format(','.join(listItems))
-			swaggerItems.append( listString )
-		else:
-			swaggerItems.append( ('"{}":'.format(key)) + itemToString(swagDef[key]) )
-	#END FOR
-	swaggerString += ','.join(swaggerItems)
-	swaggerString += "}"
-	return swaggerString
+	return swagSer.dumps(swagDef)
+#END DEF
+
+#Generated Swagger documents, keyed by the name of the root Script Package. Saving the project reloads every Script
+# Module (clearing this cache), but we also check the identity of the root package in case the document outlives it.
+_SWAGGER_DOCUMENT_CACHE = {}
+
+def getSwaggerDocument(request, session):
+	'''
+	@FUNC	Gets the Swagger JSON string for the root Script Package of the request, generating it (with `toDict` and
+			`toString`) only if it has not been generated since the project scripts were last saved.
+	@PARAM	request : WebDev Request object
+	@PARAM	session : WebDev Session object
+	@RETURN	Python Dictionary, with the following keys:
+			 - 'body' : String, the Swagger JSON
+			 - 'etag' : String, the quoted (strong) Entity Tag of the Swagger JSON
+			 - 'rootPackage' : Script Package Object the document was generated for
+	'''
+	logger = LIBRARY_LOGGER.getSubLogger("getSwaggerDocument")
+	rootPackage = swagGl.getRootPackage(request)
+	document = _SWAGGER_DOCUMENT_CACHE.get(rootPackage.__name__, None)
+	if document is not None and document['rootPackage'] is rootPackage:
+		logger.trace("Using cached Swagger for '{!s}' (ETag {!s})", args=(rootPackage.__name__, document['etag']))
+		return document
+	
+	body = toString(toDict(request, session))
+	document = {
+		'body': body,
+		'etag': swagRsp.makeEntityTag(body),
+		'rootPackage': rootPackage,
+	}
+	_SWAGGER_DOCUMENT_CACHE[rootPackage.__name__] = document
+	logger.debug("Generated Swagger for '{!s}' (ETag {!s})".format(rootPackage.__name__, document['etag']))
+	return document
+#END DEF
+
+def clearSwaggerDocumentCache():
+	'''
+	@FUNC	Forgets every generated Swagger document, so they are generated again on the next request
+	'''
+	_SWAGGER_DOCUMENT_CACHE.clear()
 #END DEF
\ No newline at end of file
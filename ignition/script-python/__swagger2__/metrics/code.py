@@ -0,0 +1,455 @@
+'''
+	This script contains the in-memory metrics of the request pipeline. Each request is timed stage by stage (URI
+	augmentation, routing, parsing the content, authentication, validation, the endpoint's logic, ...), and the times
+	are aggregated into latency histograms for each endpoint (route) and HTTP Method.
+'''
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# IMPORTS
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+import bisect
+import threading
+from collections import OrderedDict
+from java.lang import System
+from java.util.concurrent.atomic import AtomicLong, AtomicLongArray
+#Other Ignition Project Script Modules that we will use
+import server
+from __swagger2__ import globals as swagGl
+from __swagger2__ import accesslog as swagAcc
+from __swagger2__ import cache as swagCch
+
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# LOGGER and CONSTANTS
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+LIBRARY_LOGGER = server.getLogger("IgnitionSwagger2.metrics")
+
+#The stages of handling a request, in the order they happen. 'total' is the time from receiving the request to
+# having the response ready.
+STAGES = [
+	'uri', 'routing', 'parse', 'signatures', 'authentication', 'cache', 'request-validation', 'logic',
+	'response-validation', 'compression', 'logging',
+]
+TOTAL_STAGE = 'total'
+#The route recorded for requests that did not match an endpoint
+UNMATCHED_ROUTE = '(unmatched)'
+
+#The upper bounds (in milliseconds) of the histogram buckets. Every histogram has one more bucket, for the times
+# larger than the last bound.
+HISTOGRAM_BUCKETS = [0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+#The upper bounds (in bytes) of the buckets of the request body size histograms
+BODY_SIZE_BUCKETS = [256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216, 67108864]
+PERCENTILES = OrderedDict([('p50', 0.50), ('p95', 0.95), ('p99', 0.99)])
+
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# HISTOGRAMS
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+class Histogram(object):
+	'''
+	@CLASS	A histogram with fixed buckets, of latencies (in milliseconds) unless it is given other bounds. The counters
+			are Java atomics, so recording a value and reading the histogram never wait on a lock.
+	@ATTR	bounds : List of Numbers, the upper bounds of the buckets
+	'''
+	def __init__(self, bounds=HISTOGRAM_BUCKETS):
+		self.bounds = bounds
+		self.__bucketCounts = AtomicLongArray(len(bounds)+1)
+		self.__count = AtomicLong(0)
+		self.__sumMicroseconds = AtomicLong(0)
+	#END DEF
+	
+	def record(self, milliseconds):
+		'''
+		@FUNC	Adds a time to the histogram
+		@PARAM	milliseconds : Float
+		'''
+		#A time equal to a bound belongs in that bound's bucket
+		self.__bucketCounts.incrementAndGet(bisect.bisect_left(self.bounds, milliseconds))
+		self.__sumMicroseconds.addAndGet(long(milliseconds * 1000))
+		self.__count.incrementAndGet()
+	#END DEF
+	
+	def count(self):
+		'''
+		@FUNC	Gets the number of times recorded
+		@RETURN	Integer
+		'''
+		return self.__count.get()
+	#END DEF
+	
+	def sum(self):
+		'''
+		@FUNC	Gets the sum of the times recorded
+		@RETURN	Float, in milliseconds
+		'''
+		return self.__sumMicroseconds.get() / 1000.0
+	#END DEF
+	
+	def bucketCounts(self):
+		'''
+		@FUNC	Gets the number of times recorded in each bucket (not cumulative)
+		@RETURN	List of Integers, one more than the number of bounds
+		'''
+		return [self.__bucketCounts.get(i) for i in range(len(self.bounds)+1)]
+	#END DEF
+	
+	def percentile(self, fraction, bucketCounts=None):
+		'''
+		@FUNC	Estimates a percentile of the times recorded, by interpolating within the bucket that holds it
+		@PARAM	fraction : Float, between 0 and 1 (eg. 0.95 for the 95th percentile)
+		@PARAM	bucketCounts : List/None, counts from `bucketCounts`, so several percentiles can be estimated
+					from the same reading of the histogram [DEFAULT: None]
+		@RETURN	Float/None, in milliseconds. None if nothing has been recorded.
+		'''
+		if bucketCounts is None:
+			bucketCounts = self.bucketCounts()
+		total = sum(bucketCounts)
+		if total == 0:
+			return None
+		rank = fraction * total
+		cumulative = 0
+		for i, bucketCount in enumerate(bucketCounts):
+			if bucketCount > 0 and cumulative + bucketCount >= rank:
+				lower = self.bounds[i-1] if i > 0 else 0.0
+				#There is no upper bound for the last bucket, so the best estimate is its lower bound
+				if i == len(self.bounds):
+					return float(lower)
+				return lower + (self.bounds[i] - lower) * ((rank - cumulative) / float(bucketCount))
+			cumulative += bucketCount
+		#END FOR
+		return float(self.bounds[-1])
+	#END DEF
+	
+	def snapshot(self):
+		'''
+		@FUNC	Gets a summary of the histogram
+		@RETURN	OrderedDict, with the keys 'count', 'sum-ms', 'p50', 'p95', and 'p99' (the percentiles are in milliseconds)
+		'''
+		bucketCounts = self.bucketCounts()
+		summary = OrderedDict([('count', sum(bucketCounts)), ('sum-ms', round(self.sum(), 3))])
+		for name, fraction in PERCENTILES.items():
+			value = self.percentile(fraction, bucketCounts)
+			summary[name] = round(value, 3) if value is not None else None
+		return summary
+	#END DEF
+#END CLASS
+
+class RouteMetrics(object):
+	'''
+	@CLASS	The metrics of a single endpoint (route) and HTTP Method
+	@ATTR	route : String, the full name of the endpoint's Script Package (eg. 'v1.petstore.pet.is-x-integer-petId')
+	@ATTR	method : String, the HTTP Method
+	@ATTR	stages : OrderedDict, mapping each stage (and 'total') to its Histogram
+	@ATTR	requestSizes : Histogram, of the sizes (in bytes) of the request bodies
+	'''
+	def __init__(self, route, method):
+		self.route = route
+		self.method = method
+		self.stages = OrderedDict([(stage, Histogram()) for stage in STAGES + [TOTAL_STAGE]])
+		self.requestSizes = Histogram(BODY_SIZE_BUCKETS)
+		self.__requests = AtomicLong(0)
+		self.__errors = AtomicLong(0)
+		self.__authFailures = AtomicLong(0)
+		self.__validationFailures = AtomicLong(0)
+	#END DEF
+	
+	def record(self, stageTimes, totalTime, isError, authFailed=False, validationFailed=False, requestSize=None):
+		'''
+		@FUNC	Adds the times (and outcome) of a single request
+		@PARAM	stageTimes : Dictionary, mapping a stage to its time (in milliseconds). Stages the request did not
+					reach are left out.
+		@PARAM	totalTime : Float, in milliseconds
+		@PARAM	isError : Boolean, whether the request ended in a server error
+		@PARAM	authFailed : Boolean, whether the request failed authentication [DEFAULT: False]
+		@PARAM	validationFailed : Boolean, whether the request data failed validation [DEFAULT: False]
+		@PARAM	requestSize : Integer/None, the size (in bytes) of the request body, if known [DEFAULT: None]
+		'''
+		for stage, milliseconds in stageTimes.items():
+			histogram = self.stages.get(stage, None)
+			if histogram is not None:
+				histogram.record(milliseconds)
+		#END FOR
+		self.stages[TOTAL_STAGE].record(totalTime)
+		if requestSize is not None and requestSize >= 0:
+			self.requestSizes.record(requestSize)
+		self.__requests.incrementAndGet()
+		if isError:
+			self.__errors.incrementAndGet()
+		if authFailed:
+			self.__authFailures.incrementAndGet()
+		if validationFailed:
+			self.__validationFailures.incrementAndGet()
+	#END DEF
+	
+	def requests(self):
+		return self.__requests.get()
+	#END DEF
+	
+	def errors(self):
+		return self.__errors.get()
+	#END DEF
+	
+	def authFailures(self):
+		return self.__authFailures.get()
+	#END DEF
+	
+	def validationFailures(self):
+		return self.__validationFailures.get()
+	#END DEF
+	
+	def snapshot(self):
+		'''
+		@FUNC	Gets a summary of the metrics
+		@RETURN	OrderedDict, with the keys 'route', 'method', 'requests', 'errors', 'auth-failures',
+				'validation-failures', and 'stages' (mapping each stage the requests have reached to the summary of
+				its Histogram, see `Histogram.snapshot`)
+		'''
+		return OrderedDict([
+			('route', self.route),
+			('method', self.method),
+			('requests', self.requests()),
+			('errors', self.errors()),
+			('auth-failures', self.authFailures()),
+			('validation-failures', self.validationFailures()),
+			('stages', OrderedDict([
+				(stage, histogram.snapshot()) for stage, histogram in self.stages.items() if histogram.count() > 0
+			])),
+		])
+	#END DEF
+#END CLASS
+
+#The metrics of every route and HTTP Method that has received a request, keyed by (route, method). Saving the
+# project scripts reloads this module, which starts the metrics over.
+_ROUTE_METRICS = {}
+_ROUTE_METRICS_LOCK = threading.Lock()
+
+def getRouteMetrics(route, method):
+	'''
+	@FUNC	Gets the metrics for the given route and HTTP Method, creating them the first time they are needed
+	@PARAM	route : String/None, the full name of the endpoint's Script Package. None for requests that did not
+				match an endpoint.
+	@PARAM	method : String, the HTTP Method
+	@RETURN	RouteMetrics object
+	'''
+	key = (route if route is not None else UNMATCHED_ROUTE, method)
+	routeMetrics = _ROUTE_METRICS.get(key, None)
+	if routeMetrics is None:
+		with _ROUTE_METRICS_LOCK:
+			routeMetrics = _ROUTE_METRICS.get(key, None)
+			if routeMetrics is None:
+				routeMetrics = RouteMetrics(key[0], key[1])
+				_ROUTE_METRICS[key] = routeMetrics
+	#END IF
+	return routeMetrics
+#END DEF
+
+def getAllRouteMetrics():
+	'''
+	@FUNC	Gets the metrics of every route and HTTP Method that has received a request
+	@RETURN	List of RouteMetrics objects, sorted by route and HTTP Method
+	'''
+	return [_ROUTE_METRICS[key] for key in sorted(_ROUTE_METRICS.keys())]
+#END DEF
+
+def getMetricsSnapshot():
+	'''
+	@FUNC	Gets a summary of the metrics of every route and HTTP Method
+	@RETURN	List of OrderedDicts, see `RouteMetrics.snapshot`
+	'''
+	return [routeMetrics.snapshot() for routeMetrics in getAllRouteMetrics()]
+#END DEF
+
+def clearMetrics():
+	'''
+	@FUNC	Starts all of the metrics over
+	'''
+	with _ROUTE_METRICS_LOCK:
+		_ROUTE_METRICS.clear()
+#END DEF
+
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# TIMING A REQUEST
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+class StageTimer(object):
+	'''
+	@CLASS	Times the stages of a single request, using the high resolution Java timer
+	@ATTR	startTime : Integer, when the timer was created (in nanoseconds, see `System.nanoTime`)
+	@ATTR	stageTimes : OrderedDict, mapping each stage timed to its time (in milliseconds). The times of a stage
+				that is timed more than once are added together.
+	@ATTR	profile : profiler.RequestProfile object/None, set when the endpoint is profiled. The stages are then run
+				through the profile, so that the sampled ones are run under the Python profiler.
+	'''
+	def __init__(self):
+		self.startTime = System.nanoTime()
+		self.stageTimes = OrderedDict()
+		self.profile = None
+	#END DEF
+	
+	def time(self, stage, func, *args, **kwargs):
+		'''
+		@FUNC	Calls the given function, adding the time it takes to the given stage (even if it raises an exception)
+		@PARAM	stage : String, see `STAGES`
+		@PARAM	func : Function
+		@PARAM	*args, **kwargs : the arguments for the function
+		@RETURN	Object, what the function returns
+		'''
+		start = System.nanoTime()
+		try:
+			if self.profile is not None:
+				return self.profile.run(stage, func, *args, **kwargs)
+			return func(*args, **kwargs)
+		finally:
+			self.add(stage, (System.nanoTime() - start) / 1000000.0)
+	#END DEF
+	
+	def add(self, stage, milliseconds):
+		'''
+		@FUNC	Adds time to a stage
+		@PARAM	stage : String, see `STAGES`
+		@PARAM	milliseconds : Float
+		'''
+		self.stageTimes[stage] = self.stageTimes.get(stage, 0.0) + milliseconds
+	#END DEF
+	
+	def elapsed(self):
+		'''
+		@FUNC	Gets the time since the timer was created
+		@RETURN	Float, in milliseconds
+		'''
+		return (System.nanoTime() - self.startTime) / 1000000.0
+	#END DEF
+#END CLASS
+
+def recordRequest(route, method, timer, status, authenticated=None, requestValid=None, requestSize=None):
+	'''
+	@FUNC	Adds the stage times (and outcome) of a handled request to the metrics of its route and HTTP Method
+	@PARAM	route : String/None, the full name of the endpoint's Script Package
+	@PARAM	method : String, the HTTP Method
+	@PARAM	timer : StageTimer object, of the request
+	@PARAM	status : Integer, the HTTP Status of the response. Statuses of 500 and above are counted as errors.
+	@PARAM	authenticated : Boolean/None, whether the request passed authentication (None if it was not attempted)
+	@PARAM	requestValid : Boolean/None, whether the request data passed validation (None if it was not attempted)
+	@PARAM	requestSize : Integer/None, the size of the request body (the 'Content-Length'), -1 or None if unknown
+	'''
+	getRouteMetrics(route, method).record(
+		timer.stageTimes, timer.elapsed(), status >= 500,
+		authFailed = authenticated is False,
+		validationFailed = requestValid is False,
+		requestSize = requestSize
+	)
+#END DEF
+
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# PROMETHEUS EXPOSITION FORMAT
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+#All of the metric names start with this prefix
+PROMETHEUS_PREFIX = 'ignition_swagger_'
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+def _escapeLabelValue(value):
+	return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+#END DEF
+
+def _formatLabels(labels):
+	return '{' + ','.join(['{!s}="{!s}"'.format(name, _escapeLabelValue(value)) for name, value in labels]) + '}'
+#END DEF
+
+def _formatNumber(value):
+	if isinstance(value, float):
+		#Rounding away the floating point noise (eg. 2.1000000000000002e-05) from converting to seconds
+		return repr(round(value, 9))
+	return str(value)
+#END DEF
+
+def _formatSample(name, labels, value):
+	if labels:
+		return '{!s}{!s}{!s} {!s}'.format(PROMETHEUS_PREFIX, name, _formatLabels(labels), _formatNumber(value))
+	return '{!s}{!s} {!s}'.format(PROMETHEUS_PREFIX, name, _formatNumber(value))
+#END DEF
+
+def _writeHeader(lines, name, metricType, description):
+	lines.append('# HELP {!s}{!s} {!s}'.format(PROMETHEUS_PREFIX, name, description))
+	lines.append('# TYPE {!s}{!s} {!s}'.format(PROMETHEUS_PREFIX, name, metricType))
+#END DEF
+
+def _writeHistogram(lines, name, labels, histogram, scale):
+	#Prometheus histograms have cumulative buckets, and by convention are in base units (seconds, bytes)
+	cumulative = 0
+	bucketCounts = histogram.bucketCounts()
+	for bound, bucketCount in zip(histogram.bounds, bucketCounts):
+		cumulative += bucketCount
+		lines.append(_formatSample(name+'_bucket', labels + [('le', _formatNumber(bound * scale))], cumulative))
+	#END FOR
+	cumulative += bucketCounts[-1]
+	lines.append(_formatSample(name+'_bucket', labels + [('le', '+Inf')], cumulative))
+	lines.append(_formatSample(name+'_sum', labels, histogram.sum() * scale))
+	lines.append(_formatSample(name+'_count', labels, cumulative))
+#END DEF
+
+def renderPrometheus():
+	'''
+	@FUNC	Renders the metrics of every route and HTTP Method (along with the cache and access log counters) in the
+			Prometheus text exposition format. Only the atomic counters are read, so this never blocks a request.
+	@RETURN	String
+	'''
+	allRouteMetrics = getAllRouteMetrics()
+	lines = []
+	
+	counters = [
+		('requests_total', 'Requests handled, by route and HTTP Method', lambda rm: rm.requests()),
+		('errors_total', 'Requests that ended in a server error (5xx)', lambda rm: rm.errors()),
+		('auth_failures_total', 'Requests that failed authentication', lambda rm: rm.authFailures()),
+		('validation_failures_total', 'Requests whose data failed validation', lambda rm: rm.validationFailures()),
+	]
+	for name, description, getValue in counters:
+		_writeHeader(lines, name, 'counter', description)
+		for routeMetrics in allRouteMetrics:
+			labels = [('route', routeMetrics.route), ('method', routeMetrics.method)]
+			lines.append(_formatSample(name, labels, getValue(routeMetrics)))
+	#END FOR
+	
+	_writeHeader(lines, 'stage_duration_seconds', 'histogram', 'Time spent in each stage of handling a request')
+	for routeMetrics in allRouteMetrics:
+		for stage, histogram in routeMetrics.stages.items():
+			if histogram.count() > 0:
+				labels = [('route', routeMetrics.route), ('method', routeMetrics.method), ('stage', stage)]
+				_writeHistogram(lines, 'stage_duration_seconds', labels, histogram, 0.001)
+	#END FOR
+	
+	_writeHeader(lines, 'request_body_bytes', 'histogram', 'Size of the request bodies (when Content-Length is given)')
+	for routeMetrics in allRouteMetrics:
+		if routeMetrics.requestSizes.count() > 0:
+			labels = [('route', routeMetrics.route), ('method', routeMetrics.method)]
+			_writeHistogram(lines, 'request_body_bytes', labels, routeMetrics.requestSizes, 1)
+	#END FOR
+	
+	cacheStats = OrderedDict([('regex', swagGl.getRegexCacheStats()), ('response', swagCch.getCacheStats())])
+	for name, key, metricType, description in [
+		('cache_hits_total', 'hits', 'counter', 'Lookups that found a cached item'),
+		('cache_misses_total', 'misses', 'counter', 'Lookups that did not find a cached item'),
+		('cache_evictions_total', 'evictions', 'counter', 'Items removed from a cache to make room for new items'),
+		('cache_size', 'size', 'gauge', 'Items currently cached'),
+	]:
+		_writeHeader(lines, name, metricType, description)
+		for cacheName, stats in cacheStats.items():
+			lines.append(_formatSample(name, [('cache', cacheName)], stats[key]))
+	#END FOR
+	
+	accessLogStats = swagAcc.getAccessLogStats()
+	if accessLogStats is not None:
+		_writeHeader(lines, 'access_log_events_total', 'counter', 'Access log events, by what happened to them')
+		for outcome in ('recorded', 'dropped', 'written'):
+			lines.append(_formatSample('access_log_events_total', [('outcome', outcome)], accessLogStats[outcome]))
+		_writeHeader(lines, 'access_log_sink_errors_total', 'counter', 'Batches an access log sink failed to write')
+		lines.append(_formatSample('access_log_sink_errors_total', None, accessLogStats['sinkErrors']))
+		_writeHeader(lines, 'access_log_queue_size', 'gauge', 'Access log events waiting to be written')
+		lines.append(_formatSample('access_log_queue_size', None, accessLogStats['queued']))
+	#END IF
+	return '\n'.join(lines) + '\n'
+#END DEF
\ No newline at end of file
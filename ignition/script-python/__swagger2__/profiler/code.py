@@ -0,0 +1,247 @@
+'''
+	This script contains the sampling profiler for slow requests. An endpoint (or every endpoint, through the statics)
+	can ask for 1-in-N of its requests to have the endpoint's logic and the validation run under the Python profiler,
+	and for any request slower than a threshold to have its stage times recorded. The last few profiles are kept in
+	memory, so they can be looked at without turning on TRACE logging.
+'''
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# IMPORTS
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+import types
+import threading
+import pstats
+from collections import OrderedDict, deque
+from java.util.concurrent.atomic import AtomicLong
+try:
+	import cProfile as profileModule
+except ImportError:
+	#Not every Python (including some versions of Jython) has the C profiler, but they all have the pure Python one
+	import profile as profileModule
+#Other Ignition Project Script Modules that we will use
+import server
+
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# LOGGER and CONSTANTS
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+LIBRARY_LOGGER = server.getLogger("IgnitionSwagger2.profiler")
+
+#The settings used for anything an endpoint's (or the statics') profile settings leave out
+#	- sampleRate : Integer, profile 1 in this many requests. 0 never profiles a request.
+#	- slowThreshold : Number/None, record the stage times of any request that takes at least this many milliseconds
+#	- frames : Integer, the number of functions (with the largest cumulative time) kept from each profile
+DEFAULT_PROFILE_SETTINGS = {
+	'sampleRate': 0,
+	'slowThreshold': None,
+	'frames': 20,
+}
+DEFAULT_BUFFER_SIZE = 50
+
+#The stages that are run under the profiler of a sampled request, and which part of the profile they belong to
+PROFILED_STAGES = {
+	'logic': 'logic',
+	'request-validation': 'validation',
+	'response-validation': 'validation',
+}
+
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# PROFILING A REQUEST
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+def getProfileSettings(endpointSetting, globalSetting):
+	'''
+	@FUNC	Works out the profile settings for an endpoint
+	@PARAM	endpointSetting : Boolean/Dictionary/None, the endpoint's custom 'profile' SWAGGER key. `True` uses the
+				global settings (or the defaults), `False` turns profiling off, and a Dictionary is merged over the
+				global settings.
+	@PARAM	globalSetting : Dictionary/None, the `PROFILE` of the statics module
+	@RETURN	Python Dictionary/None, the settings (see `DEFAULT_PROFILE_SETTINGS`). None if the endpoint is not profiled.
+	'''
+	if endpointSetting is False or (endpointSetting is None and not globalSetting):
+		return None
+	settings = dict(DEFAULT_PROFILE_SETTINGS)
+	if isinstance(globalSetting, types.DictionaryType):
+		settings.update(globalSetting)
+	if isinstance(endpointSetting, types.DictionaryType):
+		settings.update(endpointSetting)
+	if not settings['sampleRate'] and settings['slowThreshold'] is None:
+		return None
+	return settings
+#END DEF
+
+#Counts the requests to profiled endpoints, so that every N-th one can be sampled
+_SAMPLE_COUNTER = AtomicLong(0)
+
+class RequestProfile(object):
+	'''
+	@CLASS	The profile of a single request. When the request is sampled, the stages in `PROFILED_STAGES` are run
+			under the Python profiler (see `metrics.StageTimer.time`).
+	@ATTR	settings : Python Dictionary, see `getProfileSettings`
+	@ATTR	sampled : Boolean, whether the request is run under the profiler
+	@ATTR	profilers : Python Dictionary, mapping each part of the profile ('logic', 'validation') to its profiler
+	'''
+	def __init__(self, settings):
+		self.settings = settings
+		sampleRate = settings['sampleRate']
+		self.sampled = bool(sampleRate) and _SAMPLE_COUNTER.incrementAndGet() % sampleRate == 0
+		self.profilers = {}
+	#END DEF
+	
+	def run(self, stage, func, *args, **kwargs):
+		'''
+		@FUNC	Calls the given function, under the profiler if the request is sampled and the stage is profiled
+		@PARAM	stage : String, see `metrics.STAGES`
+		@PARAM	func : Function
+		@PARAM	*args, **kwargs : the arguments for the function
+		@RETURN	Object, what the function returns
+		'''
+		part = PROFILED_STAGES.get(stage, None)
+		if not self.sampled or part is None:
+			return func(*args, **kwargs)
+		profiler = self.profilers.get(part, None)
+		if profiler is None:
+			profiler = profileModule.Profile()
+			self.profilers[part] = profiler
+		return profiler.runcall(func, *args, **kwargs)
+	#END DEF
+	
+	def topFrames(self, part):
+		'''
+		@FUNC	Gets the functions that took the most cumulative time in a part of the profile
+		@PARAM	part : String, 'logic' or 'validation'
+		@RETURN	List of OrderedDicts, with the keys 'function', 'calls', 'total-ms', and 'cumulative-ms'
+		'''
+		profiler = self.profilers.get(part, None)
+		if profiler is None:
+			return []
+		stats = pstats.Stats(profiler).stats
+		frames = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:self.settings['frames']]
+		return [
+			OrderedDict([
+				('function', "{!s}:{!s}({!s})".format(*function)),
+				('calls', callCount),
+				('total-ms', round(totalTime * 1000.0, 3)),
+				('cumulative-ms', round(cumulativeTime * 1000.0, 3)),
+			])
+			for function, (primitiveCallCount, callCount, totalTime, cumulativeTime, callers) in frames
+		]
+	#END DEF
+#END CLASS
+
+def startProfile(endpointSetting, globalSetting):
+	'''
+	@FUNC	Starts the profile of a request to an endpoint, if the endpoint is profiled
+	@PARAM	endpointSetting : see `getProfileSettings`
+	@PARAM	globalSetting : see `getProfileSettings`
+	@RETURN	RequestProfile object/None
+	'''
+	settings = getProfileSettings(endpointSetting, globalSetting)
+	if settings is None:
+		return None
+	return RequestProfile(settings)
+#END DEF
+
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# KEEPING THE LAST PROFILES
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+class ProfileBuffer(object):
+	'''
+	@CLASS	A thread-safe ring buffer of the most recent profiles
+	@ATTR	maxSize : Integer, the most profiles kept. Adding another drops the oldest.
+	'''
+	def __init__(self, maxSize=DEFAULT_BUFFER_SIZE):
+		self.maxSize = maxSize
+		self.__profiles = deque(maxlen=maxSize)
+		self.__lock = threading.Lock()
+	#END DEF
+	
+	def add(self, profile):
+		with self.__lock:
+			self.__profiles.append(profile)
+	#END DEF
+	
+	def resize(self, maxSize):
+		'''
+		@FUNC	Changes the most profiles kept, keeping the newest of the profiles already in the buffer
+		@PARAM	maxSize : Integer
+		'''
+		with self.__lock:
+			if maxSize != self.maxSize:
+				self.maxSize = maxSize
+				self.__profiles = deque(self.__profiles, maxlen=maxSize)
+	#END DEF
+	
+	def getProfiles(self):
+		'''
+		@FUNC	Gets the profiles kept, newest first
+		@RETURN	List of OrderedDicts, see `finishProfile`
+		'''
+		with self.__lock:
+			return list(reversed(self.__profiles))
+	#END DEF
+	
+	def clear(self):
+		with self.__lock:
+			self.__profiles.clear()
+	#END DEF
+#END CLASS
+
+#Saving the project scripts reloads this module, which starts the buffer over
+PROFILE_BUFFER = ProfileBuffer()
+
+def finishProfile(requestProfile, wdr, timer, status, bufferSize=DEFAULT_BUFFER_SIZE):
+	'''
+	@FUNC	Keeps the profile of a handled request, if it was sampled or slower than the threshold
+	@PARAM	requestProfile : RequestProfile object
+	@PARAM	wdr : WebDevRequest object
+	@PARAM	timer : StageTimer object, of the request
+	@PARAM	status : Integer, the HTTP Status of the response
+	@PARAM	bufferSize : Integer, the most profiles kept (see `PROFILE_BUFFER_SIZE` of the statics module)
+	@RETURN	Boolean, whether the profile was kept
+	'''
+	totalTime = timer.elapsed()
+	slowThreshold = requestProfile.settings['slowThreshold']
+	isSlow = slowThreshold is not None and totalTime >= slowThreshold
+	if not (requestProfile.sampled or isSlow):
+		return False
+	LIBRARY_LOGGER.getSubLogger('finishProfile').debug(
+		"Keeping profile of {!s} request to {!r} ({!s} ms)",
+		args=('sampled' if requestProfile.sampled else 'slow', wdr.accessInfo['route'], round(totalTime, 3))
+	)
+	PROFILE_BUFFER.resize(bufferSize)
+	PROFILE_BUFFER.add(OrderedDict([
+		('timestamp', server.timeInMilli()),
+		('route', wdr.accessInfo['route']),
+		('method', wdr.swag['original-http-method']),
+		('uri', wdr.request['servletRequest'].getRequestURI()),
+		('status', status),
+		('total-ms', round(totalTime, 3)),
+		('reason', 'sampled' if requestProfile.sampled else 'slow'),
+		('stages', OrderedDict([(stage, round(ms, 3)) for stage, ms in timer.stageTimes.items()])),
+		('frames', OrderedDict([
+			('logic', requestProfile.topFrames('logic')),
+			('validation', requestProfile.topFrames('validation')),
+		])),
+	]))
+	return True
+#END DEF
+
+def getProfiles():
+	'''
+	@FUNC	Gets the profiles kept, newest first
+	@RETURN	List of OrderedDicts
+	'''
+	return PROFILE_BUFFER.getProfiles()
+#END DEF
+
+def clearProfiles():
+	'''
+	@FUNC	Forgets every profile kept
+	'''
+	PROFILE_BUFFER.clear()
+#END DEF
\ No newline at end of file
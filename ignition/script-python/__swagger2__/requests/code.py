@@ -1,6 +1,6 @@
 '''
 	This script contains the logic that translates a request to a WebDev Resource into an execution of a Script Resource.
-
+	
 	The function `processRequest` is what parses the Request and ends up with a reference to a Script Resource to execute.
 	Every Script Resource should implement a class, `Endpoint`, which needs to inherit the class `BaseEndpoint`
 	defined in this library.
@@ -11,6 +11,7 @@
 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 import system
 import sys
+import time
 import types
 import re
 import copy
@@ -26,7 +27,13 @@ from com.inductiveautomation.ignition.common.script import ScriptPackage
 #Other Ignition Project Script Modules that we will use
 import server
 from __swagger2__ import responses as swagRsp
+from __swagger2__ import serializer as swagSer
 from __swagger2__ import globals as swagGl
+from __swagger2__ import accesslog as swagAcc
+from __swagger2__ import metrics as swagMet
+from __swagger2__ import profiler as swagPrf
+from __swagger2__ import cache as swagCch
+from __swagger2__ import compression as swagCmp
 
 
 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
@@ -45,6 +52,10 @@ class CustomExceptions:
 		pass
 	class InvalidRequestBodyException(WebDevRequestException):
 		pass
+	class InvalidStreamedItemException(InvalidRequestBodyException):
+		pass
+	#Raised by the body parsers in `__swagger2__.globals`, which cannot import this module
+	RequestBodyTooLargeException = swagGl.RequestBodyTooLargeException
 	class InvalidHTTPMethodException(WebDevRequestException):
 		pass
 	class InvalidContentTypeException(WebDevRequestException):
@@ -85,6 +96,10 @@ class WebDevRequest(object):
 	@ATTR	swag : Python Dictionary, the cleaned up incoming request
 	@ATTR	requestAugmentations : Python Dictionary, the extended attributes that have been added
 				to the `request` attribute.
+	@ATTR	accessInfo : Python Dictionary, what is learned about the request while it is handled (the 'route',
+				'authenticated', 'auth-method', 'request-valid' and 'response-valid'), for the access log and the
+				metrics. See `accesslog.buildEvent`.
+	@ATTR	timer : StageTimer object, timing the stages of handling the request. See `metrics.StageTimer`.
 	@ATTR	logger : Gateway Logger object, based on the WebDev Request's URI Path. This variable will be
 				initalized during the `processRequest` function.
 	'''
@@ -100,12 +115,16 @@ class WebDevRequest(object):
 	}
 	
 	
-	def __init__(self, request, session):
+	def __init__(self, request, session, timer=None):
 		self.request = request
 		self.session = session
 		self.swag = {}
 		self.requestAugmentations = {k:False for k in self.REQUEST_AUGMENTATIONS_DEPENDENCIES.keys()}
-
+		self.accessInfo = {
+			'route': None, 'authenticated': None, 'auth-method': None, 'request-valid': None, 'response-valid': None,
+		}
+		self.timer = timer if timer is not None else swagMet.StageTimer()
+		
 		#We will always execute this parsing during initialization, as the information is used later in may other places
 		self.augmentRequestHeaders()
 		self.augmentRequestHTTPMethod()
@@ -121,38 +140,75 @@ class WebDevRequest(object):
 	#END DEF
 	
 	
-	def _copyDictWithStringKeys(self, oldDict):
+	def _useDictWithStringKeys(self, data):
 		'''
-		@FUNC	Copy the dictionary given, but make sure that the keys are all of type String, not Unicode
-		@PARAM	oldDict : Python Dictionary
-		@RETURN	Python Dictionary
+		@FUNC	Makes sure that the keys of the given dictionary (and every dictionary nested in it) are of type String,
+				not Unicode. The keys are replaced in place, rather than copying the dictionaries, so only the keys that
+				are actually Unicode cost anything.
+		@PARAM	data : Python Dictionary (or List). Anything else is returned as is.
+		@RETURN	The given object
 		'''
-		if not isinstance(oldDict, types.DictionaryType):
-			return oldDict
-		oldCopy = copy.deepcopy(oldDict)
-		newDict = {str(k):oldCopy[k] for k in oldCopy}
-		for k in newDict:
-			if isinstance(newDict[k], types.DictionaryType):
-				newDict[k] = self._copyDictWithStringKeys(newDict[k])
-			if isinstance(newDict[k], types.ListType):
-				newDict[k] = [self._copyDictWithStringKeys(v) for v in newDict[k]]
-		return newDict
+		if isinstance(data, types.DictionaryType):
+			for k in data.keys():
+				value = data[k]
+				if isinstance(k, types.UnicodeType):
+					try:
+						strKey = str(k)
+					except UnicodeEncodeError:
+						#A key that can't be a plain String is left as Unicode
+						strKey = k
+					if strKey is not k:
+						del data[k]
+						data[strKey] = value
+				#END IF
+				if isinstance(value, (types.DictionaryType, types.ListType)):
+					self._useDictWithStringKeys(value)
+			#END FOR
+		elif isinstance(data, types.ListType):
+			for value in data:
+				if isinstance(value, (types.DictionaryType, types.ListType)):
+					self._useDictWithStringKeys(value)
+		#END IF/ELIF
+		return data
+	#END DEF
+	
+	def getReceiptRecord(self):
+		'''
+		@FUNC	Gets some basic information about the HTTP request, as it was received
+		@RETURN	Python Dictionary, with the keys 'timestamp' (milliseconds since the epoch), 'method', 'real-method',
+				'sent-to' (the name of the Gateway), 'from-ip', 'uri', and 'session'
+		'''
+		return {
+			'timestamp': server.timeInMilli(),
+			'method': self.swag['original-http-method'],
+			'real-method': self.swag['http-method'],
+			'sent-to': swagGl.getGatewayName(),
+			'from-ip': self.swag['headers-lc'].get('x-real-ip', self.request['remoteAddr']),
+			'uri': self.request['servletRequest'].getRequestURI(),
+			'session': self.session,
+		}
 	#END DEF
 	
 	def logInitialReceipt(self):
 		'''
-		@FUNC	Creates a log message containing some basic information about the HTTP request
+		@FUNC	Creates a log message containing some basic information about the HTTP request. The information is
+				only gathered if the message is actually going to be logged.
 		'''
 		logger = LIBRARY_LOGGER.getSubLogger("WebDevRequest.initialRequestReceipt")
-		baseRequestInfo = [
-			"Method = {!s}".format(self.swag['original-http-method']),
-			"RealMethod = {!s}".format(self.swag['http-method']),
-			"SentTo = {!s}".format(system.tag.read("[System]Gateway/SystemName").value),
-			"FromIP = {!s}".format(self.swag['headers-lc'].get('x-real-ip', self.request['remoteAddr'])),
-			"URI = {!s}".format(self.request['servletRequest'].getRequestURI()),
-			"Session = {!s}".format(system.util.jsonEncode(self.session))
-		]
-		logger.debug("Received an HTTP Request. See details for more info", baseRequestInfo)
+		if not logger.isEnabled('debug'):
+			return
+		record = self.getReceiptRecord()
+		logger.debug(
+			"Received an HTTP Request. See details for more info",
+			lambda: [
+				"Method = {!s}".format(record['method']),
+				"RealMethod = {!s}".format(record['real-method']),
+				"SentTo = {!s}".format(record['sent-to']),
+				"FromIP = {!s}".format(record['from-ip']),
+				"URI = {!s}".format(record['uri']),
+				"Session = {!s}".format(system.util.jsonEncode(record['session']))
+			]
+		)
 		logger.trace("Original Request object. See details for more info", self.request)
 		logger.trace("Original Session object. See details for more info", self.session)
 	#END DEF
@@ -161,10 +217,13 @@ class WebDevRequest(object):
 		'''
 		@FUNC	Creates a log message containing the appropriate incoming data (based on the HTTP Method)
 				after obscuring the appropriate data.
+		@PARAM	dataLocation : String, the key in `self.swag` the data came from
+		@PARAM	data : Python Dictionary
+		@PARAM	signature : HttpDataSignature, or the RedactionPlan compiled from it (see `obscure`)
 		'''
 		logger = LIBRARY_LOGGER.getSubLogger("WebDevRequest.incomingData")
-		logableCopy = obscure(data, signature)
-		logger.debug('Request Data (parsed from {!s})'.format(dataLocation), logableCopy)
+		#Obscuring the data is only worth doing if the message is actually going to be logged
+		logger.debug('Request Data (parsed from {!s})', lambda: obscure(data, signature), args=(dataLocation,))
 	#END DEF
 	
 	def logOutgoingData(self, response, signature=None):
@@ -172,10 +231,10 @@ class WebDevRequest(object):
 		@FUNC	Creates a log message containing the HTTP response
 		'''
 		logger = LIBRARY_LOGGER.getSubLogger("WebDevRequest.outgoingData")
-		logableCopy = obscure(response, signature) if signature is not None else response
 		logger.debug(
-			"Response Code was {!s}. Data included in details".format(self.request['servletResponse'].getStatus()),
-			logableCopy
+			"Response Code was {!s}. Data included in details",
+			lambda: obscure(response, signature) if signature is not None else response,
+			args=(self.request['servletResponse'].getStatus(),)
 		)
 	#END DEF
 	
@@ -228,7 +287,9 @@ class WebDevRequest(object):
 			)
 		else:
 			self.requestAugmentations[mykey] = False
-			self.swag['headers'] = copy.deepcopy(self.request['headers'])
+			#Header values are Strings, so a shallow copy keeps the WebDev Request's headers intact even when
+			# validation type-casts the values in `swag['headers']`
+			self.swag['headers'] = dict(self.request['headers'])
 			self.swag['headers-lc'] = {k.lower():self.swag['headers'][k] for k in self.swag['headers']}
 			self.requestAugmentations[mykey] = True
 		#END IF/ELSE
@@ -289,9 +350,9 @@ class WebDevRequest(object):
 			logger = LIBRARY_LOGGER.getSubLogger('WebDevRequest.augmentRequestURI')
 			self.requestAugmentations[mykey] = False
 			uri = self.request['servletRequest'].getRequestURI()
-			logger.trace("Given URI = {!r}".format(uri))
-			logger.trace("Given URI Base = {!r}".format(uriBase))
-			logger.trace("Remaining Path = {!r}".format(self.request['remainingPath']))
+			logger.trace("Given URI = {!r}", args=(uri,))
+			logger.trace("Given URI Base = {!r}", args=(uriBase,))
+			logger.trace("Remaining Path = {!r}", args=(self.request['remainingPath'],))
 			self.swag['file-extension'] = None if len(uri.rsplit('.',1)) == 1 else uri.rsplit('.',1)[-1].lower()
 			self.swag['uri-base'] = uriBase.split('/')
 			self.swag['resource-path'] = (
@@ -307,15 +368,23 @@ class WebDevRequest(object):
 		return
 	#END DEF
 	
-	def augmentRequestContent(self, contentType, forceReCalcAug=False):
+	def augmentRequestContent(self, contentType, forceReCalcAug=False, maxBodySize=None, keepOriginalData=False,
+							  streamBody=False):
 		'''
 		@FUNC	Extracts more detailed "Content" data, based off what is given in the WebDev Request.
 		@PARAM	contentType : String
 		@PARAM	forceReCalcAug : Boolean. If the augmentation has already be calculated, passing a True
 					will tell the function to ignore that and recalc.
+		@PARAM	maxBodySize : Integer/None, the largest body (in bytes) that will be accepted. `None` means
+					there is no limit. [DEFAULT: None]
+		@PARAM	keepOriginalData : Boolean, whether to keep the original HTTP Body in ['original-data'] when it
+					has to be parsed. [DEFAULT: False]
+		@PARAM	streamBody : Boolean, whether the body is a JSON array whose items should be decoded one at a time
+					as they are iterated over. ['data'] will then be an iterator, rather than a List. [DEFAULT: False]
 		@ADDS	['data']
 		@ADDS	['original-data']
 		@RETURN	N/A
+		@RAISES	RequestBodyTooLargeException, if the body is larger than `maxBodySize`
 		'''
 		mykey = 'content'
 		self.__validate_augment_request_dependencies(mykey)
@@ -326,7 +395,31 @@ class WebDevRequest(object):
 		else:
 			logger = LIBRARY_LOGGER.getSubLogger('WebDevRequest.augmentRequestContent')
 			self.requestAugmentations[mykey] = False
-			self.swag['data'] = self._copyDictWithStringKeys(self.request.get('data',None))
+			#Refusing an oversized body before anything is read or copied, when the client told us how large it is
+			contentLength = self.request['servletRequest'].getContentLength()
+			if maxBodySize is not None and contentLength > maxBodySize:
+				raise CustomExceptions.RequestBodyTooLargeException(
+					"Request body of {!s} bytes is larger than the limit of {!s} bytes".format(contentLength, maxBodySize)
+				)
+			#END IF
+			self.swag['original-data'] = None
+			if streamBody:
+				if contentType != 'application/json':
+					raise CustomExceptions.InvalidContentTypeException(
+						"Only 'application/json' request bodies can be streamed. Given '{!s}'".format(contentType)
+					)
+				#If the WebDev Module already decoded the body, there is nothing left to read from the request
+				if isinstance(self.request.get('data',None), types.ListType):
+					self.swag['data'] = iter(self.request['data'])
+				else:
+					self.swag['data'] = swagGl.JsonArrayStream(self.request['servletRequest'], maxBodySize)
+				logger.trace("Body will be streamed as a JSON array")
+				self.requestAugmentations[mykey] = True
+				return
+			#END IF
+			#The data that the WebDev Module already parsed is handed over to `swag['data']`, rather than copied. Nothing
+			# reads the WebDev Request's 'data' after this point, so only validation will change it (in place).
+			self.swag['data'] = self._useDictWithStringKeys(self.request.get('data',None))
 			#
 			# make sure set, if ifs false
 			#
@@ -341,19 +434,24 @@ class WebDevRequest(object):
 						"Allowed types are '{!s}'.".format(swagGl.VALID_METHODS[requestHTTPMethod])
 					)
 			#END IF
-			logger.trace("Determined Content-Type to be '{!s}'".format(contentType))
+			logger.trace("Determined Content-Type to be '{!s}'", args=(contentType,))
 			if contentType in swagGl.VALID_CONTENT_TYPES:
 				contentTypeParserClass = swagGl.VALID_CONTENT_TYPES[contentType]
 				if not contentTypeParserClass.isvalid(self.swag['data']):
-					logger.trace("Parsing Body as '{!s}' for HTTP METHOD '{!s}'".format(contentType, requestHTTPMethod))
+					logger.trace("Parsing Body as '{!s}' for HTTP METHOD '{!s}'", args=(contentType, requestHTTPMethod))
 					#Ideally, this simply updates the value of swag['data'], but other
 					# keys could be added if deemed necessary by the contentTypeParserClass
-					logger.trace("Un-parsed body = {!r}".format(self.request['data']))
+					logger.trace("Un-parsed body = {!r}", args=(self.request['data'],))
 					self.swag.update(
-						contentTypeParserClass.parse(self.request)
+						contentTypeParserClass.parse(
+							self.request,
+							maxBodySize = maxBodySize,
+							keepOriginalData = keepOriginalData
+						)
 					)
 					logger.trace(
-						"Parsing results. data = {!r} , original-data = {!r}".format(
+						"Parsing results. data = {!r} , original-data = {!r}",
+						args=(
 							self.swag['data'], self.swag['original-data']
 						)
 					)
@@ -569,7 +667,7 @@ def getDataSignatureFromSwagger(swaggerdef, direction, qualifier, swagStc, swagD
 						)
 					)
 			if basicFieldName in paramSwag:
-				logger.trace("Parameter signature has the '{!s}' key.".format(basicFieldName))
+				logger.trace("Parameter signature has the '{!s}' key.", args=(basicFieldName,))
 				if not isinstance(paramSwag[basicFieldName], fieldRules['valueType']):
 					raise CustomExceptions.SwaggerParamDefinitionInvalidException(
 							"'{!s}' Swagger Key for parameter of type '{!s}' must be a {!s}".format(
@@ -586,6 +684,18 @@ def getDataSignatureFromSwagger(swaggerdef, direction, qualifier, swagStc, swagD
 				sig[basicFieldName] = paramSwag[basicFieldName]
 			#END IF
 		#END FOR
+		#Compiling the regular expression now (it is cached for when it is used in validation), so that a bad
+		# pattern is reported as an issue with the Swagger definition rather than with the data being validated.
+		if 'pattern' in sig:
+			try:
+				swagGl.compileRegex(sig['pattern'])
+			except re.error, e:
+				raise CustomExceptions.SwaggerParamDefinitionInvalidException(
+					"'pattern' Swagger Key for parameter of type '{!s}' is not a valid regular expression. {!s}".format(
+						paramSwag['type'], e
+					)
+				)
+		#END IF
 		
 		#For some other data types, we need to do some "special" processing of the Swagger Definition to create
 		# an HttpDataSignature. Basically, just 'object' and 'array', which are kinda unique
@@ -667,20 +777,30 @@ def getDataSignatureFromSwagger(swaggerdef, direction, qualifier, swagStc, swagD
 			)
 		if swaggerdef.get('parameters',None) is None or not isinstance(swaggerdef.get('parameters',None), types.ListType):
 			logger.debug(
-				"'parameters' key in Swagger is not a List. No signature to extract for '{!s}'".format(qualifier)
+				"'parameters' key in Swagger is not a List. No signature to extract for '{!s}'",
+				args=(qualifier,)
 			)
 			return datSig
 		for param in swaggerdef['parameters']:
 			if '$ref' in param:
 				param = getRef(param['$ref'])
 			if param['in'] != qualifier:
-				logger.trace("The parameter we are processing is not expected to come in the '{!s}'".format(qualifier))
+				logger.trace("The parameter we are processing is not expected to come in the '{!s}'", args=(qualifier,))
 				continue
 			#At this point, we know that the param's "in" definition matches the qualifier.
 			if qualifier == 'body':
 				#We expect the 'body' type parameter to have a schema. If the 'schema' key is
 				# not found, we will use an empty dictionary as a default
 				schema = param.get('schema', {})
+				#A body that is an array can only be accepted by an endpoint that streams the body (see the custom
+				# 'streamBody' key). The signature then has the single key 'items', the signature of every item.
+				if schema.get('type', None) == 'array':
+					logger.trace("Extracting incoming signature for the items of a streamed Body")
+					datSig.update( extractForSig(schema, qualifier)['signature'] )
+					if 'items' in datSig:
+						datSig['items']['required'] = True
+					continue
+				#END IF
 				#The signature for an HTTP Body will always be of type 'object'
 				schema['type'] = 'object'
 				#The 'in:body' type is unique, as it is allowed objects
@@ -698,7 +818,8 @@ def getDataSignatureFromSwagger(swaggerdef, direction, qualifier, swagStc, swagD
 						"Every parameter with a definition must have a name. Definition given '{!r}'.".format(param)
 					)
 				logger.debug(
-					"Extracting incoming signature for '{!s}', which is expected to be in '{!s}'".format(
+					"Extracting incoming signature for '{!s}', which is expected to be in '{!s}'",
+					args=(
 						param['name'], qualifier
 					)
 				)
@@ -737,14 +858,14 @@ def getDataSignatureFromSwagger(swaggerdef, direction, qualifier, swagStc, swagD
 		else:
 			schema = swaggerdef['responses'].get(qualifier,{}).get('schema',None)
 		if schema is None or not isinstance(schema, types.DictionaryType):
-			logger.debug("No schema found for definition of '{!s}' response.".format(qualifier))
+			logger.debug("No schema found for definition of '{!s}' response.", args=(qualifier,))
 			return datSig
 		schemaType = schema.get('type',"string")
 		if schemaType == 'object':
 			#When creating a signature for a response, the "data location" is always the body, since we are only
 			# creating response signatures for JSON responses that have a 'schema' defined, similar to how
 			# the HTTP Body parameters are defined.
-			logger.debug("Extracting outgoing signature for definition of '{!s}' object response".format(qualifier))
+			logger.debug("Extracting outgoing signature for definition of '{!s}' object response", args=(qualifier,))
 			datSig = extractForSig(schema, 'body')['signature']
 			for key in schema.get('properties',{}):
 				datSig[key]['required'] = key in schema.get('required',[])
@@ -763,55 +884,194 @@ def getDataSignatureFromSwagger(swaggerdef, direction, qualifier, swagStc, swagD
 	return datSig
 #END DEF
 
+#Data signatures that have already been built, keyed by the (Script Module, HTTP Method Class, Swagger Statics,
+# Swagger Definitions) they were built from. The SWAGGER dictionaries are static, so the signatures only need to be
+# rebuilt when the project scripts are saved, which reloads every Script Module (and so clears this cache).
+_SIGNATURE_CACHE = {}
+
+def getDataSignaturesForEndpoint(scriptModule, httpMethodClass, swagStc, swagDf):
+	'''
+	@FUNC	Gets the incoming and outgoing HttpDataSignature objects for the given HTTP Method Class, building them
+			(see `getDataSignatureFromSwagger`) the first time the class is seen.
+			The returned signatures are shared by every request to the endpoint, and so should not be modified.
+	@PARAM	scriptModule : Reference to the Script Module that contains the HTTP Method Class
+	@PARAM	httpMethodClass : Reference to an `HttpMethod` Class, with a SWAGGER dictionary
+	@PARAM	swagStc : Reference to a Script Module for the "Swagger Statics"
+	@PARAM	swagDf : Reference to a Script Module for the "Swagger Definitions"
+	@RETURN	Python Dictionary, with the following keys:
+			 - 'incoming' : Python Dictionary, mapping every key in `swagGl.VALID_SWAGGER_IN` to a HttpDataSignature
+			 - 'outgoing' : Python Dictionary, mapping every key in the SWAGGER's 'responses' to a HttpDataSignature
+			 - 'plans' : Python Dictionary, with the keys 'incoming' and 'outgoing' mapping the same keys to the
+			 	ValidationPlan compiled from each HttpDataSignature
+			 - 'redactions' : Python Dictionary, like 'plans', but with the RedactionPlan compiled from each
+			 	HttpDataSignature
+	'''
+	logger = LIBRARY_LOGGER.getSubLogger('getDataSignaturesForEndpoint')
+	cacheKey = (scriptModule, httpMethodClass, swagStc, swagDf)
+	dataSignatures = _SIGNATURE_CACHE.get(cacheKey, None)
+	if dataSignatures is not None:
+		return dataSignatures
+	
+	swaggerDef = getattr(httpMethodClass, swagStc.ENDPOINT_SWAGGER_VARIABLE)
+	logger.debug("Building data signatures for '{!s}.{!s}'", args=(scriptModule.__name__, httpMethodClass.__name__))
+	dataSignatures = {
+		'incoming': {
+			dataLocation : getDataSignatureFromSwagger(
+					swaggerDef,
+					'incoming', dataLocation,
+					swagStc, swagDf
+				)
+				for dataLocation in
+				swagGl.VALID_SWAGGER_IN.keys()
+		},
+		'outgoing': {
+			httpStatusCode : getDataSignatureFromSwagger(
+					swaggerDef,
+					'outgoing', httpStatusCode,
+					swagStc, swagDf
+				)
+				for httpStatusCode in
+				swaggerDef.get('responses',{}).keys()
+		}
+	}
+	dataSignatures['plans'] = {
+		direction: {
+			qualifier: compileSignature(dataSignatures[direction][qualifier])
+			for qualifier in dataSignatures[direction]
+		}
+		for direction in ('incoming', 'outgoing')
+	}
+	dataSignatures['redactions'] = {
+		direction: {
+			qualifier: compileRedaction(dataSignatures[direction][qualifier])
+			for qualifier in dataSignatures[direction]
+		}
+		for direction in ('incoming', 'outgoing')
+	}
+	_SIGNATURE_CACHE[cacheKey] = dataSignatures
+	return dataSignatures
+#END DEF
+
+def clearSignatureCache():
+	'''
+	@FUNC	Forgets every data signature that has been built, so they are rebuilt on the next request
+	'''
+	_SIGNATURE_CACHE.clear()
+#END DEF
+
+class RedactionPlan(object):
+	'''
+	@CLASS	The keys of an HttpDataSignature (and of every nested signature) that `obscure` redacts, worked out once
+			so that obscuring data does not re-interpret the signature, or copy any of the data it leaves alone.
+			
+			Only the keys that are obscured, or that lead to nested data with obscured keys, are kept. A signature
+			without any obscured keys compiles to an empty plan, which returns the data it is given as it is.
+	@ATTR	keyPlans : Dictionary, mapping a key to True (the value is redacted), or to the RedactionPlan of the
+				key's nested signature (for an object, the plan of its properties; for an array, a plan with the
+				key 'items')
+	'''
+	def __init__(self, signature):
+		'''
+		@FUNC	Compiles the given signature (and every nested signature) into a plan
+		@PARAM	signature : HttpDataSignature
+		'''
+		self.keyPlans = {}
+		for key in signature:
+			keySig = signature[key]
+			if bool(keySig.get('obscure', False)):
+				self.keyPlans[key] = True
+			elif isinstance(keySig.get('signature', None), HttpDataSignature):
+				subPlan = RedactionPlan(keySig['signature'])
+				if subPlan.keyPlans:
+					self.keyPlans[key] = subPlan
+			#END IF/ELIF
+		#END FOR
+	#END DEF
+	
+	def __repr__(self):
+		return 'RedactionPlan({!r})'.format(self.keyPlans)
+	#END DEF
+	
+	def apply(self, data):
+		'''
+		@FUNC	Obscures the given dictionary. Only the dictionaries and lists that hold an obscured value are copied,
+				so the returned dictionary shares everything else with the given one (and *is* the given one, when
+				nothing in it is obscured).
+		@PARAM	data : Python Dictionary
+		@RETURN	Python Dictionary
+		'''
+		newdata = None
+		for key, keyPlan in self.keyPlans.iteritems():
+			if key not in data:
+				continue
+			value = self.__applyToValue(keyPlan, data[key])
+			if value is not data[key]:
+				if newdata is None:
+					newdata = dict(data)
+				newdata[key] = value
+		#END FOR
+		return data if newdata is None else newdata
+	#END DEF
+	
+	def __applyToValue(self, keyPlan, value):
+		'''
+		@FUNC	Obscures a single value, the same way the `obscure` function always has. A redacted array becomes
+				`['REDACTED']` (or stays empty), so that its length is hidden too.
+		@PARAM	keyPlan : True, or RedactionPlan (see `keyPlans`)
+		@PARAM	value : Object
+		@RETURN	Object, the given value when nothing in it is obscured
+		'''
+		if keyPlan is True:
+			return 'REDACTED'
+		if isinstance(value, types.DictionaryType):
+			return keyPlan.apply(value)
+		if isinstance(value, types.ListType):
+			itemPlan = keyPlan.keyPlans.get('items', None)
+			if itemPlan is None:
+				return value
+			if itemPlan is True:
+				return ['REDACTED'] if value else []
+			newList = [self.__applyToValue(itemPlan, item) for item in value]
+			if all(newItem is item for newItem, item in zip(newList, value)):
+				return value
+			return newList
+		#END IF
+		return value
+	#END DEF
+#END CLASS
+
+def compileRedaction(signature):
+	'''
+	@FUNC	Compiles the given HttpDataSignature into a RedactionPlan, which obscures data exactly like the `obscure`
+			function but without re-interpreting the signature every time.
+	@PARAM	signature : HttpDataSignature
+	@RETURN	RedactionPlan
+	'''
+	return RedactionPlan(signature)
+#END DEF
+
 def obscure(data, sig):
 	'''
-	@FUNC	Obscures the given dictionary based on the given HTTP Data Signature object
+	@FUNC	Obscures the given dictionary based on the given HTTP Data Signature object.
+			The data is not copied. When nothing in it needs obscuring, the given dictionary is returned; otherwise
+			only the dictionaries and lists along the way to each obscured key are copied (see `RedactionPlan`).
+			Either way, the result should only be read (eg. logged), never modified.
 	@PARAM	data : Python Dictionary
-	@PARAM	sig : HttpDataSignature Object
+	@PARAM	sig : HttpDataSignature Object, or the RedactionPlan compiled from one (see `compileRedaction`)
 	@RETURN	Python Dictionary, the original data with the defined keys obscured (ie. changed to "REDACTED")
 	'''
 	logger = LIBRARY_LOGGER.getSubLogger('obscure')
-	logger.debug("Received data of type {!s}. (see details for signature)".format(type(data)), sig)
 	if not isinstance(data, types.DictionaryType):
 		raise Exception('Obscuring of data requires a Python Dictionary object for the first parameter.')
-	if not isinstance(sig, HttpDataSignature):
-		raise Exception('Obscuring of data requires an HttpDataSignature object for the second parameter.')
-	logger.trace("Given data and signature are the valid data types.")
-	newdata = copy.deepcopy(data)
-	for key in sig:
-		logger.trace("Processing key '{!s}'".format(key))
-		if key not in newdata:
-			logger.trace("Key '{!s}' not in data. Skipping...".format(key))
-			continue
-		#Only obscure data if specified in the Data Signature Dictionary. Note that the Swagger uses the
-		# key 'custom prefix'+'obscure', which then becomes the key 'obscure'
+	if isinstance(sig, HttpDataSignature):
+		#Note that the Swagger uses the key 'custom prefix'+'obscure', which then becomes the key 'obscure'
 		# in the Data Signature Dictionary
-		if 'obscure' in sig[key] and bool(sig[key]['obscure']):
-			logger.trace("Redacting value for key '{!s}'!".format(key))
-			newdata[key] = 'REDACTED'
-		elif isinstance(newdata[key], types.DictionaryType):
-			logger.trace("Key '{!s}' maps to a dictionary. Making recursive call...".format(key))
-			newdata[key] = obscure( newdata[key], sig[key].get('signature',HttpDataSignature()) )
-		elif isinstance(newdata[key], types.ListType):
-			logger.trace("Key '{!s}' maps to a list. Redacting all data!".format(key))
-			newListOfData = []
-			for item in newdata[key]:
-				arrayItem = {}
-				arrayItem['items'] = item
-				newListOfData.append(
-					obscure(
-						arrayItem,
-						sig[key].get('signature',HttpDataSignature())
-					)['items']
-				)
-			#END FOR
-			newdata[key] = (
-				(['REDACTED'] if 'REDACTED' in newListOfData else []) +
-				filter(lambda v:v!='REDACTED', newListOfData)
-			)
-		#END IF/ELIF/ELIF
-	#END FOR
-	return newdata
+		sig = compileRedaction(sig)
+	elif not isinstance(sig, RedactionPlan):
+		raise Exception('Obscuring of data requires an HttpDataSignature object for the second parameter.')
+	#The plan is not a Dictionary, so it goes in the message rather than in the details
+	logger.debug("Received data of type {!s}. Obscuring with {!r}", args=(type(data), sig))
+	return sig.apply(data)
 #END DEF
 
 
@@ -965,7 +1225,7 @@ class data_validation:
 			- maxLength
 		'''
 		logger = LIBRARY_LOGGER.getSubLogger('validate_string')
-		logger.trace("For key '{!s}', got data of type {!s}".format(key, type(data[key])))
+		logger.trace("For key '{!s}', got data of type {!s}", args=(key, type(data[key])))
 		
 		if ('format' in signature[key] and
 			signature[key]['format'] in swagGl.BASIC_PARAMETER_FIELDS['string']['format']['allowedValues']
@@ -990,8 +1250,8 @@ class data_validation:
 				# every object has a string form, and we want this validation to be a little strict.
 			#END IF
 			if 'pattern' in signature[key]:
-				logger.trace("Checking if string matches pattern '{!s}'".format(signature[key]['pattern']))
-				if re.match(signature[key]['pattern'], data[key]) is None:
+				logger.trace("Checking if string matches pattern '{!s}'", args=(signature[key]['pattern'],))
+				if swagGl.compileRegex(signature[key]['pattern']).match(data[key]) is None:
 					raise CustomExceptions.HttpDataValidationException(
 						"String '{!s}' does not match regex pattern '{!s}'".format(
 							data[key], signature[key]['pattern']
@@ -1000,7 +1260,8 @@ class data_validation:
 			if 'minLength' in signature[key] or 'maxLength' in signature[key]:
 				if 'minLength' in signature[key] and 'maxLength' in signature[key]:
 					logger.trace(
-						"Checking if string is between {!s} and {!s} characters long".format(
+						"Checking if string is between {!s} and {!s} characters long",
+						args=(
 							signature[key]['minLength'], signature[key]['maxLength']
 						)
 					)
@@ -1013,7 +1274,8 @@ class data_validation:
 				#END IF
 				elif 'minLength' in signature[key]:
 					logger.trace(
-						"Checking if string is at least {!s} characters long".format(signature[key]['minLength'])
+						"Checking if string is at least {!s} characters long",
+						args=(signature[key]['minLength'],)
 					)
 					if len(data[key]) < signature[key]['minLength']:
 						raise CustomExceptions.HttpDataValidationException(
@@ -1024,7 +1286,8 @@ class data_validation:
 				#END IF
 				elif 'maxLength' in signature[key]:
 					logger.trace(
-						"Checking if string is no more than {!s} characters long".format(signature[key]['maxLength'])
+						"Checking if string is no more than {!s} characters long",
+						args=(signature[key]['maxLength'],)
 					)
 					if len(data[key]) > signature[key]['maxLength']:
 						raise CustomExceptions.HttpDataValidationException(
@@ -1047,7 +1310,7 @@ class data_validation:
 		#If this data is going back in a response, then we need to make sure that we either have a Date Object
 		# (which we can format into the appropriate format) or a Date String in the appropriate format
 		if kwargs.get('isForResponse',False):
-			logger.trace("Formatting a Date Object into a Date String [format='{!s}']".format(dateFormat))
+			logger.trace("Formatting a Date Object into a Date String [format='{!s}']", args=(dateFormat,))
 			if isinstance(data[key], java.util.Date):
 				logger.trace("Formatting Date Object in to Date String")
 				data[key] = system.date.format(data[key], dateFormat)
@@ -1079,7 +1342,7 @@ class data_validation:
 				)
 			#END IF/ELIF/ELSE
 		else:
-			logger.trace("Parsing a Date String in to a Date Object [format='{!s}']".format(dateFormat))
+			logger.trace("Parsing a Date String in to a Date Object [format='{!s}']", args=(dateFormat,))
 			if not isinstance(data[key], types.StringTypes):
 				raise CustomExceptions.HttpDataValidationException(
 						data_validation._getTypeErrorMessage(data, key, 'string')
@@ -1133,10 +1396,10 @@ class data_validation:
 		No special signature keys.
 		'''
 		logger = LIBRARY_LOGGER.getSubLogger('validate_boolean')
-		logger.trace("For key '{!s}', got data of type {!s}".format(key, type(data[key])))
+		logger.trace("For key '{!s}', got data of type {!s}", args=(key, type(data[key])))
 		if not isinstance(data[key], types.BooleanType):
 			doTypeCasting = kwargs.get('doTypeCasting', False)
-			logger.trace("Type casting variable? {!r}".format(doTypeCasting))
+			logger.trace("Type casting variable? {!r}", args=(doTypeCasting,))
 			if not doTypeCasting:
 				raise CustomExceptions.HttpDataValidationException(
 					data_validation._getTypeErrorMessage(data, key, 'boolean')
@@ -1163,7 +1426,7 @@ class data_validation:
 			- exclusiveMaximum
 		'''
 		logger = LIBRARY_LOGGER.getSubLogger('validate_number')
-		logger.trace("For key '{!s}', got data of type {!s}".format(key, type(data[key])))
+		logger.trace("For key '{!s}', got data of type {!s}", args=(key, type(data[key])))
 		
 		numFormat = signature[key].get('format','float')
 		formatType = {
@@ -1172,13 +1435,13 @@ class data_validation:
 			'double': java.lang.Double,
 			'long': types.LongType,
 		}.get(numFormat,None)
-		logger.trace("Checking if number is of type {!s}".format(numFormat))
+		logger.trace("Checking if number is of type {!s}", args=(numFormat,))
 		if formatType is None:
 			raise CustomExceptions.HttpDataValidationException("Invalid number type '{!s}'".format(numFormat))
 		
 		if not isinstance(data[key], formatType):
 			doTypeCasting = kwargs.get('doTypeCasting', False)
-			logger.trace("Type casting variable? {!r}".format(doTypeCasting))
+			logger.trace("Type casting variable? {!r}", args=(doTypeCasting,))
 			if not doTypeCasting:
 				raise CustomExceptions.HttpDataValidationException(
 					data_validation._getTypeErrorMessage(data, key, numFormat)
@@ -1196,7 +1459,8 @@ class data_validation:
 		if 'minimum' in signature[key] or 'maximum' in signature[key]:
 			if 'minimum' in signature[key] and 'maximum' in signature[key]:
 				logger.trace(
-					"Checking if value is between {!s} and {!s}. Exclusive min? {!r}  Exclusive max? {!r}".format(
+					"Checking if value is between {!s} and {!s}. Exclusive min? {!r}  Exclusive max? {!r}",
+					args=(
 						signature[key]['minimum'], signature[key]['maximum'],
 						signature[key].get('exclusiveMinimum',False),
 						signature[key].get('exclusiveMaximum',False)
@@ -1223,7 +1487,8 @@ class data_validation:
 			#END IF
 			elif 'minimum' in signature[key]:
 				logger.trace(
-					"Checking if value is more than {!s}. Exclusive min? {!r}".format(
+					"Checking if value is more than {!s}. Exclusive min? {!r}",
+					args=(
 						signature[key]['minimum'], signature[key].get('exclusiveMinimum',False)
 					)
 				)
@@ -1243,7 +1508,8 @@ class data_validation:
 			#END IF
 			elif 'maximum' in signature[key]:
 				logger.trace(
-					"Checking if value is less than {!s}. Exclusive max? {!r}".format(
+					"Checking if value is less than {!s}. Exclusive max? {!r}",
+					args=(
 						signature[key]['maximum'], signature[key].get('exclusiveMaximum',False)
 					)
 				)
@@ -1290,11 +1556,11 @@ class data_validation:
 			- uniqueItems
 		'''
 		logger = LIBRARY_LOGGER.getSubLogger('validate_array')
-		logger.trace("For key '{!s}', got data of type {!s}".format(key, type(data[key])))
+		logger.trace("For key '{!s}', got data of type {!s}", args=(key, type(data[key])))
 		if not isinstance(data[key], types.ListType):
 			logger.trace("Not given List Object. Do we have a String and 'collectionFormat'?")
 			if isinstance(data[key], types.StringTypes) and 'collectionFormat' in signature[key]:
-				logger.trace("We have a String. 'collectionFormat'='{!s}'".format(signature[key]['collectionFormat']))
+				logger.trace("We have a String. 'collectionFormat'='{!s}'", args=(signature[key]['collectionFormat'],))
 				data[key] = data[key].split(
 					swagGl.VALID_SWAGGER_ARRAY_COLLECTION_FORMATS[signature[key]['collectionFormat']]['delimiter']
 				)
@@ -1303,10 +1569,10 @@ class data_validation:
 					data_validation._getTypeErrorMessage(data, key, 'array')
 				)
 		#END IF
-
+		
 		validationIssues = []
 		castData = []
-		logger.trace("Validating {!s} items".format(len(data[key])))
+		logger.trace("Validating {!s} items", args=(len(data[key]),))
 		for item in data[key]:
 			arrayItem = {}
 			arrayItem['items'] = item
@@ -1334,7 +1600,8 @@ class data_validation:
 				)
 		if 'minItems' in signature[key]:
 			logger.trace(
-				"Array requires at least {!s} items. Currently have {!s}".format(
+				"Array requires at least {!s} items. Currently have {!s}",
+				args=(
 					signature[key]['minItems'], len(data[key])
 				)
 			)
@@ -1344,7 +1611,8 @@ class data_validation:
 				)
 		if 'maxItems' in signature[key]:
 			logger.trace(
-				"Array can have at most {!s} items. Currently have {!s}".format(
+				"Array can have at most {!s} items. Currently have {!s}",
+				args=(
 					signature[key]['maxItems'], len(data[key])
 				)
 			)
@@ -1362,7 +1630,7 @@ class data_validation:
 		No special signature keys.
 		'''
 		logger = LIBRARY_LOGGER.getSubLogger('validate_object')
-		logger.trace("For key '{!s}', got data of type {!s}".format(key, type(data[key])))
+		logger.trace("For key '{!s}', got data of type {!s}", args=(key, type(data[key])))
 		if not isinstance(data[key], types.DictionaryType):
 			raise CustomExceptions.HttpDataValidationException(
 				data_validation._getTypeErrorMessage(data, key, 'object')
@@ -1407,10 +1675,9 @@ def validate(data, signature, hasParent=False, doTypeCasting=False, isForRespons
 	
 	for key in signature:
 		logger.trace(
-			"Validating data for key {!r} (tc-{!r}, fr-{!r}) || Signature (see details)".format(
-				key, doTypeCasting, isForResponse, 
-			),
-			signature[key]
+			"Validating data for key {!r} (tc-{!r}, fr-{!r}) || Signature (see details)",
+			signature[key],
+			args=(key, doTypeCasting, isForResponse)
 		)
 		dataValidity.addKey(key)
 		dataValidity[key]['type'] = signature[key]['type'].lower()
@@ -1456,7 +1723,7 @@ def validate(data, signature, hasParent=False, doTypeCasting=False, isForRespons
 				isForResponse = isForResponse
 			)
 		except CustomExceptions.HttpDataValidationException, e:
-			logger.trace("Found issue with data in {!r}. {!s}".format(key, e))
+			logger.trace("Found issue with data in {!r}. {!s}", args=(key, e))
 			dataValidity[key]['message'] = str(e)
 			continue
 		#END TRY/EXCEPT
@@ -1496,7 +1763,7 @@ def validate(data, signature, hasParent=False, doTypeCasting=False, isForRespons
 	# or `data_validation._validate_object` recursively called this `validate` function. So by knowing that
 	# `hasParent` is False, we know that we are back at the first invocation of the function
 	if not hasParent:
-		logger.debug("Final Validity: {!s}".format(dataValidity.ALL_VALID), dataValidity)
+		logger.debug("Final Validity: {!s}", dataValidity, args=(dataValidity.ALL_VALID,))
 	
 	return dataValidity
 #END DEF
@@ -1528,6 +1795,529 @@ def simpleValidate(value, typeString):
 
 
 
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# COMPILED HTTP REQUEST DATA VALIDATION ("VALIDATION PLANS")
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+class ValidationPlan(object):
+	'''
+	@CLASS	An HttpDataSignature compiled into a list of pre-bound validation functions, one per key in the signature.
+			Calling `validate` on a plan makes the same changes to the data as calling the `validate` function with
+			the signature the plan was compiled from, and gives the same ALL_VALID and messages. The decisions that
+			only depend on the signature (the validation function for the type, which range check to do, the error
+			messages, etc.) are made once, when the plan is compiled by `compileSignature`.
+			
+			While validating, the plan only records the keys that are not simply "found and valid". The full
+			HttpDataValidation (with an entry for every key) is only built when the data is not valid. When the data
+			is valid, an empty HttpDataValidation is returned with ALL_VALID set to True.
+	@ATTR	signature : HttpDataSignature, the signature the plan was compiled from
+	@ATTR	keyPlans : List of Tuples, (key, type, required, nullable, hasDefault, default, checkValue, checkEnum, subPlan)
+	'''
+	def __init__(self, signature):
+		'''
+		@FUNC	Compiles the given signature (and every nested signature) into a plan
+		@PARAM	signature : HttpDataSignature
+		@RAISES	Exception, if not given an HttpDataSignature
+		'''
+		if not isinstance(signature, HttpDataSignature):
+			raise Exception("Cannot validate data without an HTTP Data Signature.")
+		self.signature = signature
+		self.keyPlans = []
+		for key in signature:
+			keySig = signature[key]
+			keyType = keySig['type'].lower()
+			subPlan = None
+			if keyType in ('array', 'object'):
+				subSig = keySig.get('signature',{})
+				subPlan = ValidationPlan(subSig) if isinstance(subSig, HttpDataSignature) else None
+			self.keyPlans.append((
+				key,
+				keyType,
+				keySig.get('required', False),
+				keySig.get('nullable', False),
+				'default' in keySig,
+				keySig.get('default', None),
+				validation_compiler.compileValueCheck(keyType, keySig, subPlan),
+				validation_compiler.compileEnumCheck(keySig),
+				subPlan,
+			))
+		#END FOR
+	#END DEF
+	
+	def validate(self, data, hasParent=False, doTypeCasting=False, isForResponse=False):
+		'''
+		@FUNC	Validates the given data using the compiled plan. See the `validate` function.
+		@PARAM	data : Dictionary, the data we are checking for the valid parameters.
+		@PARAM	hasParent : Boolean, whether this data is in a nested object/array and has a parent
+		@PARAM	doTypeCasting : Boolean, whether type casting should be attempted.
+		@PARAM	isForResponse : Boolean, whether the data should be in a state ready to be converted to a JSON string.
+		@RETURN	HttpDataValidation. Only has the per-key details if the data was not valid.
+		'''
+		allValid, deviations = self.run(data, doTypeCasting, isForResponse)
+		if allValid:
+			dataValidity = HttpDataValidation()
+			dataValidity.ALL_VALID = True
+		else:
+			dataValidity = self.materialize(deviations)
+		if not hasParent:
+			LIBRARY_LOGGER.getSubLogger('ValidationPlan.validate').debug(
+				"Final Validity: {!s}".format(dataValidity.ALL_VALID), dataValidity
+			)
+		return dataValidity
+	#END DEF
+	
+	def run(self, data, doTypeCasting=False, isForResponse=False):
+		'''
+		@FUNC	Validates the given data, only recording the keys that were not found, were not valid, or have nested
+				data. Every other key is assumed to be "found and valid".
+		@PARAM	data : Dictionary, the data we are checking for the valid parameters.
+		@PARAM	doTypeCasting : Boolean, whether type casting should be attempted.
+		@PARAM	isForResponse : Boolean, whether the data should be in a state ready to be converted to a JSON string.
+		@RETURN	Tuple, (Boolean whether all of the data is valid, Dictionary of recorded keys or None).
+				The recorded keys map to a Tuple of (valid, found, nested result, message), which `materialize` uses.
+				The nested result of an object is the Tuple returned by `run`, and of an array is a Tuple of
+				(Boolean whether all items are valid, number of items, Dictionary mapping an index to the recorded
+				keys of that item or None).
+		'''
+		allValid = True
+		deviations = None
+		for key, keyType, required, nullable, hasDefault, default, checkValue, checkEnum, subPlan in self.keyPlans:
+			if key not in data:
+				if required:
+					allValid = False
+				elif hasDefault:
+					data[key] = default
+				if deviations is None:
+					deviations = {}
+				deviations[key] = (not required, False, None, None)
+				continue
+			#END IF
+			
+			if data[key] is None:
+				if nullable:
+					#An object that is null has no nested validation, unlike an object that was found and valid
+					if keyType == 'object':
+						if deviations is None:
+							deviations = {}
+						deviations[key] = (True, True, None, None)
+				else:
+					allValid = False
+					if deviations is None:
+						deviations = {}
+					deviations[key] = (False, True, None, "Value for '{!s}' cannot be null".format(key))
+				continue
+			#END IF
+			
+			if checkValue is None:
+				#This is a `raise` because the issue is with whoever defined Swagger that built the
+				# HttpDataSignature, not with the data being validated
+				raise CustomExceptions.HttpDataValidationException("Invalid data signature format '{!s}'".format(keyType))
+			try:
+				items = checkValue(data, key, doTypeCasting, isForResponse)
+			except CustomExceptions.HttpDataValidationException, e:
+				allValid = False
+				if deviations is None:
+					deviations = {}
+				deviations[key] = (False, True, None, str(e))
+				continue
+			#END TRY/EXCEPT
+			
+			if checkEnum is not None:
+				message = checkEnum(data[key])
+				if message is not None:
+					allValid = False
+					if deviations is None:
+						deviations = {}
+					deviations[key] = (False, True, items, message)
+					continue
+			#END IF
+			
+			#Objects with nothing to record are "found and valid", just like any other key. Arrays always need
+			# their number of items recorded.
+			if items is not None and (keyType == 'array' or items[1] is not None):
+				if not items[0]:
+					allValid = False
+				if deviations is None:
+					deviations = {}
+				deviations[key] = (True, True, items, None)
+			#END IF
+		#END FOR
+		return (allValid, deviations)
+	#END DEF
+	
+	def materialize(self, deviations):
+		'''
+		@FUNC	Builds the full HttpDataValidation, with an entry for every key, from the keys recorded by `run`
+		@PARAM	deviations : Dictionary or None, the recorded keys returned by `run`
+		@RETURN	HttpDataValidation, exactly what the `validate` function would have returned
+		'''
+		dataValidity = HttpDataValidation()
+		allValid = True
+		for key, keyType, required, nullable, hasDefault, default, checkValue, checkEnum, subPlan in self.keyPlans:
+			if deviations is not None and key in deviations:
+				valid, found, items, message = deviations[key]
+			else:
+				valid, found, items, message = True, True, ((True, None) if keyType == 'object' else None), None
+			#END IF/ELSE
+			if items is None:
+				nestedValidity = None
+			elif keyType == 'array':
+				itemsValid, itemCount, itemDeviations = items
+				nestedValidity = [
+					subPlan.materialize(itemDeviations.get(index, None) if itemDeviations is not None else None)
+					for index in xrange(itemCount)
+				]
+				allValid = allValid and all([v.ALL_VALID for v in nestedValidity])
+			else:
+				nestedValidity = subPlan.materialize(items[1])
+				allValid = allValid and nestedValidity.ALL_VALID
+			#END IF/ELIF/ELSE
+			allValid = allValid and valid
+			dataValidity[key] = {
+				'valid': valid,
+				'found': found,
+				'type': keyType,
+				'items': nestedValidity,
+				'message': message,
+			}
+		#END FOR
+		dataValidity.ALL_VALID = allValid
+		return dataValidity
+	#END DEF
+#END CLASS
+
+class validation_compiler:
+	'''
+	@CLASS	Has the functions that turn a single key of an HttpDataSignature into a function that validates the value
+			of that key, mirroring the functions in the `data_validation` class. Each compiled function is called
+			with the parameters (data, key, doTypeCasting, isForResponse), and either returns the nested result (for
+			arrays and objects, see `ValidationPlan.run`) or None, or raises an HttpDataValidationException with the
+			same message that the `data_validation` class would give.
+	'''
+	NUMBER_FORMAT_TYPES = {
+		'integer': types.IntType,
+		'float': types.FloatType,
+		'double': java.lang.Double,
+		'long': types.LongType,
+	}
+	
+	@staticmethod
+	def compileValueCheck(keyType, keySig, subPlan=None):
+		'''
+		@FUNC	Compiles the validation function for a single key in a signature
+		@PARAM	keyType : String, the lower-cased type of the key
+		@PARAM	keySig : Dictionary, the signature of the key
+		@PARAM	subPlan : ValidationPlan/None, the plan for the items of an array or the properties of an object
+		@RETURN	Function, or None if the type is not a valid Swagger type
+		'''
+		if keyType not in swagGl.VALID_SWAGGER_TYPES['body']:
+			return None
+		return getattr(validation_compiler, '_compile_'+keyType)(keySig, subPlan)
+	#END DEF
+	
+	@staticmethod
+	def compileEnumCheck(keySig):
+		'''
+		@FUNC	Compiles the check that a value is one of the values in the signature's 'enum'
+		@PARAM	keySig : Dictionary, the signature of the key
+		@RETURN	Function that returns an error message (or None if the value is allowed), or None if there is no 'enum'
+		'''
+		if 'enum' not in keySig or not isinstance(keySig['enum'], types.ListType):
+			return None
+		enumList = keySig['enum']
+		try:
+			enumSet = frozenset(enumList)
+		except TypeError:
+			enumSet = None
+		def checkEnum(value):
+			try:
+				allowed = value in (enumSet if enumSet is not None else enumList)
+			except TypeError:
+				#Unhashable values can still be compared to the items in the list
+				allowed = value in enumList
+			if allowed:
+				return None
+			return "Value '{!s}' is not in the list of allowed options {!r}".format(value, enumList)
+		#END DEF
+		return checkEnum
+	#END DEF
+	
+	@staticmethod
+	def _compile_string(keySig, subPlan):
+		if 'format' in keySig and keySig['format'] in swagGl.BASIC_PARAMETER_FIELDS['string']['format']['allowedValues']:
+			stringFormat = keySig['format']
+			if stringFormat == 'byte':
+				return lambda data, key, doTypeCasting, isForResponse: None
+			elif stringFormat in ['date','datetime']:
+				return validation_compiler._compile_string_date(keySig)
+			def checkBadFormat(data, key, doTypeCasting, isForResponse):
+				raise CustomExceptions.HttpDataValidationException(
+					"Somehow tried to process a String format that is invalid. Got '{!s}'".format(stringFormat)
+				)
+			#END DEF
+			return checkBadFormat
+		#END IF
+		
+		pattern = keySig.get('pattern', None)
+		patternRegex = None
+		if pattern is not None:
+			try:
+				patternRegex = swagGl.compileRegex(pattern)
+			except re.error:
+				#Leaving the bad pattern to raise the error when it is actually used, just like `_validate_string`
+				patternRegex = None
+		#END IF
+		minLength = keySig.get('minLength', None)
+		maxLength = keySig.get('maxLength', None)
+		if 'minLength' in keySig and 'maxLength' in keySig:
+			lengthFailed = lambda length: not (minLength <= length <= maxLength)
+			lengthMessage = "Value is not between {!s} and {!s} characters in length".format(minLength, maxLength)
+		elif 'minLength' in keySig:
+			lengthFailed = lambda length: length < minLength
+			lengthMessage = "Value must be greater than or equal to {!s} characters in length".format(minLength)
+		elif 'maxLength' in keySig:
+			lengthFailed = lambda length: length > maxLength
+			lengthMessage = "Value must be less than or equal to {!s} characters in length".format(maxLength)
+		else:
+			lengthFailed = None
+			lengthMessage = None
+		#END IF/ELIF/ELSE
+		
+		def checkString(data, key, doTypeCasting, isForResponse):
+			value = data[key]
+			if not isinstance(value, types.StringTypes):
+				raise CustomExceptions.HttpDataValidationException(
+					data_validation._getTypeErrorMessage(data, key, 'string')
+				)
+			if pattern is not None:
+				if (patternRegex or swagGl.compileRegex(pattern)).match(value) is None:
+					raise CustomExceptions.HttpDataValidationException(
+						"String '{!s}' does not match regex pattern '{!s}'".format(value, pattern)
+					)
+			if lengthFailed is not None and lengthFailed(len(value)):
+				raise CustomExceptions.HttpDataValidationException(lengthMessage)
+		#END DEF
+		return checkString
+	#END DEF
+	
+	@staticmethod
+	def _compile_string_date(keySig):
+		dateFormat = swagGl.VALID_SWAGGER_DATE_FORMATS.get(keySig['format'])
+		def checkDate(data, key, doTypeCasting, isForResponse):
+			value = data[key]
+			if isForResponse:
+				if isinstance(value, java.util.Date):
+					data[key] = system.date.format(value, dateFormat)
+				elif isinstance(value, types.StringTypes):
+					try:
+						system.date.parse(value, dateFormat)
+					except:
+						raise CustomExceptions.HttpDataValidationException(
+							data_validation._getTypeErrorMessage(
+								data, key, "Date string [format '{!s}']".format(dateFormat)
+							)
+						)
+				else:
+					raise CustomExceptions.HttpDataValidationException(
+						data_validation._getTypeErrorMessage(
+							data, key, "Date Object or Date string [format '{!s}']".format(dateFormat)
+						)
+					)
+				#END IF/ELIF/ELSE
+			else:
+				if not isinstance(value, types.StringTypes):
+					raise CustomExceptions.HttpDataValidationException(
+						data_validation._getTypeErrorMessage(data, key, 'string')
+					)
+				try:
+					data[key] = system.date.parse(value, dateFormat)
+				except:
+					raise CustomExceptions.HttpDataValidationException(
+						data_validation._getTypeErrorMessage(
+							data, key, "Date String [format '{!s}']".format(dateFormat)
+						)
+					)
+			#END IF/ELSE
+		#END DEF
+		return checkDate
+	#END DEF
+	
+	@staticmethod
+	def _compile_boolean(keySig, subPlan):
+		def checkBoolean(data, key, doTypeCasting, isForResponse):
+			if not isinstance(data[key], types.BooleanType):
+				if not doTypeCasting:
+					raise CustomExceptions.HttpDataValidationException(
+						data_validation._getTypeErrorMessage(data, key, 'boolean')
+					)
+				try:
+					data[key] = bool(data[key])
+				except:
+					raise CustomExceptions.HttpDataValidationException(
+						data_validation._getTypeErrorMessage(data, key, 'boolean')
+					)
+			#END IF
+		#END DEF
+		return checkBoolean
+	#END DEF
+	
+	@staticmethod
+	def _compile_integer(keySig, subPlan):
+		return validation_compiler._compile_number(keySig, subPlan, 'integer')
+	#END DEF
+	
+	@staticmethod
+	def _compile_number(keySig, subPlan, numFormat=None):
+		if numFormat is None:
+			numFormat = keySig.get('format','float')
+		formatType = validation_compiler.NUMBER_FORMAT_TYPES.get(numFormat, None)
+		if formatType is None:
+			def checkBadFormat(data, key, doTypeCasting, isForResponse):
+				raise CustomExceptions.HttpDataValidationException("Invalid number type '{!s}'".format(numFormat))
+			#END DEF
+			return checkBadFormat
+		#END IF
+		
+		#Choosing the range check up front. The checks (and messages) are exactly those in `_validate_number`
+		minimum = keySig.get('minimum', None)
+		maximum = keySig.get('maximum', None)
+		exclusiveMinimum = keySig.get('exclusiveMinimum', False)
+		exclusiveMaximum = keySig.get('exclusiveMaximum', False)
+		if 'minimum' in keySig and 'maximum' in keySig:
+			if exclusiveMinimum and exclusiveMaximum:
+				rangeFailed = lambda value: not (minimum < value < maximum)
+			elif exclusiveMinimum:
+				rangeFailed = lambda value: not (minimum < value <= maximum)
+			elif exclusiveMaximum:
+				rangeFailed = lambda value: not (minimum <= value < maximum)
+			else:
+				rangeFailed = lambda value: not (minimum <= value <= maximum)
+			rangeMessage = "Value is not in the range {!s}{!s} to {!s}{!s}".format(
+				minimum, maximum,
+				'(exclusively)' if exclusiveMinimum else '',
+				'(exclusively)' if exclusiveMaximum else '',
+			)
+		elif 'minimum' in keySig:
+			if exclusiveMinimum:
+				rangeFailed = lambda value: value < minimum
+			else:
+				rangeFailed = lambda value: value <= minimum
+			rangeMessage = "Value must be greater than {!s}{!s}".format(
+				'' if exclusiveMinimum else 'or equal to ', minimum,
+			)
+		elif 'maximum' in keySig:
+			if exclusiveMaximum:
+				rangeFailed = lambda value: value > maximum
+			else:
+				rangeFailed = lambda value: value >= maximum
+			rangeMessage = "Value must be less than {!s}{!s}".format(
+				'' if exclusiveMaximum else 'or equal to ', maximum,
+			)
+		else:
+			rangeFailed = None
+			rangeMessage = None
+		#END IF/ELIF/ELSE
+		
+		def checkNumber(data, key, doTypeCasting, isForResponse):
+			if not isinstance(data[key], formatType):
+				if not doTypeCasting:
+					raise CustomExceptions.HttpDataValidationException(
+						data_validation._getTypeErrorMessage(data, key, numFormat)
+					)
+				try:
+					data[key] = formatType(data[key])
+				except:
+					raise CustomExceptions.HttpDataValidationException(
+						data_validation._getTypeErrorMessage(data, key, numFormat)
+					)
+			#END IF
+			if rangeFailed is not None and rangeFailed(data[key]):
+				raise CustomExceptions.HttpDataValidationException(rangeMessage)
+		#END DEF
+		return checkNumber
+	#END DEF
+	
+	@staticmethod
+	def _compile_array(keySig, itemPlan):
+		delimiter = None
+		if 'collectionFormat' in keySig:
+			delimiter = swagGl.VALID_SWAGGER_ARRAY_COLLECTION_FORMATS[keySig['collectionFormat']]['delimiter']
+		uniqueItems = ('uniqueItems' in keySig and keySig['uniqueItems'] == True)
+		minItems = keySig.get('minItems', None)
+		maxItems = keySig.get('maxItems', None)
+		minItemsMessage = "Array must have at least {!s} elements".format(minItems)
+		maxItemsMessage = "Array must have less than {!s} elements".format(maxItems)
+		
+		def checkArray(data, key, doTypeCasting, isForResponse):
+			if not isinstance(data[key], types.ListType):
+				if isinstance(data[key], types.StringTypes) and delimiter is not None:
+					data[key] = data[key].split(delimiter)
+				else:
+					raise CustomExceptions.HttpDataValidationException(
+						data_validation._getTypeErrorMessage(data, key, 'array')
+					)
+			#END IF
+			allItemsValid = True
+			itemDeviations = None
+			castData = []
+			#Every item is validated as the key 'items' in a Python Dictionary, which we reuse for every item
+			arrayItem = {}
+			for index, item in enumerate(data[key]):
+				if itemPlan is None:
+					raise Exception("Cannot validate data without an HTTP Data Signature.")
+				arrayItem.clear()
+				arrayItem['items'] = item
+				itemValid, deviations = itemPlan.run(arrayItem, doTypeCasting, isForResponse)
+				if not itemValid:
+					allItemsValid = False
+				if deviations is not None:
+					if itemDeviations is None:
+						itemDeviations = {}
+					itemDeviations[index] = deviations
+				castData.append(arrayItem['items'])
+			#END FOR
+			data[key] = castData
+			if uniqueItems and len(castData) != len(set(castData)):
+				raise CustomExceptions.HttpDataValidationException(
+					"Array must have unique elements. Found {!s} elements that were duplicates".format(
+						len(castData) - len(set(castData))
+					)
+				)
+			if minItems is not None and len(castData) < minItems:
+				raise CustomExceptions.HttpDataValidationException(minItemsMessage)
+			if maxItems is not None and len(castData) > maxItems:
+				raise CustomExceptions.HttpDataValidationException(maxItemsMessage)
+			return (allItemsValid, len(castData), itemDeviations)
+		#END DEF
+		return checkArray
+	#END DEF
+	
+	@staticmethod
+	def _compile_object(keySig, propertiesPlan):
+		def checkObject(data, key, doTypeCasting, isForResponse):
+			if not isinstance(data[key], types.DictionaryType):
+				raise CustomExceptions.HttpDataValidationException(
+					data_validation._getTypeErrorMessage(data, key, 'object')
+				)
+			if propertiesPlan is None:
+				raise Exception("Cannot validate data without an HTTP Data Signature.")
+			return propertiesPlan.run(data[key], doTypeCasting, isForResponse)
+		#END DEF
+		return checkObject
+	#END DEF
+#END CLASS
+
+def compileSignature(signature):
+	'''
+	@FUNC	Compiles the given HttpDataSignature into a ValidationPlan, which validates data exactly like the
+			`validate` function but without re-interpreting the signature every time.
+	@PARAM	signature : HttpDataSignature
+	@RETURN	ValidationPlan
+	'''
+	return ValidationPlan(signature)
+#END DEF
+
+
+
 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 # "HTTP Method" AND "Endpoint Logic" CLASSES
 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
@@ -1559,6 +2349,9 @@ class Endpoint(object):
 			 4. Confirm the request is authenticated (if necessary)
 			 5. Execute the logic found in the `HttpMethod` class
 			 6. Confirm the outgoing data is valid
+			 7. Compress the response (when the client accepts it)
+			A HEAD request to an endpoint without a `HEAD` class is answered by its `GET` class, without validating
+			or sending the body of the response.
 	@ATTR	wdr : WebDevRequest Object
 	@ATTR	swagStc : Reference to a Script Module for the "Swagger Statics"
 	@ATTR	swagDf : Reference to a Script Module for the "Swagger Definitions"
@@ -1603,12 +2396,19 @@ class Endpoint(object):
 		#END IF
 		self.response = None
 		self.scriptModule = scriptModule
+		#The cached response being returned, if any (see `__useCachedResponse`)
+		self.__responseCacheEntry = None
+		#Whether a HEAD request is being answered by the endpoint's GET (see `execute`), and the HTTP Method whose class
+		# answers the request
+		self.__headFromGet = False
+		self.__httpMethod = self.wdr.swag['http-method']
 	#END DEF
 	
 	def __getRequestLogger(self, path):
 		'''
 		@FUNC	Gets a system Logger for the WebDev endpoint called, so that we can easily find the appropriate
-				logger in the gateway logs.
+				logger in the gateway logs. The Logger is only created for the first request to the endpoint (with
+				the HTTP Method), and is reused for every request after that.
 		@RETURN	Logger object, which the user can use to log information to the Gateway Logs
 		'''
 		reformattedPath = path.replace('.','_')
@@ -1617,7 +2417,7 @@ class Endpoint(object):
 		)
 		#Making an initial TRACE log, just so that we can easily see (when testing) that the correct WebDev
 		# resource is being called.
-		request_logger.trace("Starting logger for '{!s}'".format(reformattedPath))
+		request_logger.trace("Starting logger for '{!s}'", args=(reformattedPath,))
 		return request_logger
 	#END DEF
 	
@@ -1631,6 +2431,7 @@ class Endpoint(object):
 		@RAISES	EndpointInitializationException, if the given ScriptModule is invalid
 		@ADDS	self.__httpMethodClass : Class, the HTTP Method Class (with the correct `SWAGGER` and `logic` properties)
 				self.__consuming : String, the "Content Type" given
+				self.__streamBody : Boolean, whether the body is streamed to the endpoint's logic
 		'''
 		#Determining if there is an HTTP Method class defined that has the name of the HTTP Request's Method.
 		self.logger.trace(
@@ -1666,13 +2467,26 @@ class Endpoint(object):
 		
 		self.logger.trace(
 			"Given reference to a Class has a Function named '{!s}' and Dictionary named '{!s}'".format(
-				self.swagStc.ENDPOINT_LOGIC_FUNCTION, self.swagStc.ENDPOINT_SWAGGER_VARIABLE
+				self.swagStc.ENDPOINT_LOGIC_FUNCTION, self.swagStc.ENDPOINT_SWAGGER_VARIABLE,
 			)
 		)
 		
-		if self.wdr.swag['http-method'] == 'GET':
+		#Bulk endpoints can raise (or remove) the size limit on request bodies, and any endpoint can ask to keep the
+		# original body around (eg. to verify a signature of it) rather than only the parsed data.
+		endpointSwaggerDef = getattr(self.__httpMethodClass, self.swagStc.ENDPOINT_SWAGGER_VARIABLE)
+		maxBodySize = endpointSwaggerDef.get(
+			self.swagStc.IGNITION_SWAGGER_CUSTOM_PREFIX+'maxBodySize',
+			getattr(self.swagStc, 'MAX_REQUEST_BODY_SIZE', None)
+		)
+		keepOriginalData = endpointSwaggerDef.get(self.swagStc.IGNITION_SWAGGER_CUSTOM_PREFIX+'keepOriginalData', False)
+		self.__streamBody = bool(endpointSwaggerDef.get(self.swagStc.IGNITION_SWAGGER_CUSTOM_PREFIX+'streamBody', False))
+		
+		if self.__httpMethod == 'GET':
 			self.logger.trace("Augmenting WebDevRequest object, parsing URL Query Params")
-			self.wdr.augmentRequestContent(contentType = 'application/x-www-form-urlencoded')
+			self.wdr.augmentRequestContent(
+				contentType = 'application/x-www-form-urlencoded',
+				keepOriginalData = keepOriginalData
+			)
 		else:
 			# # # # # #
 			# TODO:
@@ -1686,11 +2500,11 @@ class Endpoint(object):
 				)
 			# # # # # #
 			givenType = self.wdr.swag['headers-lc']['content-type']
-			self.logger.trace("Given content type. '{!s}'".format(givenType))
+			self.logger.trace("Given content type. '{!s}'", args=(givenType,))
 			#The "Content-Type" header can be provided with extra information, and is in the form
 			# "[CONTENT_TYPE]; [EXTRA_INFO]". So, we split on the semicolon character and get the first element
 			self.__consuming = givenType.split(';')[0].lower()
-			self.logger.trace("The true given content type. '{!s}'".format(self.__consuming))
+			self.logger.trace("The true given content type. '{!s}'", args=(self.__consuming,))
 			if self.__consuming not in swagGl.VALID_CONTENT_TYPES.keys():
 				raise CustomExceptions.EndpointInitializationException(
 					"The Content-Type '{!s}' is not supported.".format(self.__consuming)
@@ -1699,12 +2513,12 @@ class Endpoint(object):
 			# that Content-Type. We need to check the dictionary `swagGl.VALID_METHODS` for that information.
 			# The keys in the Dictionary are HTTP Methods, and if the key for the HTTP Method in the Dictionary
 			# maps to `None`, then we allow ALL types of content.
-			if (swagGl.VALID_METHODS[ self.wdr.swag['http-method'] ] is not None and
-				self.__consuming not in swagGl.VALID_METHODS[ self.wdr.swag['http-method'] ]
+			if (swagGl.VALID_METHODS[ self.__httpMethod ] is not None and
+				self.__consuming not in swagGl.VALID_METHODS[ self.__httpMethod ]
 			):
 				raise CustomExceptions.EndpointInitializationException(
 					"The Content-Type '{!s}' is not allowed for the HTTP Method {!s}.".format(
-						self.__consuming, self.wdr.swag['http-method']
+						self.__consuming, self.__httpMethod
 					)
 				)
 			#Each endpoint can also define what specific format the incoming data needs to be in.
@@ -1717,8 +2531,13 @@ class Endpoint(object):
 			#Un-comment the two lines below if you aren't worried about un-obscured data showing the gateway logs
 			##currentBody = self.wdr.request.get('data',None)
 			##self.logger.trace("request['data'] = {!s}, repr = {!r}".format(type(currentBody), currentBody))
-			self.logger.trace("Augmenting WebDevRequest object, parsing Request as '{!s}'".format(self.__consuming))
-			self.wdr.augmentRequestContent(self.__consuming)
+			self.logger.trace("Augmenting WebDevRequest object, parsing Request as '{!s}'", args=(self.__consuming,))
+			self.wdr.augmentRequestContent(
+				self.__consuming,
+				maxBodySize = maxBodySize,
+				keepOriginalData = keepOriginalData,
+				streamBody = self.__streamBody
+			)
 		#END IF/ELSE
 		
 		#Verifying that the Body or URL Params were parsed and can now be referenced in the `swag` Python Dictionary.
@@ -1782,21 +2601,22 @@ class Endpoint(object):
 			# So while the full path might be 'mypackage.subpackage.mymodule.myfunction', this logger message
 			# will only show 'mymodule.myfunction'.
 			funcQualName = "{!s}.{!s}".format(authMethod['method'].__module__, authMethod['method'].__name__)
-			self.logger.trace("Attempting authentication using function '{!s}'".format(funcQualName))
+			self.logger.trace("Attempting authentication using function '{!s}'", args=(funcQualName,))
 			
 			#Creating a dictionary with the arguments for the authentication function. The Dictionary describing the
 			# authentication function can also define some "extra arguments", and we need to include those.
 			authKWArgs = {'wdr':self.wdr}
 			if isinstance(authMethod.get('extraArgs',None), types.DictionaryType) and len(authMethod['extraArgs']) > 0:
 				self.logger.trace(
-					"Adding extra authentication args {!r} to execution of '{!s}'".format(
+					"Adding extra authentication args {!r} to execution of '{!s}'",
+					args=(
 						authMethod['extraArgs'].keys(), funcQualName
 					)
 				)
 				for argName in authMethod['extraArgs']:
 					authKWArgs[argName] = authMethod['extraArgs'][argName]
 			#END IF
-
+			
 			#Note that this line is not in a try/except. If the developer did not implement the
 			# function to accept the proper parameters, then we want the exception to occur.
 			#
@@ -1805,12 +2625,13 @@ class Endpoint(object):
 			#If the authentication succeeded, break the loop. Otherwise, record the error message received and continue.
 			# There may be MULTIPLE authentication methods that are allowed.
 			if authResponse.get('success', False):
-				self.logger.trace("Authentication '{!s}' succeeded.".format(authMethod['method'].__name__))
+				self.logger.trace("Authentication '{!s}' succeeded.", args=(authMethod['method'].__name__,))
 				authSuccess = True
+				self.wdr.accessInfo['auth-method'] = funcQualName
 				self.wdr.swag['auth'] = authResponse
 				break
 			else:
-				self.logger.trace("Authentication '{!s}' failed.".format(authMethod['method'].__name__))
+				self.logger.trace("Authentication '{!s}' failed.", args=(authMethod['method'].__name__,))
 				#If the authentication message does not provide a message in the key 'message' for why the authentication
 				# failed, we will make sure a default message is generated.
 				authErrorMessages.append( authResponse.get('message', "Failure to pass '{!s}'".format(funcQualName)) )
@@ -1832,22 +2653,30 @@ class Endpoint(object):
 		'''
 		if not self.__endpointSwaggerDef.get(self.swagStc.IGNITION_SWAGGER_CUSTOM_PREFIX+'validateRequest',True):
 			self.logger.trace(
-				"No request validation. Will validate response? {!r}".format(
-					self.__endpointSwaggerDef.get(self.swagStc.IGNITION_SWAGGER_CUSTOM_PREFIX+'validateResponse',True)
+				"No request validation. Will validate response? {!r}",
+				args=(
+					self.__endpointSwaggerDef.get(self.swagStc.IGNITION_SWAGGER_CUSTOM_PREFIX+'validateResponse',True),
 				)
 			)
+			#Even without validation, a streamed body that turns out not to be a JSON array is reported as a bad request
+			if self.__streamBody and self.__httpMethod != 'GET':
+				self.wdr.swag['data'] = self.__validateStreamedItems(self.wdr.swag['data'], None)
 		else:
 			#Validating that any necessary headers were given.
 			sig = self.__dataSignatures['incoming']['header']
 			if len(sig) > 0:
 				dataLocation = swagGl.VALID_SWAGGER_IN['header']
 				data = self.wdr.swag[dataLocation]
-				self.logger.trace("Validating incoming data in \"self.wdr.swag['{!s}']\".".format(dataLocation))
-				_requestValidation = validate(data, sig, doTypeCasting = True, isForResponse = False)
+				self.logger.trace("Validating incoming data in \"self.wdr.swag['{!s}']\".", args=(dataLocation,))
+				_requestValidation = self.__dataSignatures['plans']['incoming']['header'].validate(
+					data, doTypeCasting = True, isForResponse = False
+				)
 				#Regardless of whether the request succeeded or not, we log what was received
-				self.wdr.logIncomingData(dataLocation, data, sig)
+				self.wdr.logIncomingData(
+					dataLocation, data, self.__dataSignatures['redactions']['incoming']['header']
+				)
 				if not _requestValidation.ALL_VALID:
-					self.logger.debug("Request data failed to validate. {!s}".format(_requestValidation))
+					self.logger.debug("Request data failed to validate. {!s}", args=(_requestValidation,))
 					self.response = swagRsp.json(
 						status='failure', success=False,
 						message="Error in Headers. {!s}".format(_requestValidation)
@@ -1873,28 +2702,37 @@ class Endpoint(object):
 			
 			#Validating the actual incoming data. We first need to use the "Content-Type" header to determine what
 			# key to look for in the Endpoint's Swagger Definition for the signature.
-			if self.wdr.swag['http-method'] == 'GET':
+			if self.__httpMethod == 'GET':
 				dataInKey = 'query'
 			else:
 				dataInKey = swagGl.VALID_CONTENT_TYPES_TO_SWAGGER_IN.get(self.__consuming, 'UNKNOWN')
 			#END IF/ELSE
-			self.logger.trace("Determined data key to be '{!s}'".format(dataInKey))
+			self.logger.trace("Determined data key to be '{!s}'", args=(dataInKey,))
 			sig = self.__dataSignatures['incoming'][dataInKey]
-			if len(sig) > 0:
+			if self.__streamBody and self.__httpMethod != 'GET':
+				#The items of a streamed body are validated one at a time, as the endpoint's logic iterates over them
+				self.logger.trace("Body is streamed. Items will be validated as they are read.")
+				self.wdr.swag['data'] = self.__validateStreamedItems(
+					self.wdr.swag['data'],
+					self.__dataSignatures['plans']['incoming'][dataInKey] if 'items' in sig else None
+				)
+			elif len(sig) > 0:
 				dataLocation = swagGl.VALID_SWAGGER_IN[dataInKey]
 				data = self.wdr.swag[dataLocation]
-				self.logger.trace("Validating incoming data in \"self.wdr.swag['{!s}']\".".format(dataLocation))
+				self.logger.trace("Validating incoming data in \"self.wdr.swag['{!s}']\".", args=(dataLocation,))
 				self.logger.trace("all swag", self.wdr.swag)
-				_requestValidation = validate(
-					data, sig,
+				_requestValidation = self.__dataSignatures['plans']['incoming'][dataInKey].validate(
+					data,
 					doTypeCasting = (False if dataLocation=='body' else True),
 					isForResponse = False
 				)
 				#Regardless of whether the request succeeded or not, we log what was received
 				self.logger.trace("Data was validated. Logging to Gateway Console Log...")
-				self.wdr.logIncomingData(dataLocation, data, sig)
+				self.wdr.logIncomingData(
+					dataLocation, data, self.__dataSignatures['redactions']['incoming'][dataInKey]
+				)
 				if not _requestValidation.ALL_VALID:
-					self.logger.debug("Request data failed to validate. {!s}".format(_requestValidation))
+					self.logger.debug("Request data failed to validate. {!s}", args=(_requestValidation,))
 					self.response = swagRsp.json(
 						status='failure', success=False,
 						message="Error in {!s} area of request. {!s}".format(dataInKey, _requestValidation)
@@ -1908,6 +2746,43 @@ class Endpoint(object):
 		return True
 	#END DEF
 	
+	def __validateStreamedItems(self, items, plan):
+		'''
+		@FUNC	A generator that validates (and cleans up) each item of a streamed body as it is read, so that an invalid
+				item stops the endpoint's logic before the rest of the body is read.
+		@PARAM	items : Iterator, the decoded items of the body
+		@PARAM	plan : ValidationPlan/None, compiled from a signature with the single key 'items'. When `None`, the
+					items are not validated.
+		@RETURN	Generator, of the validated items
+		@RAISES	InvalidStreamedItemException, when an item is not valid, or the body is not a JSON array
+		'''
+		index = 0
+		items = iter(items)
+		while True:
+			#Only reading (and decoding) the body is wrapped, so that a bug in validation is not reported as bad data
+			try:
+				item = next(items)
+			except StopIteration:
+				break
+			except ValueError, e:
+				raise CustomExceptions.InvalidStreamedItemException(str(e))
+			#END TRY/EXCEPT
+			if plan is not None:
+				#The plan validates a Dictionary, so the item is wrapped in one under the key in the signature
+				wrapper = {'items': item}
+				_itemValidation = plan.validate(wrapper, hasParent = True, doTypeCasting = False, isForResponse = False)
+				if not _itemValidation.ALL_VALID:
+					raise CustomExceptions.InvalidStreamedItemException(
+						"Item {!s} of the body is not valid. {!s}".format(index, _itemValidation)
+					)
+				item = wrapper['items']
+			#END IF
+			yield item
+			index += 1
+		#END WHILE
+		self.logger.debug("Streamed {!s} items from the body", args=(index,))
+	#END DEF
+	
 	def __executeLogic(self):
 		'''
 		@FUNC	Executes the actual logic of the endpoint, as defined by the HTTP Method Class.
@@ -1917,7 +2792,18 @@ class Endpoint(object):
 		#The "logic" function should ALWAYS receive the following parameters:
 		#  - `wdr` : WebDevRequest Object
 		#  - `logger` : Gateway Logger Object
-		self.response = getattr(self.__httpMethodClass, self.swagStc.ENDPOINT_LOGIC_FUNCTION)(self.wdr, self.logger)
+		try:
+			self.response = getattr(self.__httpMethodClass, self.swagStc.ENDPOINT_LOGIC_FUNCTION)(self.wdr, self.logger)
+		except CustomExceptions.InvalidStreamedItemException, e:
+			#A streamed body is only validated while the logic is reading it, so this is reported just like a body
+			# that failed `__validateRequest`
+			self.logger.debug("Streamed request data failed to validate. {!s}", args=(e,))
+			self.response = swagRsp.json(
+				status='failure', success=False,
+				message="Error in body area of request. {!s}".format(e)
+			)
+			return False
+		#END TRY/EXCEPT
 		#Expected return:
 		#  - Python Dictionary, a WebDev response that a WebDev Resource can return. The valid keys are:
 		#	 - 'html' - HTML source as a String.
@@ -1954,16 +2840,16 @@ class Endpoint(object):
 			):
 				responseHTTPCode = 'default'
 			self.logger.trace(
-				"Validating response using definition for the '{!s}' status in the SWAGGER.".format(responseHTTPCode)
+				"Validating response using definition for the '{!s}' status in the SWAGGER.",
+				args=(responseHTTPCode,)
 			)
 			if responseHTTPCode not in self.__dataSignatures['outgoing']:
 				raise CustomExceptions.EndpointExecutionException(	
 						"Cannot validate response for status '{!s}'".format(responseHTTPCode)
 					)
 			else:
-				_responseValidation = validate(
+				_responseValidation = self.__dataSignatures['plans']['outgoing'][responseHTTPCode].validate(
 						self.response['json'],
-						self.__dataSignatures['outgoing'][responseHTTPCode],
 						doTypeCasting = True,
 						isForResponse = True
 					)
@@ -1977,15 +2863,230 @@ class Endpoint(object):
 			self.logger.trace(
 					"No response validation. "+
 					("Response is JSON. " if 'json' in (self.response or {}) else "Response is not JSON. ")+
-					("Special 'validateResponse' key = {!r}".format(
-							self.__endpointSwaggerDef.get(self.swagStc.IGNITION_SWAGGER_CUSTOM_PREFIX+'validateResponse',True)
-						)
+					"Special 'validateResponse' key = {!r}",
+					args=(
+						self.__endpointSwaggerDef.get(self.swagStc.IGNITION_SWAGGER_CUSTOM_PREFIX+'validateResponse',True),
 					)
 				)
 		#END IF/ELSE
 		return True
 	#END DEF
 	
+	def __useCachedResponse(self):
+		'''
+		@FUNC	When the endpoint caches its responses (see the custom 'cache' SWAGGER key), looks for a cached response
+				to the request
+		@ADDS	self.__responseCache : swagCch.ResponseCache/None
+		@ADDS	self.__responseCacheKey : Tuple/None, see `swagCch.ResponseCache.makeKey`
+		@ADDS	self.__responseCacheEntry : Dictionary/None, the cached response (see `swagCch.makeEntry`) returned
+		@RETURN	Boolean, whether a cached response was found (and put in `self.response`)
+		'''
+		self.__responseCache = None
+		self.__responseCacheKey = None
+		self.__responseCacheEntry = None
+		if self.__httpMethod != 'GET':
+			return False
+		self.__responseCache = swagCch.getResponseCache(
+			self.wdr.accessInfo['route'], self.__httpMethod,
+			self.__endpointSwaggerDef.get(self.swagStc.IGNITION_SWAGGER_CUSTOM_PREFIX+'cache', None)
+		)
+		if self.__responseCache is None:
+			return False
+		self.__responseCacheKey = self.__responseCache.makeKey(self.wdr)
+		entry = self.__responseCache.get(self.__responseCacheKey)
+		if entry is None:
+			self.logger.trace("No cached response.")
+			return False
+		self.logger.trace("Returning the cached response.")
+		self.__responseCacheEntry = entry
+		self.response = swagCch.respondWithEntry(self.wdr.request, entry)
+		return True
+	#END DEF
+	
+	def __cacheResponse(self):
+		'''
+		@FUNC	When the endpoint caches its responses, caches the (validated) response, and replaces it with the
+				serialized copy that was cached, so that every response to the request looks the same
+		'''
+		#A response to a HEAD request has not been validated, so it is not fit to answer a GET request
+		if self.__responseCache is None or self.__headFromGet:
+			return
+		entry = swagCch.makeEntry(self.wdr.request, self.response, self.__responseCache.settings['ttl'])
+		if entry is None:
+			self.logger.trace("Response cannot be cached.")
+			return
+		self.__responseCache.put(self.__responseCacheKey, entry)
+		self.__responseCacheEntry = entry
+		self.response = swagCch.respondWithEntry(self.wdr.request, entry)
+	#END DEF
+	
+	def __setEntityTag(self):
+		'''
+		@FUNC	When the endpoint asks for Entity Tags (see the custom 'etag' SWAGGER key), sets the 'ETag' header of a
+				successful 'json' response to the hash of its JSON. Unless the response is streamed, it is replaced with
+				the JSON that was hashed, so that the bytes sent are the ones the (strong) Entity Tag was made from, and
+				the JSON is only serialized once.
+		'''
+		if (not self.__endpointSwaggerDef.get(self.swagStc.IGNITION_SWAGGER_CUSTOM_PREFIX+'etag', False) or
+			self.__httpMethod != 'GET' or
+			'json' not in (self.response or {}) or
+			self.wdr.request['servletResponse'].getStatus() != 200
+		):
+			return
+		#A failure reported in a "200 OK" response is not worth tagging (or caching, see `swagCch.makeEntry`)
+		if (isinstance(self.response['json'], types.DictionaryType) and
+			self.response['json'].get('success', True) is False
+		):
+			return
+		if self.__endpointSwaggerDef.get(self.swagStc.IGNITION_SWAGGER_CUSTOM_PREFIX+'streamResponse', False):
+			#A streamed response is written with the same serializer, so it can be hashed without building the String
+			etag = swagRsp.makeJsonEntityTag(self.response['json'])
+		else:
+			body = swagSer.dumps(self.response['json'])
+			etag = swagRsp.makeEntityTag(body)
+			self.response = {'response': body, 'contentType': self.response.get('contentType', 'application/json')}
+		#END IF/ELSE
+		self.logger.trace("Response has the ETag {!s}", args=(etag,))
+		swagRsp.setHeader(self.wdr.request, 'ETag', etag)
+	#END DEF
+	
+	def __checkNotModified(self):
+		'''
+		@FUNC	When the endpoint asks for Entity Tags, replaces the response with a "304 Not Modified" (and no body) if
+				the request's 'If-None-Match' header matches the response's 'ETag'
+		'''
+		if (not self.__endpointSwaggerDef.get(self.swagStc.IGNITION_SWAGGER_CUSTOM_PREFIX+'etag', False) or
+			self.__httpMethod != 'GET'
+		):
+			return
+		etag = self.wdr.request['servletResponse'].getHeader('ETag')
+		if etag and swagRsp.entityTagMatches(self.wdr.swag['headers-lc'].get('if-none-match', None), etag):
+			self.response = swagRsp.notModified(self.wdr.request, etag)
+	#END DEF
+	
+	def __getCompressedBody(self):
+		'''
+		@FUNC	Unless the endpoint opts out (see the custom 'compress' SWAGGER key), compresses a response body that is
+				large enough with the encoding the client prefers. The compressed body of a cached response is kept with
+				it, so that it is only compressed once.
+		@RETURN	Tuple/None, (String compressed body, String encoding, String Content-Type). None if the response is
+				not compressed.
+		'''
+		settings = swagCmp.getCompressionSettings(
+			self.__endpointSwaggerDef.get(self.swagStc.IGNITION_SWAGGER_CUSTOM_PREFIX+'compress', None),
+			self.swagStc
+		)
+		if settings is None:
+			return None
+		if not swagCmp.hasResponseBody(self.response):
+			return None
+		#Whether or not this one is, the response to the request can be compressed, so caches must keep them apart
+		self.wdr.request['servletResponse'].addHeader('Vary', 'Accept-Encoding')
+		encoding = swagCmp.chooseEncoding(self.wdr.swag['headers-lc'].get('accept-encoding', None))
+		if encoding is None:
+			return None
+		found = swagCmp.getResponseBody(self.response)
+		if found is None:
+			return None
+		body, contentType = found
+		if len(body) < settings['minSize']:
+			self.logger.trace("Response of {!s} bytes is too small to compress.", args=(len(body),))
+			if 'json' in self.response:
+				#Keeping the body that was just serialized, rather than having the WebDev Module encode it again
+				self.response = {'response': body, 'contentType': contentType}
+			return None
+		compress = lambda uncompressed: swagCmp.compress(uncompressed, encoding, settings['level'])
+		entry = self.__responseCacheEntry
+		if entry is not None and entry['body'] is body:
+			compressedBody = swagCch.getEncodedBody(entry, encoding, compress)
+		else:
+			compressedBody = compress(body)
+		self.logger.trace(
+			"Compressed the response from {!s} to {!s} bytes with '{!s}'.",
+			args=(len(body), len(compressedBody), encoding)
+		)
+		return compressedBody, encoding, contentType
+	#END DEF
+	
+	def __compressResponse(self):
+		'''
+		@FUNC	Writes the response straight into the Servlet Response, compressed, when it can be (see
+				`__getCompressedBody`)
+		'''
+		found = self.__getCompressedBody()
+		if found is None:
+			return
+		compressedBody, encoding, contentType = found
+		self.wdr.accessInfo['response-size'] = len(compressedBody)
+		self.response = swagCmp.writeCompressed(self.wdr.request, compressedBody, encoding, contentType)
+	#END DEF
+	
+	def __respondToHead(self):
+		'''
+		@FUNC	Answers a HEAD request (that the endpoint's GET method was run for) with the headers of the GET response,
+				and the 'Content-Length' of its body. The body is compressed (see `__getCompressedBody`) or measured as
+				the GET response would send it: a 'json' body is encoded by the WebDev Module (see
+				`system.util.jsonEncode`), or serialized when the endpoint streams its response.
+		@RETURN	None, which tells the WebDev Module that the response has already been written
+		'''
+		servletResponse = self.wdr.request['servletResponse']
+		streamed = (
+			'json' in self.response and
+			self.__endpointSwaggerDef.get(self.swagStc.IGNITION_SWAGGER_CUSTOM_PREFIX+'streamResponse', False)
+		)
+		found = None if streamed else self.wdr.timer.time('compression', self.__getCompressedBody)
+		if found is not None:
+			compressedBody, encoding, contentType = found
+			self.logger.trace("HEAD response has a '{!s}' body of {!s} bytes.", args=(encoding, len(compressedBody)))
+			swagCmp.setCompressedHeaders(self.wdr.request, encoding, contentType, len(compressedBody))
+			return None
+		#END IF
+		contentType = self.response.get('contentType', None)
+		contentLength = None
+		if 'json' in self.response:
+			contentType = contentType or 'application/json'
+			if streamed:
+				#A streamed response is measured as it is serialized, without building it
+				contentLength = swagSer.measure(self.response['json'])
+			else:
+				body = system.util.jsonEncode(self.response['json'])
+				if isinstance(body, types.UnicodeType):
+					body = body.encode('utf-8')
+				contentLength = len(body)
+			#END IF/ELSE
+		else:
+			for key in ('response', 'html', 'bytes'):
+				body = self.response.get(key, None)
+				if body is None:
+					continue
+				if isinstance(body, types.UnicodeType):
+					body = body.encode('utf-8')
+				try:
+					contentLength = len(body)
+				except TypeError:
+					contentLength = len(str(body))
+				break
+			#END FOR
+		#END IF/ELSE
+		self.logger.trace("HEAD response has a body of {!s} bytes.", args=(contentLength,))
+		if contentType:
+			servletResponse.setContentType(contentType)
+		if contentLength is not None:
+			servletResponse.setContentLength(contentLength)
+		return None
+	#END DEF
+	
+	def __recordOutcome(self, key, outcome):
+		'''
+		@FUNC	Notes the outcome of a step in the access log information of the WebDevRequest
+		@PARAM	key : String, the key in `self.wdr.accessInfo`
+		@PARAM	outcome : Boolean
+		@RETURN	Boolean, the given outcome
+		'''
+		self.wdr.accessInfo[key] = outcome
+		return outcome
+	#END DEF
+	
 	def execute(self):
 		'''
 		@FUNC	Using self's WebDevRequest object, attempts to execute the ACTUAL endpoint logic defined
@@ -1995,6 +3096,9 @@ class Endpoint(object):
 					- auth
 					- validateRequest
 					- validateResponse
+					- cache
+					- etag
+					- compress
 		
 		@USES	self.response : Dictionary
 		@USES	self.scriptModule : Reference to Script Module object
@@ -2009,39 +3113,35 @@ class Endpoint(object):
 		@RETURN	Dictionary, the response to be returned to the original WebDev Request.
 		'''
 		if self.wdr.swag['http-method'] not in self.scriptModule.__dict__:
-			return swagRsp.httpStatus(self.wdr.request, "Not Implemented")
+			#An endpoint without a HEAD method answers HEAD requests with its GET method, minus the body
+			if self.wdr.swag['http-method'] != 'HEAD' or 'GET' not in self.scriptModule.__dict__:
+				return swagRsp.httpStatus(self.wdr.request, "Not Implemented")
+			self.logger.trace("Answering the HEAD request with the GET method.")
+			self.__headFromGet = True
+			self.__httpMethod = 'GET'
+		#END IF
 		
-		self.__validateHttpMethodClass( self.scriptModule.__dict__[self.wdr.swag['http-method']] )
+		self.wdr.timer.time('parse', self.__validateHttpMethodClass, self.scriptModule.__dict__[self.__httpMethod])
 		#Saving this for later, for easier reference by later blocks and other functions
 		self.__endpointSwaggerDef = getattr(self.__httpMethodClass, self.swagStc.ENDPOINT_SWAGGER_VARIABLE)
+		#When the endpoint is profiled, the timer runs the validation and logic stages through the request's profile
+		self.wdr.timer.profile = swagPrf.startProfile(
+			self.__endpointSwaggerDef.get(self.swagStc.IGNITION_SWAGGER_CUSTOM_PREFIX+'profile', None),
+			getattr(self.swagStc, 'PROFILE', None)
+		)
 		
-		self.logger.trace("Generating incoming and outgoing data signatures based on found Swagger.")
-		self.logger.trace("Possible incoming data locations to check: {!r}".format(swagGl.VALID_SWAGGER_IN.keys()))
+		self.logger.trace("Getting incoming and outgoing data signatures based on found Swagger.")
+		self.logger.trace("Possible incoming data locations to check: {!r}", args=(swagGl.VALID_SWAGGER_IN.keys(),))
 		self.logger.trace(
-			"Possible outgoing signature to check: {!r}".format(self.__endpointSwaggerDef.get('responses',{}).keys())
+			"Possible outgoing signature to check: {!r}",
+			args=(self.__endpointSwaggerDef.get('responses',{}).keys(),)
 		)
-		self.__dataSignatures = {
-			'incoming': {
-				dataLocation : getDataSignatureFromSwagger(
-						self.__endpointSwaggerDef,
-						'incoming', dataLocation,
-						self.swagStc, self.swagDf
-					)
-					for dataLocation in
-					swagGl.VALID_SWAGGER_IN.keys()
-
-			},
-			'outgoing': {
-				httpStatusCode : getDataSignatureFromSwagger(
-						self.__endpointSwaggerDef,
-						'outgoing', httpStatusCode,
-						self.swagStc, self.swagDf
-					)
-					for httpStatusCode in
-					self.__endpointSwaggerDef.get('responses',{}).keys()
-			}
-		}
-		self.logger.trace("Incoming and Outgoing data signatures generated (see details)", self.__dataSignatures)
+		self.__dataSignatures = self.wdr.timer.time(
+			'signatures', getDataSignaturesForEndpoint,
+			self.scriptModule, self.__httpMethodClass,
+			self.swagStc, self.swagDf
+		)
+		self.logger.trace("Incoming and Outgoing data signatures found (see details)", self.__dataSignatures)
 		
 		# CUSTOM RESPONSE HEADERS
 		#This SWAGGER config option was added because Authentication happens here, in `callWebDevLogic`, before the
@@ -2056,8 +3156,9 @@ class Endpoint(object):
 			)
 		):
 			self.logger.trace(
-				"Including headers: {!r}".format(
-					self.__endpointSwaggerDef[self.swagStc.IGNITION_SWAGGER_CUSTOM_PREFIX+'includeHeaders'].keys()
+				"Including headers: {!r}",
+				args=(
+					self.__endpointSwaggerDef[self.swagStc.IGNITION_SWAGGER_CUSTOM_PREFIX+'includeHeaders'].keys(),
 				)
 			)
 			for key in self.__endpointSwaggerDef[self.swagStc.IGNITION_SWAGGER_CUSTOM_PREFIX+'includeHeaders']:
@@ -2068,21 +3169,246 @@ class Endpoint(object):
 		
 		self.completedSuccessfully = False
 		#In the conditional block below, the incoming request will be validated, logic executed, and the response
-		# validated. The attribute `response` will have the final value to return to the callee
+		# validated. The attribute `response` will have the final value to return to the callee.
+		#When the endpoint caches its responses, a cached response is returned right after authenticating, and a new
+		# response is cached once it has been validated.
+		timer = self.wdr.timer
 		if (self.response is None and
-			self.__authenticateRequest() and
-			self.__validateRequest() and
-			self.__executeLogic() and
-			self.__validateResponse()
+			self.__recordOutcome('authenticated', timer.time('authentication', self.__authenticateRequest))
+		):
+			if timer.time('cache', self.__useCachedResponse):
+				self.completedSuccessfully = True
+			elif (self.__recordOutcome('request-valid', timer.time('request-validation', self.__validateRequest)) and
+				timer.time('logic', self.__executeLogic) and
+				#The body of a HEAD response is never sent, so there is no point validating it
+				(self.__headFromGet or
+					self.__recordOutcome('response-valid', timer.time('response-validation', self.__validateResponse)))
+			):
+				self.completedSuccessfully = True
+				timer.time('cache', self.__setEntityTag)
+				timer.time('cache', self.__cacheResponse)
+			#END IF/ELIF
+			#Whether the response is new or cached, a client that already has it only gets told that it is current
+			if self.completedSuccessfully:
+				timer.time('cache', self.__checkNotModified)
+		#END IF
+		if self.__headFromGet:
+			if self.response is not None:
+				self.response = self.__respondToHead()
+			return self.response
+		#END IF
+		#An endpoint whose JSON responses can be large (eg. long Lists) can ask for the response to be written straight
+		# into the Servlet Response, instead of having the WebDev Module encode the whole thing in memory.
+		if (self.completedSuccessfully and
+			'json' in (self.response or {}) and
+			self.__endpointSwaggerDef.get(self.swagStc.IGNITION_SWAGGER_CUSTOM_PREFIX+'streamResponse',False)
 		):
-			self.completedSuccessfully = True
+			self.logger.trace("Streaming the JSON response.")
+			self.response = swagSer.streamResponse(
+				self.wdr.request,
+				self.response['json'],
+				self.response.get('contentType','application/json')
+			)
 		#END IF
+		#Any response still left for the WebDev Module to send can be compressed, when the client accepts it
+		if self.response is not None:
+			timer.time('compression', self.__compressResponse)
 		return self.response
 	#END DEF
 #END CLASS
 
 
 
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# ROUTE TABLE (MAPPING A REQUEST PATH TO A SCRIPT RESOURCE)
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+class RouteNode(object):
+	'''
+	@CLASS	A single node in a `RouteTable`, representing one Script Package in the API resource structure.
+	@ATTR	fullName : String, the full name of the Script Package (eg. 'v1.petstore.pet.is-x-integer-petId')
+	@ATTR	scriptModule : Script Module Object with the endpoint logic, or None if the package has none
+	@ATTR	kind : Integer, the tie-break priority of the path part this node matched. Lower wins.
+	@ATTR	paramName : String/None, the name of the Path Parameter this node captures
+	@ATTR	staticChildren : Dictionary, mapping a path part to the RouteNode it leads to
+	@ATTR	paramChildren : List of Tuples, (Swagger type, RouteNode), in the order they should be tried
+	'''
+	KIND_STATIC = 0
+	KIND_INTEGER = 1
+	KIND_STRING = 2
+	
+	def __init__(self, fullName, kind, paramName=None):
+		self.fullName = fullName
+		self.scriptModule = None
+		self.kind = kind
+		self.paramName = paramName
+		self.staticChildren = {}
+		self.paramChildren = []
+	#END DEF
+#END CLASS
+
+class RouteTable(object):
+	'''
+	@CLASS	A segment trie of every Script Package below a "root" Script Package (eg. 'v1'), built once so that
+			finding the endpoint for a request path does not have to walk the Script Packages again.
+			Sub-packages named with the custom prefix and a Path Parameter type (eg. 'is-x-integer-petId')
+			become typed wildcard children, and every other sub-package becomes a static child.
+	@ATTR	rootPackage : Script Package Object the table was built from
+	@ATTR	root : RouteNode for the root Script Package
+	'''
+	#The path parameter types, in the order a wildcard is preferred when there are multiple matches
+	PARAM_KINDS = (
+		('integer', RouteNode.KIND_INTEGER),
+		('string', RouteNode.KIND_STRING),
+	)
+	
+	def __init__(self, rootPackage, swagStc):
+		'''
+		@FUNC	Builds the route table for the given root Script Package
+		@PARAM	rootPackage : Script Package Object
+		@PARAM	swagStc : Reference to a Script Module for the "Swagger Statics"
+		'''
+		logger = LIBRARY_LOGGER.getSubLogger('RouteTable.__init__')
+		self.rootPackage = rootPackage
+		self.__logicName = swagStc.ENDPOINT_LOGIC_RESOURCE_NAME
+		self.__paramPrefixes = [
+			(swagStc.IGNITION_SWAGGER_CUSTOM_PREFIX+paramType+'-', paramType, kind)
+			for paramType, kind in self.PARAM_KINDS
+			if paramType in swagGl.VALID_SWAGGER_TYPES['path']
+		]
+		self.root = RouteNode(rootPackage.__name__, RouteNode.KIND_STATIC)
+		self.nodeCount = self.__addPackage(self.root, rootPackage)
+		logger.debug("Built route table for '{!s}' with {!s} nodes", args=(self.root.fullName, self.nodeCount))
+	#END DEF
+	
+	def __addPackage(self, node, thisPackage):
+		'''
+		@FUNC	Recursively adds the endpoint logic and sub-packages of the given Script Package to the given node
+		@PARAM	node : RouteNode
+		@PARAM	thisPackage : Script Package Object
+		@RETURN	Integer, the number of nodes added (including the given node)
+		'''
+		nodeCount = 1
+		children = thisPackage.__dict__
+		if self.__logicName in children:
+			node.scriptModule = children[self.__logicName]
+		for childName in sorted(children.keys()):
+			childPackage = children[childName]
+			if not isinstance(childPackage, ScriptPackage):
+				continue
+			childFullName = node.fullName+'.'+childPackage.__name__
+			for prefix, paramType, kind in self.__paramPrefixes:
+				if childName.startswith(prefix):
+					childNode = RouteNode(childFullName, kind, childName[len(prefix):])
+					node.paramChildren.append((paramType, childNode))
+					break
+			else:
+				childNode = RouteNode(childFullName, RouteNode.KIND_STATIC)
+				node.staticChildren[childName] = childNode
+			#END FOR/ELSE
+			nodeCount += self.__addPackage(childNode, childPackage)
+		#END FOR
+		node.paramChildren.sort(key=lambda pc: pc[1].kind)
+		return nodeCount
+	#END DEF
+	
+	def __collectMatches(self, node, path, depth, pathParams, matches):
+		'''
+		@FUNC	Walks the trie along the given path, collecting every node with endpoint logic that the path reaches
+		@PARAM	node : RouteNode, the node reached after consuming `depth` path parts
+		@PARAM	path : List of Strings, the path parts after the root
+		@PARAM	depth : Integer, the number of path parts consumed so far
+		@PARAM	pathParams : Dictionary, the Path Parameters captured on the way to this node
+		@PARAM	matches : List of Tuples, (depth, RouteNode, Path Parameters). Appended to in place.
+		'''
+		if node.scriptModule is not None:
+			matches.append((depth, node, pathParams))
+		if depth == len(path):
+			return
+		nextPart = path[depth]
+		if nextPart in node.staticChildren:
+			self.__collectMatches(node.staticChildren[nextPart], path, depth+1, pathParams, matches)
+		for paramType, childNode in node.paramChildren:
+			if paramType == 'integer':
+				try:
+					value = int(nextPart)
+				except (ValueError, TypeError):
+					continue
+			else:
+				value = nextPart
+			#END IF/ELSE
+			childParams = dict(pathParams)
+			childParams[childNode.paramName] = value
+			self.__collectMatches(childNode, path, depth+1, childParams, matches)
+		#END FOR
+	#END DEF
+	
+	def lookup(self, path):
+		'''
+		@FUNC	Finds the best endpoint for the given path. When multiple endpoints match, the one that consumes the
+				most of the path wins. If there is still a tie, a static final path part is preferred, followed by
+				an integer Path Parameter, and finally a string Path Parameter.
+		@PARAM	path : List of Strings, the path parts after the root (eg. ['petstore','pet','5'])
+		@RETURN	Dictionary, see `findBestScriptResourceFromPath`. None if no endpoint matches.
+		@RAISES	CustomExceptions.EndpointException, if multiple endpoints are equally good matches
+		'''
+		matches = []
+		self.__collectMatches(self.root, path, 0, {}, matches)
+		if len(matches) == 0:
+			return None
+		bestDepth = max([m[0] for m in matches])
+		best = [m for m in matches if m[0] == bestDepth]
+		if len(best) > 1:
+			bestKind = min([m[1].kind for m in best])
+			best = [m for m in best if m[1].kind == bestKind]
+			if len(best) > 1:
+				if bestKind == RouteNode.KIND_STATIC:
+					raise CustomExceptions.EndpointException(
+						"Found multiple Packages with a static path end. Cannot chose which one to use."
+					)
+				raise CustomExceptions.EndpointException(
+					"Found multiple Packages with a variable path end of type '{!s}'.".format(
+						'integer' if bestKind == RouteNode.KIND_INTEGER else 'string'
+					) +
+					"Cannot chose which one to use."
+				)
+			#END IF
+		#END IF
+		depth, node, pathParams = best[0]
+		return {
+			'fullName': node.fullName,
+			'scriptModule': node.scriptModule,
+			'pathParams': pathParams,
+			'remainingPath': path[depth:],
+		}
+	#END DEF
+#END CLASS
+
+#Route tables that have already been built, keyed by the name of the root Script Package. Saving the project
+# reloads every Script Module (clearing this cache), but we also check the identity of the root package in case
+# the table outlives it.
+_ROUTE_TABLE_CACHE = {}
+
+def getRouteTable(rootPackage, swagStc):
+	'''
+	@FUNC	Gets the RouteTable for the given root Script Package, building it if it has not been built yet
+	@PARAM	rootPackage : Script Package Object
+	@PARAM	swagStc : Reference to a Script Module for the "Swagger Statics"
+	@RETURN	RouteTable Object
+	'''
+	routeTable = _ROUTE_TABLE_CACHE.get(rootPackage.__name__, None)
+	if routeTable is None or routeTable.rootPackage is not rootPackage:
+		routeTable = RouteTable(rootPackage, swagStc)
+		_ROUTE_TABLE_CACHE[rootPackage.__name__] = routeTable
+	return routeTable
+#END DEF
+
+def clearRouteTableCache():
+	'''
+	@FUNC	Forgets every RouteTable that has been built, so they are rebuilt on the next request
+	'''
+	_ROUTE_TABLE_CACHE.clear()
+#END DEF
+
 def findBestScriptResourceFromPath(possiblePath, swagStc):
 	'''
 	@FUNC	Attempts to use the List of Strings to find a Script Resource
@@ -2097,12 +3423,12 @@ def findBestScriptResourceFromPath(possiblePath, swagStc):
 			None will be returned if no Script Module is found
 	'''
 	logger = LIBRARY_LOGGER.getSubLogger('findBestScriptResourceFromPath')
-	logger.trace("Given Path = {!r}".format(possiblePath))
+	logger.trace("Given Path = {!r}", args=(possiblePath,))
 	if not all([isinstance(_,types.StringTypes) for _ in possiblePath]):
 		raise Exception("Was not given a List of Strings.")
 	
 	cleanPath = filter(lambda v:v.strip() != '', possiblePath)
-	logger.debug("Cleaned Path = {!r}".format(cleanPath))
+	logger.debug("Cleaned Path = {!r}", args=(cleanPath,))
 	
 	#It is assumed that the first item in the list is the "base path", which will map to a Script Package
 	# in this project. Therefore, we can always start looking in the package for the correct endpoint logic
@@ -2110,209 +3436,9 @@ def findBestScriptResourceFromPath(possiblePath, swagStc):
 	if endpointBase is None:
 		raise Exception("Missing Base for API. Please consult README")
 	
-	def findPossibleScriptPackages(thisPackage, remainingPath, foundPathParams={}, fullParentName=None):
-		'''
-		@FUNC	Recursive function for finding all possible Script Packages maybe with endpoint logic
-		@PARAM	thisPackage : Script Package object
-		@PARAM	remainingPath : List of Strings
-		@PARAM	foundPathParams : Dictionary, containing the param->value mappings already found for the original path
-		@PARAM	fullParentName : String/None
-		@RETURN	List of Dictionaries.
-					The Dictionaries will contain the following keys:
-					 - fullName : String (eg. 'v1.petstore.pet.findByStatus')
-					 - scriptModule : Script Module object
-					 - pathParams : Dictionary (KEY=ParamName, VALUE=Object)
-					 - remainingPath : List of Strings
-		'''
-		possiblePackages = []
-		fullName = (fullParentName+'.' if fullParentName is not None else '') + thisPackage.__name__
-		logger.trace("{!s} - {!r}".format(fullName, thisPackage.__dict__))
-		
-		#If this Script Package contains a resource that is a "ScriptPackge", and it has the name defined
-		# in our static key 'ENDPOINT_LOGIC_RESOURCE_NAME', then this possible is the Endpoint Logic we
-		# are looking for.
-		if swagStc.ENDPOINT_LOGIC_RESOURCE_NAME in thisPackage.__dict__:
-			logger.debug("Found possible Endpoint Logic at '{!s}'".format(fullName))
-			possiblePackages.append({
-				'fullName': fullName,
-				'scriptModule': thisPackage.__dict__[swagStc.ENDPOINT_LOGIC_RESOURCE_NAME],
-				'pathParams': copy.deepcopy(foundPathParams),
-				'remainingPath': remainingPath,
-			})
-		else:
-			logger.debug("Package '{!s}' does not have Endpoint Logic".format(fullName))
-		#END IF/ELSE
-		
-		#If we didn't find a possible Script Resource named after 'swagStc.ENDPOINT_LOGIC_RESOURCE_NAME' and there are
-		# no value remaining on the path, then we can assume that we won't find anything else and can return
-		if len(remainingPath) == 0:
-			return possiblePackages
-		
-		#Now we need to check to see if we can find a sub-package with the exact name of the next part of the
-		# URL's path. Essentially, do we have to go "deeper" into the API resource structure?
-		newRemainingPath = remainingPath[1:]
-		nextPart = remainingPath[0]
-		if (nextPart in thisPackage.__dict__ and isinstance(thisPackage.__dict__[nextPart], ScriptPackage)):
-			logger.debug(
-				"Looking deeper. Potential Endpoint Logic to be found in '{!s}' under '{!s}'".format(nextPart, fullName)
-			)
-			possiblePackages = (
-				possiblePackages +
-				findPossibleScriptPackages(
-					thisPackage = thisPackage.__dict__[nextPart],
-					remainingPath = newRemainingPath,
-					foundPathParams = copy.deepcopy(foundPathParams),
-					fullParentName = fullName,
-				)
-			)
-		else:
-			logger.debug("Did not find sub-package with name '{!s}'".format(nextPart))
-		#END IF/ELSE
-		
-		#Since part of the URL could be parameters, we need to also check if this package has sub-packages
-		# that are placeholders for Path Parameters.
-		for allowPathParamType in swagGl.VALID_SWAGGER_TYPES['path']:
-			packageNameRegex = '^{}{}\-(.*)'.format(re.escape(swagStc.IGNITION_SWAGGER_CUSTOM_PREFIX), allowPathParamType)
-			logger.trace(
-				"Looking for sub-packages in '{!s}' with name matching regex '{!s}'".format(fullName, packageNameRegex)
-			)
-			for subPackName in thisPackage.__dict__.keys():
-				#If the regex does not find a match, then we can safely skip
-				reMatchObj = re.match(packageNameRegex, subPackName)
-				if reMatchObj is None:
-					continue
-				
-				logger.debug(
-					"Potential Endpoint Logic to be found in '{!s}' under '{!s}',".format(subPackName, fullName)+
-					" if remaining path '{!s}' is valid.".format(nextPart)
-				)
-				validatedValue = simpleValidate(nextPart, allowPathParamType)
-				if validatedValue is None:
-					logger.trace(
-						"Path Part '{!s}' did not pass validation requirements for a value of type {!s}.".format(
-							nextPart, allowPathParamType
-						)
-					)
-					continue
-				#END IF
-				#If we made it past the IF, then we know that the data in the URL passed the basic validation
-				logger.debug(
-					"Path Part '{!s}' passed validation for possible sub-package '{!s}'".format(nextPart, subPackName)
-				)
-				
-				#The regex above encapsulated all of the remaining Package Name into a group, which will become our
-				# Path Param's name, mapping to the value that has been validated.
-				foundPathParams[reMatchObj.group(1)] = validatedValue
-				possiblePackages = (
-					possiblePackages +
-					findPossibleScriptPackages(
-						thisPackage = thisPackage.__dict__[subPackName],
-						remainingPath = newRemainingPath,
-						#We are making a copy, so that the original dictionary given is not appended to
-						# by later recursive calls.
-						foundPathParams = copy.deepcopy(foundPathParams),
-						fullParentName = fullName,
-					)
-				)
-			#END FOR
-		#END FOR
-		return possiblePackages
-	#END DEF
-	foundPackages = findPossibleScriptPackages(endpointBase, cleanPath[1:])
-	logger.debug(
-		"Possible Endpoint Logic found. {!s} packages found (see log details)".format(len(foundPackages)),
-		foundPackages
-	)
-	
-	if len(foundPackages) == 0:
-		logger.trace("No packages found. Returning None...")
-		return None
-	elif len(foundPackages) == 1:
-		logger.trace("Found exactly one package. Returning...")
-		return foundPackages[-1]
-	else:
-		logger.trace("Found mor than one package. Determining best match...")
-		#To find the best match, we are going to start by finding the packages that have the shortest
-		# number of "remaining path" items left. We are going to process the items in reverse order, since
-		# the end of the list of Script Packages should have the shortest remaining path.
-		minRemainingPath = -1
-		for pckg in foundPackages:
-			if minRemainingPath == -1 or len(pckg['remainingPath']) < minRemainingPath:
-				minRemainingPath = len(pckg['remainingPath'])
-		#END FOR
-		logger.trace("Best matches will have a remaining path of {!s} elements".format(minRemainingPath))
-		if minRemainingPath == -1:
-			raise CustomExceptions.EndpointException(
-				"Unable to determine Script Packages with shortest remaining path."
-			)
-		#Now we see how many packages had that smallest remaining path
-		packagesWithShortestRemaining = []
-		for pckg in foundPackages:
-			if len(pckg['remainingPath']) == minRemainingPath:
-				packagesWithShortestRemaining.append(pckg)
-		#END FOR
-		logger.debug(
-			"Filtered found Packages to {!s} elements (see log details)".format(
-				len(packagesWithShortestRemaining)
-			),
-			packagesWithShortestRemaining
-		)
-		if len(packagesWithShortestRemaining) == 1:
-			return packagesWithShortestRemaining[-1]
-		
-		#If we got to here, it means that we have multiple Script Packages that matched. We are going to first
-		# see if we have a Script Package that matches exactly. If not, then we see if an endpoint has an
-		# integer variable. And finally, if all else fails, we select the endpoint with a string variable.
-		#If during any of these tests we find multiple matching, we raise an Exception.
-		logger.trace("Sorting packages to those that had the final part of that path as a variable and those that didn't.")
-		packagesWithVariable = []
-		packagesWithoutVariable = []
-		for pckg in packagesWithShortestRemaining:
-			lastPart = pckg['fullName'].split('.')[-1]
-			if swagStc.IGNITION_SWAGGER_CUSTOM_PREFIX in lastPart:
-				packagesWithVariable.append(pckg)
-			else:
-				packagesWithoutVariable.append(pckg)
-		#END FOR
-		
-		if len(packagesWithoutVariable) > 0:
-			logger.trace(
-				"There were {!s} packages with a final path part as a static value.".format(len(packagesWithoutVariable))
-			)
-			if len(packagesWithoutVariable) > 1:
-				raise CustomExceptions.EndpointException(
-					"Found multiple Packages with a static path end. Cannot chose which one to use."
-				)
-			return packagesWithoutVariable[-1]
-		#END IF
-		if len(packagesWithVariable) == 0:
-			raise CustomExceptions.EndpointException(
-				"Somehow we have no packages with or without a variable."
-			)
-		#END IF
-		logger.trace("No packages with a static final path part. Choosing best with variable...")
-		variableTypeSearchOrder = ['integer','string']
-		for vt in variableTypeSearchOrder:
-			packagesWithMatchingVariableType = []
-			for pckg in packagesWithVariable:
-				if vt in pckg['fullName'].split('.')[-1]:
-					packagesWithMatchingVariableType.append(pckg)
-			#END FOR
-			if len(packagesWithMatchingVariableType) == 0:
-				continue
-			elif len(packagesWithMatchingVariableType) == 1:
-				return packagesWithMatchingVariableType[-1]
-			else:
-				raise CustomExceptions.EndpointException(
-					"Found multiple Packages with a variable path end of type '{!s}'.".format(vt) +
-					"Cannot chose which one to use."
-				)
-		#END FOR
-		return None
-	#END IF/ELIF/ELSE
-	raise CustomExceptions.EndpointException(
-		"Did not find any package to return. This should not have happened."
-	)
+	foundPackage = getRouteTable(endpointBase, swagStc).lookup(cleanPath[1:])
+	logger.debug("Best matching Endpoint Logic found (see log details)", foundPackage)
+	return foundPackage
 #END DEF
 
 def processRequest(request, session):
@@ -2331,23 +3457,56 @@ def processRequest(request, session):
 			 - 'contentType' - The mime type. Need only if ambiguous.
 	'''
 	logger = LIBRARY_LOGGER.getSubLogger('processRequest')
+	startTime = time.time()
+	timer = swagMet.StageTimer()
 	
 	logger.trace("Calculating URI Base...")
-	uriBase = swagGl.getUriBase(request)
+	uriBase = timer.time('uri', swagGl.getUriBase, request)
 	
 	logger.trace("Determining root Script Package for request, and by extension, the Swagger Statics and Definitions modules")
-	rootPackage = swagGl.getRootPackage(request)
+	rootPackage = timer.time('uri', swagGl.getRootPackage, request)
 	swagStc = swagGl.getNamedModuleFromRoot(rootPackage, 'statics')
 	swagDf = swagGl.getNamedModuleFromRoot(rootPackage, 'definitions')
 	
 	#Doing the necessary extension of the WebDev Request Python Dictionary, since the WebDev Module doesn't
 	# do everything we had hoped that it would.
 	logger.trace("Initializing WebDevRequest instance.")
-	wdr = WebDevRequest(request, session)
-	wdr.logInitialReceipt()
+	wdr = WebDevRequest(request, session, timer)
+	timer.time('logging', wdr.logInitialReceipt)
+	accessLog = swagAcc.getAccessLog(swagStc)
+	response = _handleRequest(wdr, uriBase, swagStc, swagDf, logger)
+	if getattr(swagStc, 'COLLECT_METRICS', True):
+		swagMet.recordRequest(
+			wdr.accessInfo['route'], wdr.swag['original-http-method'],
+			timer, wdr.request['servletResponse'].getStatus(),
+			authenticated = wdr.accessInfo['authenticated'],
+			requestValid = wdr.accessInfo['request-valid'],
+			requestSize = wdr.request['servletRequest'].getContentLength()
+		)
+	if timer.profile is not None:
+		swagPrf.finishProfile(
+			timer.profile, wdr, timer, wdr.request['servletResponse'].getStatus(),
+			bufferSize = getattr(swagStc, 'PROFILE_BUFFER_SIZE', swagPrf.DEFAULT_BUFFER_SIZE)
+		)
+	if accessLog is not None:
+		accessLog.record(swagAcc.buildEvent(wdr, response, startTime, time.time()))
+	return response
+#END DEF
+
+def _handleRequest(wdr, uriBase, swagStc, swagDf, logger):
+	'''
+	@FUNC	Does the work of `processRequest` once the WebDevRequest object has been created: finds the endpoint the
+			request was sent to, and has it execute the request.
+	@PARAM	wdr : WebDevRequest object
+	@PARAM	uriBase : String, see `swagGl.getUriBase`
+	@PARAM	swagStc : Script Module, the "statics" module for the API
+	@PARAM	swagDf : Script Module, the "definitions" module for the API
+	@PARAM	logger : Logger object, of `processRequest`
+	@RETURN	Python Dictionary, the WebDev Response (see `processRequest`)
+	'''
 	try:
-		logger.trace("Augmenting URI information using URI Base of '{!s}'".format(uriBase))
-		wdr.augmentRequestURI(uriBase = uriBase)
+		logger.trace("Augmenting URI information using URI Base of '{!s}'", args=(uriBase,))
+		wdr.timer.time('uri', wdr.augmentRequestURI, uriBase = uriBase)
 	except (Exception, java.lang.Exception), e:
 		etype, evalue, tb = sys.exc_info() if isinstance(e, Exception) else (type(e), e, None)
 		logger.error(
@@ -2356,14 +3515,14 @@ def processRequest(request, session):
 		)
 		logger.trace("Generating Internal Server Error response (Augmenting WebDevRequest)")
 		response = swagRsp.httpStatus(wdr.request, "Internal Server Error")
-		wdr.logOutgoingData(response)
+		wdr.timer.time('logging', wdr.logOutgoingData, response)
 		return response
 	#END TRY/EXCEPT
 	
 	#Attempting to find the project script that defines the endpoint the request came to.
-	logger.trace("Will try finding a Script Module at path {!r}".format(wdr.swag['resource-path']))
+	logger.trace("Will try finding a Script Module at path {!r}", args=(wdr.swag['resource-path'],))
 	try:
-		foundPackage = findBestScriptResourceFromPath(wdr.swag['resource-path'], swagStc)
+		foundPackage = wdr.timer.time('routing', findBestScriptResourceFromPath, wdr.swag['resource-path'], swagStc)
 	except (Exception, java.lang.Exception), e:
 		etype, evalue, tb = sys.exc_info() if isinstance(e, Exception) else (type(e), e, None)
 		logger.error(
@@ -2372,12 +3531,12 @@ def processRequest(request, session):
 		)
 		logger.trace("Generating Internal Server Error response (Finding Script Resource)")
 		response = swagRsp.httpStatus(wdr.request, "Internal Server Error")
-		wdr.logOutgoingData(response)
+		wdr.timer.time('logging', wdr.logOutgoingData, response)
 		return response
 	#END TRY/EXCEPT
 	if foundPackage is None:
 		response = swagRsp.httpStatus(wdr.request, "Not Found")
-		wdr.logOutgoingData(response)
+		wdr.timer.time('logging', wdr.logOutgoingData, response)
 		return response
 	#END IF
 	#Adding the "remaining path" to the WebDevRequest object. This needs to be done here because the WebDevRequest
@@ -2386,11 +3545,13 @@ def processRequest(request, session):
 	wdr.swag['remainingPath'] = foundPackage['remainingPath']
 	#Also adding the Path Parameters found.
 	wdr.swag['pathParams'] = foundPackage['pathParams']
+	wdr.accessInfo['route'] = foundPackage['fullName']
 	
 	#After finding the necessary project script, we intialize an "Endpoint" instance with the WebDevRequest instance,
 	# which will allow us to execute all of the validation and authentication, and then we return the response
 	try:
-		endpointObj = Endpoint(
+		endpointObj = wdr.timer.time(
+			'routing', Endpoint,
 			wdr,
 			foundPackage['fullName'],
 			foundPackage['scriptModule'],
@@ -2405,13 +3566,16 @@ def processRequest(request, session):
 		)
 		logger.trace("Generating Internal Server Error response (Endpoint Creation)")
 		response = swagRsp.httpStatus(wdr.request, "Internal Server Error")
-		wdr.logOutgoingData(response)
+		wdr.timer.time('logging', wdr.logOutgoingData, response)
 		return response
 	#END TRY/EXCEPT
 	response = None
 	try:
 		logger.trace("Executing Endpoint")
 		response = endpointObj.execute()
+	except CustomExceptions.RequestBodyTooLargeException, e:
+		logger.warn("Request Entity Too Large. '{!s}'".format(e.message))
+		response = swagRsp.httpStatus(wdr.request, "Request Entity Too Large")
 	except (Exception, java.lang.Exception), e:
 		etype, evalue, tb = sys.exc_info() if isinstance(e, Exception) else (type(e), e, None)
 		logger.error(
@@ -2421,7 +3585,7 @@ def processRequest(request, session):
 		logger.trace("Generating Internal Server Error response (Endpoint Execution)")
 		response = swagRsp.httpStatus(wdr.request, "Internal Server Error")
 	finally:
-		wdr.logOutgoingData(response)
+		wdr.timer.time('logging', wdr.logOutgoingData, response)
 		return response
 	#END TRY/EXCEPT/FINALLY
 ##END DEF
\ No newline at end of file
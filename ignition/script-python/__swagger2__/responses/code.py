@@ -8,6 +8,9 @@
 import httplib
 import copy
 import types
+import hashlib
+#Other Ignition Project Script Modules that we will use
+from __swagger2__ import serializer as swagSer
 
 
 
@@ -62,7 +65,7 @@ def httpStatus(request, status):
 	@RETURN	PyDictionary, the WebDev 'response'
 	'''
 	logger = LIBRARY_LOGGER.getSubLogger('httpStatus')
-	logger.trace("Given HTTP Status = {!r}".format(status))
+	logger.trace("Given HTTP Status = {!r}", args=(status,))
 	code = status
 	text = status
 	if isinstance(text, types.StringTypes):
@@ -92,7 +95,94 @@ def setHeader(request, header, value):
 	@RETURN	N/A
 	'''
 	logger = LIBRARY_LOGGER.getSubLogger('setHeader')
-	logger.trace("Given Header/Value of '{!s}'/'{!s}'".format(header, value))
+	logger.trace("Given Header/Value of '{!s}'/'{!s}'", args=(header, value))
 	request['servletResponse'].setHeader(header, value)
 	logger.trace("Header set.")
+#END DEF
+
+class EntityTagStream(object):
+	'''
+	@CLASS	A stream (anything with a `write` function) that hashes what is written to it, rather than keeping it, so that
+			the Entity Tag of a large body can be made without building the whole body in memory
+	'''
+	def __init__(self):
+		self.__hash = hashlib.sha1()
+	#END DEF
+	
+	def write(self, content):
+		if isinstance(content, types.UnicodeType):
+			content = content.encode('utf-8')
+		self.__hash.update(content)
+	#END DEF
+	
+	def getEntityTag(self):
+		'''
+		@FUNC	Gets the strong Entity Tag of everything written so far
+		@RETURN	String, the quoted Entity Tag
+		'''
+		return '"{!s}"'.format(self.__hash.hexdigest())
+	#END DEF
+#END CLASS
+
+def makeEntityTag(content):
+	'''
+	@FUNC	Creates a strong Entity Tag (the value of an 'ETag' header) for the given content
+	@PARAM	content : String, the body of the response
+	@RETURN	String, the quoted Entity Tag
+	'''
+	hashingStream = EntityTagStream()
+	hashingStream.write(content)
+	return hashingStream.getEntityTag()
+#END DEF
+
+def makeJsonEntityTag(obj):
+	'''
+	@FUNC	Creates a strong Entity Tag for the given object, from its JSON (see `__swagger2__.serializer`). The JSON is
+			hashed as it is written, and never held in memory as a whole.
+	@PARAM	obj : Object, the object a 'json' response would be encoded from
+	@RETURN	String, the quoted Entity Tag
+	@RAISES	TypeError, when the object (or something inside it) cannot be written as JSON
+	'''
+	hashingStream = EntityTagStream()
+	swagSer.dump(obj, hashingStream)
+	return hashingStream.getEntityTag()
+#END DEF
+
+def entityTagMatches(ifNoneMatch, etag):
+	'''
+	@FUNC	Determines whether the value of an 'If-None-Match' request header matches the given Entity Tag, meaning that
+			the client already has the current version of the response.
+	@PARAM	ifNoneMatch : String/None, the value of the 'If-None-Match' header
+	@PARAM	etag : String, the quoted Entity Tag of the current response
+	@RETURN	Boolean, True if the client's copy is current
+	'''
+	if not ifNoneMatch:
+		return False
+	if ifNoneMatch.strip() == '*':
+		return True
+	#The header can list multiple tags, and the comparison for 'If-None-Match' ignores the weak indicator
+	for givenTag in ifNoneMatch.split(','):
+		givenTag = givenTag.strip()
+		if givenTag.startswith('W/'):
+			givenTag = givenTag[2:]
+		if givenTag == etag:
+			return True
+	#END FOR
+	return False
+#END DEF
+
+def notModified(request, etag=None):
+	'''
+	@FUNC	Sets the HTTP status code to 304 (Not Modified), and returns an empty WebDev 'response'
+	@PARAM	request : WebDev Request object
+	@PARAM	etag : String/None, the quoted Entity Tag to include in the 'ETag' header
+	@RETURN	PyDictionary, the WebDev 'response'
+	'''
+	logger = LIBRARY_LOGGER.getSubLogger('notModified')
+	logger.trace("Client's copy is current (ETag {!s})", args=(etag,))
+	request['servletResponse'].setStatus(304)
+	if etag is not None:
+		request['servletResponse'].setHeader('ETag', etag)
+	#A 304 response must not have a body
+	return {'response': ''}
 #END DEF
\ No newline at end of file
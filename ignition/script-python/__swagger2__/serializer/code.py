@@ -0,0 +1,310 @@
+'''
+	This script contains a JSON writer that serializes Python and Java objects in a single pass, keeping the order of
+	the keys of (Ordered) Dictionaries, and writing the pieces of the JSON either into a buffer or straight into a
+	stream (like the Writer of the Java Servlet Response).
+'''
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# IMPORTS
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+import types
+import re
+from java.util import Date, Map, Collection
+#Other Ignition Project Script Modules that we will use
+import server
+
+
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# LOGGER and CONSTANTS
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+LIBRARY_LOGGER = server.getLogger("IgnitionSwagger2.serializer")
+
+#Every character that is not printable ASCII (along with the quote and backslash) is escaped, so the JSON we write is
+# plain ASCII, and it doesn't matter what character encoding the Servlet Response ends up using.
+ESCAPE_ASCII_REGEX = re.compile(r'([\\"]|[^\ -~])')
+ESCAPE_CHARACTERS = {
+	u'\\': '\\\\',
+	u'"': '\\"',
+	u'\b': '\\b',
+	u'\f': '\\f',
+	u'\n': '\\n',
+	u'\r': '\\r',
+	u'\t': '\\t',
+}
+
+#The number of pieces of JSON the writer holds on to before passing them (as one String) to the stream. Calling
+# the `write` of a Java Writer for every bracket and comma would be much slower than building a few larger Strings.
+STREAM_CHUNK_SIZE = 512
+
+
+
+def _escapeCharacter(match):
+	'''
+	@FUNC	Used by `escapeString` to replace a single character with its JSON escape sequence
+	@PARAM	match : Regex Match object, for a single character
+	@RETURN	String, the escape sequence
+	'''
+	char = match.group(0)
+	if char in ESCAPE_CHARACTERS:
+		return ESCAPE_CHARACTERS[char]
+	codePoint = ord(char)
+	if codePoint < 0x10000:
+		return '\\u{0:04x}'.format(codePoint)
+	#Characters outside the Basic Multilingual Plane must be written as a UTF-16 surrogate pair
+	codePoint -= 0x10000
+	return '\\u{0:04x}\\u{1:04x}'.format(0xd800 | ((codePoint >> 10) & 0x3ff), 0xdc00 | (codePoint & 0x3ff))
+#END DEF
+
+def escapeString(value):
+	'''
+	@FUNC	Converts a String into a quoted JSON String (containing only ASCII characters)
+	@PARAM	value : String/Unicode. Byte Strings are expected to be UTF-8.
+	@RETURN	String, the JSON String, including the surrounding quotes
+	'''
+	if isinstance(value, types.StringType):
+		value = value.decode('utf-8')
+	return '"' + str(ESCAPE_ASCII_REGEX.sub(_escapeCharacter, value)) + '"'
+#END DEF
+
+
+
+class JsonWriter(object):
+	'''
+	@CLASS	Writes Python and Java objects as JSON. The pieces of JSON are either collected so that they can be retrieved
+			as one String (with `getvalue`), or passed in chunks to the `write` function of the given stream.
+			Supports None, Booleans, numbers, Strings, (Ordered) Dictionaries, Lists, Tuples, Sets, Generators,
+			Java Maps, Java Collections, and Java Dates (written as milliseconds since the epoch). The keys of
+			(Ordered) Dictionaries are written in the order they are iterated over.
+	@ATTR	stream : Object/None, anything with a `write` function that takes a String (eg. a Java Writer). When
+				this is `None`, the JSON is collected until `getvalue` is called.
+	'''
+	def __init__(self, stream=None):
+		self.stream = stream
+		self.__pieces = []
+		#Looking up the function for the exact type is much quicker than going through the `isinstance` checks.
+		# Subclasses (like OrderedDict) and Java objects fall back to those checks in `__writeOther`.
+		self.__writers = {
+			types.NoneType: self.__writeNone,
+			types.BooleanType: self.__writeBoolean,
+			types.IntType: self.__writeInteger,
+			types.LongType: self.__writeInteger,
+			types.FloatType: self.__writeFloat,
+			types.StringType: self.__writeString,
+			types.UnicodeType: self.__writeString,
+			types.DictionaryType: self.__writeDictionary,
+			types.ListType: self.__writeSequence,
+			types.TupleType: self.__writeSequence,
+		}
+	#END DEF
+	
+	def write(self, obj):
+		'''
+		@FUNC	Writes the given object as JSON
+		@PARAM	obj : Object, the object to write
+		@RETURN	JsonWriter, this instance (so that calls can be chained)
+		@RAISES	TypeError, when the object (or something inside it) cannot be written as JSON
+		'''
+		self.__writeValue(obj)
+		if self.stream is not None:
+			self.flush()
+		return self
+	#END DEF
+	
+	def flush(self):
+		'''
+		@FUNC	Passes any JSON that has not been written yet to the stream
+		'''
+		if self.stream is not None and self.__pieces:
+			self.stream.write(''.join(self.__pieces))
+			del self.__pieces[:]
+	#END DEF
+	
+	def getvalue(self):
+		'''
+		@FUNC	Gets the JSON written so far. Only available when no stream was given.
+		@RETURN	String, the JSON
+		'''
+		return ''.join(self.__pieces)
+	#END DEF
+	
+	def __append(self, piece):
+		self.__pieces.append(piece)
+		if self.stream is not None and len(self.__pieces) >= STREAM_CHUNK_SIZE:
+			self.flush()
+	#END DEF
+	
+	def __writeValue(self, obj):
+		writer = self.__writers.get(type(obj), None)
+		if writer is not None:
+			writer(obj)
+		else:
+			self.__writeOther(obj)
+	#END DEF
+	
+	def __writeNone(self, obj):
+		self.__append('null')
+	#END DEF
+	
+	def __writeBoolean(self, obj):
+		self.__append('true' if obj else 'false')
+	#END DEF
+	
+	def __writeInteger(self, obj):
+		self.__append(str(obj))
+	#END DEF
+	
+	def __writeFloat(self, obj):
+		#JSON has no representation for NaN or Infinity
+		if obj != obj or obj in (float('inf'), float('-inf')):
+			self.__append('null')
+		else:
+			self.__append(repr(obj))
+	#END DEF
+	
+	def __writeString(self, obj):
+		self.__append(escapeString(obj))
+	#END DEF
+	
+	def __writeKey(self, key):
+		#JSON keys must be Strings, so other simple types are written the way they would appear as a value.
+		if isinstance(key, types.StringTypes):
+			self.__append(escapeString(key) + ':')
+		elif key is None or isinstance(key, (types.BooleanType, types.IntType, types.LongType, types.FloatType)):
+			self.__append('"' + dumps(key) + '":')
+		else:
+			self.__append(escapeString(unicode(key)) + ':')
+	#END DEF
+	
+	def __writeDictionary(self, obj):
+		self.__append('{')
+		first = True
+		for key in obj:
+			if not first:
+				self.__append(',')
+			first = False
+			self.__writeKey(key)
+			self.__writeValue(obj[key])
+		#END FOR
+		self.__append('}')
+	#END DEF
+	
+	def __writeMap(self, obj):
+		self.__append('{')
+		first = True
+		for entry in obj.entrySet():
+			if not first:
+				self.__append(',')
+			first = False
+			self.__writeKey(entry.getKey())
+			self.__writeValue(entry.getValue())
+		#END FOR
+		self.__append('}')
+	#END DEF
+	
+	def __writeSequence(self, obj):
+		self.__append('[')
+		first = True
+		for item in obj:
+			if not first:
+				self.__append(',')
+			first = False
+			self.__writeValue(item)
+		#END FOR
+		self.__append(']')
+	#END DEF
+	
+	def __writeOther(self, obj):
+		if isinstance(obj, types.DictionaryType):
+			self.__writeDictionary(obj)
+		elif isinstance(obj, types.BooleanType):
+			self.__writeBoolean(obj)
+		elif isinstance(obj, (types.IntType, types.LongType)):
+			self.__writeInteger(obj)
+		elif isinstance(obj, types.FloatType):
+			self.__writeFloat(obj)
+		elif isinstance(obj, types.StringTypes):
+			self.__writeString(obj)
+		elif isinstance(obj, (types.ListType, types.TupleType, set, frozenset, types.GeneratorType)):
+			self.__writeSequence(obj)
+		elif isinstance(obj, Date):
+			self.__writeInteger(obj.getTime())
+		elif isinstance(obj, Map):
+			self.__writeMap(obj)
+		elif isinstance(obj, Collection):
+			self.__writeSequence(obj)
+		else:
+			raise TypeError("Object of type {!r} cannot be written as JSON".format(type(obj)))
+	#END DEF
+#END CLASS
+
+
+
+def dumps(obj):
+	'''
+	@FUNC	Converts the given object into a JSON String
+	@PARAM	obj : Object, the object to convert
+	@RETURN	String, the JSON
+	@RAISES	TypeError, when the object (or something inside it) cannot be written as JSON
+	'''
+	return JsonWriter().write(obj).getvalue()
+#END DEF
+
+def dump(obj, stream):
+	'''
+	@FUNC	Writes the given object as JSON into the given stream
+	@PARAM	obj : Object, the object to write
+	@PARAM	stream : Object, anything with a `write` function that takes a String (eg. a Java Writer)
+	@RAISES	TypeError, when the object (or something inside it) cannot be written as JSON
+	'''
+	JsonWriter(stream).write(obj)
+#END DEF
+
+class CountingStream(object):
+	'''
+	@CLASS	A stream (anything with a `write` function) that only counts the bytes (as UTF-8) written to it
+	@ATTR	count : Integer, the number of bytes written so far
+	'''
+	def __init__(self):
+		self.count = 0
+	#END DEF
+	
+	def write(self, content):
+		if isinstance(content, types.UnicodeType):
+			content = content.encode('utf-8')
+		self.count += len(content)
+	#END DEF
+#END CLASS
+
+def measure(obj):
+	'''
+	@FUNC	Gets the length (in bytes, as UTF-8) of the JSON of the given object, without building the JSON String
+	@PARAM	obj : Object, the object to measure
+	@RETURN	Integer
+	@RAISES	TypeError, when the object (or something inside it) cannot be written as JSON
+	'''
+	countingStream = CountingStream()
+	dump(obj, countingStream)
+	return countingStream.count
+#END DEF
+
+def streamResponse(request, obj, contentType='application/json'):
+	'''
+	@FUNC	Writes the given object as JSON straight into the Java Servlet Response, rather than having the WebDev
+			Module encode a 'json' response. This avoids building the whole JSON String in memory, which is helpful
+			for responses with large Lists.
+	@PARAM	request : WebDev Request object
+	@PARAM	obj : Object, the object to write
+	@PARAM	contentType : String, the value of the 'Content-Type' header [DEFAULT: 'application/json']
+	@RETURN	None, which tells the WebDev Module that the response has already been written
+	@RAISES	TypeError, when the object (or something inside it) cannot be written as JSON
+	'''
+	logger = LIBRARY_LOGGER.getSubLogger('streamResponse')
+	servletResponse = request['servletResponse']
+	servletResponse.setContentType(contentType)
+	writer = servletResponse.getWriter()
+	dump(obj, writer)
+	writer.flush()
+	logger.trace("JSON response written to the Servlet Response")
+	return None
+#END DEF
\ No newline at end of file
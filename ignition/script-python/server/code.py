@@ -10,6 +10,7 @@ import system
 import time
 import types
 import pprint
+import threading
 import java.lang.Exception
 import java.lang.StackTraceElement
 import java.lang.String
@@ -22,47 +23,90 @@ def timeInMilli():
 	@FUNC	Gets the number of milliseconds since epoch
 			https://stackoverflow/a/5998359
 	'''
-	return int(round(time.time()) * 1000)
+	return int(round(time.time() * 1000))
 #END DEF
 
 class Logger(object):
 	'''
 	This is our custom Logger class, whose functions simply use the built in system logging, but offers some
 	  improved granularity of how the message is show in Development vs. Production.
+	
+	Nothing is formatted for a level that the system Logger will not log. To take advantage of that, pass the values
+	  for the message in `args` (eg. `logger.trace("Got {!r}", args=(data,))`) rather than calling `format` yourself,
+	  or pass a function (taking no arguments) as the message or extra info, which is only called if it is needed.
 	'''
 	
 	_acceptedLevels = ['trace', 'debug', 'info', 'warn', 'error', 'fatal']
+	#The function of the system Logger that tells us whether it will log messages at the level
+	_levelEnabledFunctions = {
+		'trace': 'isTraceEnabled',
+		'debug': 'isDebugEnabled',
+		'info': 'isInfoEnabled',
+		'warn': 'isWarnEnabled',
+		'error': 'isErrorEnabled',
+		'fatal': 'isErrorEnabled',
+	}
 	
 	def __init__(self, name):
 		if not isinstance(name, types.StringTypes):
 			name = 'GenericLogger'
 		self.name = name.strip()
-		self.starttime = None
+		#Loggers are shared between threads (see `getLogger`), so each thread has its own timer
+		self.__timer = threading.local()
 		self.logger = system.util.getLogger(self.name)
+		#The Sub-Loggers already handed out by this Logger, by their (short) sub-name
+		self.__subLoggers = {}
 	#END DEF
 	
 	def getSubLogger(self, subname):
+		'''
+		@FUNC	Gets the Logger named after this Logger and the given sub-name. The same Logger object is returned
+				every time it is asked for (see `getLogger`).
+		@PARAM	subname : String
+		@RETURN	Logger object
+		'''
 		if not isinstance(subname, types.StringTypes):
 			subname = 'SubLogger'
-		newName = self.logger.getName()+"."+subname.strip()
-		newLogger = Logger(newName)
-		return newLogger
+		subLogger = self.__subLoggers.get(subname, None)
+		if subLogger is None:
+			subLogger = getLogger(self.logger.getName()+"."+subname.strip())
+			self.__subLoggers[subname] = subLogger
+		return subLogger
 	#END DEF
 	
-	def startTimer():
-		self.starttime = timeInMilli()
+	def startTimer(self):
+		'''
+		@FUNC	Starts prefixing the messages logged (by the current thread) with the milliseconds since this call
+		'''
+		self.__timer.starttime = timeInMilli()
 	#END DEF
 	
-	def stopTimer():
-		self.starttime = None
+	def stopTimer(self):
+		'''
+		@FUNC	Stops prefixing the messages logged (by the current thread) with the milliseconds elapsed
+		'''
+		self.__timer.starttime = None
 	#END DEF
 	
-	def log(self, message, extraInfo=None, level='info'):
+	def isEnabled(self, level):
+		'''
+		@FUNC	Checks whether the system Logger will log messages at the given level
+		@PARAM	level : String, one of the accepted levels (eg. 'trace')
+		@RETURN	Boolean
+		'''
+		isEnabledFunction = getattr(self.logger, self._levelEnabledFunctions.get(str(level).lower(), ''), None)
+		if isEnabledFunction is None:
+			return True
+		return isEnabledFunction()
+	#END DEF
+	
+	def log(self, message, extraInfo=None, level='info', args=None):
 		'''
 		@FUNC	Logs a message at the specified Level, based on which server this code is running on.
-		@PARAM	message : String
-		@PARAM	extraInfo : Object, which will be converted into a Java Exception
+		@PARAM	message : String, or a function that returns the String
+		@PARAM	extraInfo : Object (or a function that returns it), which will be converted into a Java Exception
 		@PARAM	level : String, the function name that will log a message at a specific logger level
+		@PARAM	args : Tuple/None, the values that the message is formatted with (using `format`)
 		@RETURN	N/A
 		'''
 		level = str(level).lower()
@@ -72,12 +116,21 @@ class Logger(object):
 					level, self._acceptedLevels
 				)
 			)
+		if not self.isEnabled(level):
+			return
+		if callable(message):
+			message = message()
 		fullMessage = str(message)
-		if self.starttime is not None:
-			fullMessage = "{!s} - {!s}".format((timeInMilli() - self.starttime), fullMessage)
+		if args is not None:
+			fullMessage = fullMessage.format(*args)
+		starttime = getattr(self.__timer, 'starttime', None)
+		if starttime is not None:
+			fullMessage = "{!s} - {!s}".format((timeInMilli() - starttime), fullMessage)
 		f = getattr(self.logger, level)
 		if not isinstance(f, types.MethodType):
 			raise Exception("Found property '{!s}', but it is not a valid method.".format(level))
+		if callable(extraInfo) and not isinstance(extraInfo, (Exception, java.lang.Exception)):
+			extraInfo = extraInfo()
 		if extraInfo is not None:
 			if isinstance(extraInfo, (Exception, java.lang.Exception)):
 				f(fullMessage, castToJavaException(extraInfo))
@@ -87,14 +140,38 @@ class Logger(object):
 			f(fullMessage)
 	#END DEF
 	
+	def trace(self, message='', extraInfo=None, args=None):
+		self.log(message=message, extraInfo=extraInfo, level='trace', args=args)
+	#END DEF
+	
+	def debug(self, message='', extraInfo=None, args=None):
+		self.log(message=message, extraInfo=extraInfo, level='debug', args=args)
+	#END DEF
+	
+	def info(self, message='', extraInfo=None, args=None):
+		self.log(message=message, extraInfo=extraInfo, level='info', args=args)
+	#END DEF
+	
+	def warn(self, message='', extraInfo=None, args=None):
+		self.log(message=message, extraInfo=extraInfo, level='warn', args=args)
+	#END DEF
+	
+	def error(self, message='', extraInfo=None, args=None):
+		self.log(message=message, extraInfo=extraInfo, level='error', args=args)
+	#END DEF
+	
+	def fatal(self, message='', extraInfo=None, args=None):
+		self.log(message=message, extraInfo=extraInfo, level='fatal', args=args)
+	#END DEF
+	
 	def __getattr__(self, attr):
 		'''
 		@FUNC	Overriding the default method that gets attributes so that we can catch calls to the
-				functions that come in the system Logger (eg. debug, trace, info, etc.)
+				functions that come in the system Logger, no matter how they are capitalized (eg. TRACE, Debug, etc.)
 		'''
 		if attr.lower() in self._acceptedLevels:
-			def _callLog(message='', extraInfo=None, level=attr):
-				self.log(message=message, extraInfo=extraInfo, level=level)
+			def _callLog(message='', extraInfo=None, level=attr, args=None):
+				self.log(message=message, extraInfo=extraInfo, level=level, args=args)
 			return _callLog
 		else:
 			try:
@@ -105,8 +182,31 @@ class Logger(object):
 	#END DEF
 #END CLASS
 
+#Every Logger that has been handed out, by its full name. Nothing in a Logger changes from one message to the
+# next, so the same object can be shared by every request (and thread) that asks for a Logger with that name.
+_LOGGER_REGISTRY = {}
+_LOGGER_REGISTRY_LOCK = threading.Lock()
+
 def getLogger(name):
-	return Logger(name)
+	'''
+	@FUNC	Gets the Logger with the given name, creating it (and the system Logger behind it) only the first time
+			it is asked for
+	@PARAM	name : String
+	@RETURN	Logger object
+	'''
+	if not isinstance(name, types.StringTypes):
+		name = 'GenericLogger'
+	name = name.strip()
+	logger = _LOGGER_REGISTRY.get(name, None)
+	if logger is None:
+		with _LOGGER_REGISTRY_LOCK:
+			#Another thread may have created the Logger while we were waiting for the lock
+			logger = _LOGGER_REGISTRY.get(name, None)
+			if logger is None:
+				logger = Logger(name)
+				_LOGGER_REGISTRY[name] = logger
+	#END IF
+	return logger
 #END DEF
 
 
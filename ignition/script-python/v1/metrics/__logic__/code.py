@@ -0,0 +1,40 @@
+import apiAuth
+from __swagger2__ import requests as swagRq
+from __swagger2__ import responses as swagRsp
+from __swagger2__ import metrics as swagMet
+from v1 import statics as swagStc
+PREFIX = swagStc.IGNITION_SWAGGER_CUSTOM_PREFIX
+
+
+
+class GET(swagRq.HttpMethod):
+	
+	SWAGGER = {
+		#Custom Ignition Swagger Keys
+		PREFIX+'auth' : [
+			{'method': apiAuth.simple.allowAll,},
+		],
+		PREFIX+'hide': True,
+		PREFIX+'validateRequest': False,
+		PREFIX+'validateResponse': False,
+		PREFIX+'tagGroup': 'Monitoring',
+		
+		#Normal Swagger Keys
+		# !NOTE!
+		# No normal Swagger keys are needed, since we won't being doing any validation of
+		# the request or response.
+	}
+	
+	@staticmethod
+	def __do__(wdr, logger):
+		if wdr.swag['file-extension'] not in [None, '', 'txt']:
+			return swagRsp.httpStatus(wdr.request, "Not Implemented")
+		logger.trace("Rendering the request pipeline metrics")
+		#The metrics are in the Prometheus text exposition format, so that they can be scraped by our monitoring
+		return {
+			'response': swagMet.renderPrometheus(),
+			'contentType': swagMet.PROMETHEUS_CONTENT_TYPE
+		}
+	#END DEF
+
+#END CLASS
\ No newline at end of file
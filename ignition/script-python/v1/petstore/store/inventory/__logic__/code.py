@@ -21,6 +21,8 @@ class GET(swagRq.HttpMethod):
 		PREFIX+'validateRequest': False,
 		PREFIX+'validateResponse': False,
 		PREFIX+'tagGroup': 'Pet Store',
+		PREFIX+'cache': {'ttl': 30},
+		PREFIX+'etag': True,
 		
 		 # ACTUAL SWAGGER DEFINITION
 		'operationId': '',
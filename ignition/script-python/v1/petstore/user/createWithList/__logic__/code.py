@@ -18,9 +18,13 @@ class POST(swagRq.HttpMethod):
 			{'method': apiAuth.simple.allowAll,},
 		],
 		PREFIX+'hide': False,
-		PREFIX+'validateRequest': False,
+		PREFIX+'validateRequest': True,
 		PREFIX+'validateResponse': False,
 		PREFIX+'tagGroup': 'Pet Store',
+		#Bulk endpoint, so the request body can be much larger than the default limit
+		PREFIX+'maxBodySize': 64 * 1024 * 1024,
+		#The users are decoded and validated one at a time, as `__do__` iterates over them
+		PREFIX+'streamBody': True,
 		
 		 # ACTUAL SWAGGER DEFINITION
 		'operationId': '',
@@ -31,14 +35,22 @@ class POST(swagRq.HttpMethod):
 		],
 		'consumes': [
 			'application/json',
-			'application/x-www-form-urlencoded',
 		],
 		'produces': [
 			'application/json',
 			'application/xml',
 		],
 		'parameters': [
-			#
+			{
+				'in': 'body',
+				'name': 'body',
+				'description': "List of user object",
+				'required': True,
+				'schema': {
+					'type': 'array',
+					'items': {'$ref': "#/definitions/User"},
+				},
+			}
 		],
 		'responses': {
 			#
@@ -49,6 +61,14 @@ class POST(swagRq.HttpMethod):
 	@staticmethod
 	def __do__(wdr, logger):
 		logger.trace("Doing a thing")
-		return swagRsp.json(success=True, status='SUCCESS', data={'description': "successful operation"})
+		userCount = 0
+		for user in wdr.swag['data']:
+			logger.trace("Creating user '{!s}'", args=(user.get('username', None),))
+			userCount += 1
+		#END FOR
+		return swagRsp.json(
+			success=True, status='SUCCESS',
+			data={'description': "successful operation", 'count': userCount}
+		)
 	#END DEF
 #END CLASS
\ No newline at end of file
@@ -0,0 +1,35 @@
+import apiAuth
+from __swagger2__ import requests as swagRq
+from __swagger2__ import responses as swagRsp
+from __swagger2__ import profiler as swagPrf
+from v1 import statics as swagStc
+PREFIX = swagStc.IGNITION_SWAGGER_CUSTOM_PREFIX
+
+
+
+class GET(swagRq.HttpMethod):
+	
+	SWAGGER = {
+		#Custom Ignition Swagger Keys
+		PREFIX+'auth' : [
+			{'method': apiAuth.simple.allowAll,},
+		],
+		PREFIX+'hide': True,
+		PREFIX+'validateRequest': False,
+		PREFIX+'validateResponse': False,
+		PREFIX+'tagGroup': 'Monitoring',
+		
+		#Normal Swagger Keys
+		# !NOTE!
+		# No normal Swagger keys are needed, since we won't being doing any validation of
+		# the request or response.
+	}
+	
+	@staticmethod
+	def __do__(wdr, logger):
+		logger.trace("Getting the profiles of the sampled and slow requests")
+		#Newest first, each with the request's stage times and (when sampled) the functions that took the longest
+		return swagRsp.json(data={'profiles': swagPrf.getProfiles()})
+	#END DEF
+
+#END CLASS
\ No newline at end of file
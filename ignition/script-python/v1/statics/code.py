@@ -23,6 +23,49 @@ ENDPOINT_LOGIC_RESOURCE_NAME = '__logic__'
 ENDPOINT_LOGIC_FUNCTION = '__do__'
 ENDPOINT_SWAGGER_VARIABLE = 'SWAGGER'
 
+#The `swagger.json` document is generated once and then cached until the project scripts are saved. This is the value
+# of the 'Cache-Control' header it is served with. Clients can always use the 'ETag' header to check for a new version.
+SWAGGER_CACHE_CONTROL = 'public, max-age=60'
+
+#The largest request body (in bytes) that an endpoint will accept, unless the endpoint sets its own limit with the
+# custom 'maxBodySize' key in its SWAGGER. Larger requests get a "413 Request Entity Too Large" response, without the
+# body being read when the request includes a 'Content-Length' header. Set to `None` to remove the limit.
+MAX_REQUEST_BODY_SIZE = 10 * 1024 * 1024
+
+#Whether to time each stage of handling a request (see `__swagger2__.metrics`). The times are kept in memory,
+# aggregated per endpoint and HTTP Method.
+COLLECT_METRICS = True
+
+#Where the access log events (one for every request handled, see `__swagger2__.accesslog.EVENT_KEYS`) are written.
+# The events are written in batches by a background thread, so the requests never wait on the sinks. A sink can be
+# anything with a `write` function that takes a List of events, such as the ones in `__swagger2__.accesslog`:
+#	ACCESS_LOG_SINKS = [
+#		__swagger2__.accesslog.LoggerSink(),
+#		__swagger2__.accesslog.RollingFileSink('/var/log/ignition/api-access.log'),
+#		__swagger2__.accesslog.DatabaseSink('api_access_log', 'MyDatabase'),
+#	]
+#Leave the list empty for no access log. When more than ACCESS_LOG_QUEUE_SIZE events are waiting to be written, new
+# events are dropped (and counted) rather than slowing down the requests.
+ACCESS_LOG_SINKS = []
+ACCESS_LOG_QUEUE_SIZE = 10000
+ACCESS_LOG_BATCH_SIZE = 100
+
+#The profile settings used by every endpoint (see `__swagger2__.profiler.DEFAULT_PROFILE_SETTINGS`), eg.
+#	PROFILE = {'sampleRate': 100, 'slowThreshold': 500}
+# which runs 1 in 100 requests under the Python profiler, and keeps the stage times of any request that takes longer
+# than half a second. An endpoint can override these with its custom 'profile' Swagger key. Leave as None to only
+# profile the endpoints that ask for it. The last PROFILE_BUFFER_SIZE profiles are shown by the 'profiles' endpoint.
+PROFILE = None
+PROFILE_BUFFER_SIZE = 50
+
+#Whether to compress the responses the client accepts compressed (with gzip or deflate, see the 'Accept-Encoding'
+# header), once they are at least COMPRESSION_MIN_SIZE bytes. Smaller responses gain little, and cost the time it takes
+# to compress them. COMPRESSION_LEVEL goes from 1 (quickest) to 9 (smallest). An endpoint can opt out (or in) with its
+# custom 'compress' Swagger key.
+COMPRESS_RESPONSES = True
+COMPRESSION_MIN_SIZE = 1024
+COMPRESSION_LEVEL = 6
+
 #These dictionaries can be referenced within an endpoint if the response will use a "generic" format and
 # expected set of values.
 # These dictionaries can be useful if you are going to be defining a large number of endpoint that simply
@@ -29,11 +29,18 @@ class GET(swagRq.HttpMethod):
 		if wdr.swag['file-extension'] != 'json':
 			return swagRsp.httpStatus(wdr.request, "Not Implemented")
 		logger.trace("Getting swagger.json")
+		swaggerDocument = __swagger2__.json.getSwaggerDocument(wdr.request, wdr.session)
+		swagRsp.setHeader(wdr.request, 'ETag', swaggerDocument['etag'])
+		cacheControl = getattr(swagStc, 'SWAGGER_CACHE_CONTROL', None)
+		if cacheControl:
+			swagRsp.setHeader(wdr.request, 'Cache-Control', cacheControl)
+		if swagRsp.entityTagMatches(wdr.swag['headers-lc'].get('if-none-match', None), swaggerDocument['etag']):
+			return swagRsp.notModified(wdr.request, swaggerDocument['etag'])
 		#Explicitly returning the response as a string (while still setting the 'contentType') so that
 		# we don't need to return a Dictionary to Ignition. The whole point of generating the Swagger JSON
 		# manually is so that the resulting String would have the JSON keys ordered in a specific way.
 		return {
-			'response': __swagger2__.json.toString( __swagger2__.json.toDict(wdr.request, wdr.session) ),
+			'response': swaggerDocument['body'],
 			'contentType': 'application/json'
 		}
 	#END DEF
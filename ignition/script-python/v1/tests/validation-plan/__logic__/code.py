@@ -0,0 +1,228 @@
+import copy
+import java.util.Date
+import apiAuth
+from __swagger2__ import requests as swagRq
+from __swagger2__ import responses as swagRsp
+from v1 import statics as swagStc
+from v1 import definitions as swagDf
+PREFIX = swagStc.IGNITION_SWAGGER_CUSTOM_PREFIX
+
+
+
+#Every case is validated with both the `validate` function and a compiled ValidationPlan, and the results must match.
+# Since a ValidationPlan only builds the per-key details when the data is not valid, the details for valid data are
+# compared by materializing them from a second run.
+# Each case is a tuple of (name, 'in' location, list of Swagger parameters, data, doTypeCasting, isForResponse)
+def _body(properties, required=[]):
+	return [{'in': 'body', 'schema': {'type': 'object', 'properties': properties, 'required': required}}]
+#END DEF
+
+EQUIVALENCE_CASES = [
+	# - - STRINGS - -
+	('string ok', 'body', _body({'s': {'type': 'string'}}), {'s': 'abc'}, False, False),
+	('string wrong type', 'body', _body({'s': {'type': 'string'}}), {'s': 5}, True, False),
+	('string pattern ok', 'body', _body({'s': {'type': 'string', 'pattern': '^[a-z]+$'}}), {'s': 'abc'}, False, False),
+	('string pattern bad', 'body', _body({'s': {'type': 'string', 'pattern': '^[a-z]+$'}}), {'s': 'ab1'}, False, False),
+	('string min/max ok', 'body', _body({'s': {'type': 'string', 'minLength': 2, 'maxLength': 4}}), {'s': 'abc'}, False, False),
+	('string min/max bad', 'body', _body({'s': {'type': 'string', 'minLength': 2, 'maxLength': 4}}), {'s': 'abcde'}, False, False),
+	('string min bad', 'body', _body({'s': {'type': 'string', 'minLength': 2}}), {'s': 'a'}, False, False),
+	('string max bad', 'body', _body({'s': {'type': 'string', 'maxLength': 2}}), {'s': 'abc'}, False, False),
+	('string byte', 'body', _body({'s': {'type': 'string', 'format': 'byte'}}), {'s': 12}, False, False),
+	('date ok', 'body', _body({'d': {'type': 'string', 'format': 'date'}}), {'d': '2019-01-01'}, False, False),
+	('date bad', 'body', _body({'d': {'type': 'string', 'format': 'date'}}), {'d': 'yesterday'}, False, False),
+	('date not string', 'body', _body({'d': {'type': 'string', 'format': 'date'}}), {'d': 5}, False, False),
+	('date response object', 'body', _body({'d': {'type': 'string', 'format': 'date'}}),
+		{'d': java.util.Date(1546300800000)}, True, True),
+	('date response string', 'body', _body({'d': {'type': 'string', 'format': 'date'}}), {'d': '2019-01-01'}, True, True),
+	('date response bad string', 'body', _body({'d': {'type': 'string', 'format': 'date'}}), {'d': 'nope'}, True, True),
+	('date response bad type', 'body', _body({'d': {'type': 'string', 'format': 'date'}}), {'d': 5}, True, True),
+	# - - BOOLEANS - -
+	('boolean ok', 'body', _body({'b': {'type': 'boolean'}}), {'b': False}, False, False),
+	('boolean no cast', 'body', _body({'b': {'type': 'boolean'}}), {'b': 'true'}, False, False),
+	('boolean cast', 'query', [{'in': 'query', 'name': 'b', 'type': 'boolean'}], {'b': 'false'}, True, False),
+	# - - NUMBERS - -
+	('integer cast', 'query', [{'in': 'query', 'name': 'i', 'type': 'integer'}], {'i': '5'}, True, False),
+	('integer bad cast', 'query', [{'in': 'query', 'name': 'i', 'type': 'integer'}], {'i': 'abc'}, True, False),
+	('integer no cast', 'body', _body({'i': {'type': 'integer'}}), {'i': '5'}, False, False),
+	('integer range ok', 'body', _body({'i': {'type': 'integer', 'minimum': 1, 'maximum': 10}}), {'i': 10}, False, False),
+	('integer range bad', 'body', _body({'i': {'type': 'integer', 'minimum': 1, 'maximum': 10}}), {'i': 11}, False, False),
+	('integer range excl', 'body',
+		_body({'i': {'type': 'integer', 'minimum': 1, 'maximum': 10, 'exclusiveMinimum': True, 'exclusiveMaximum': True}}),
+		{'i': 10}, False, False),
+	('integer range excl min', 'body',
+		_body({'i': {'type': 'integer', 'minimum': 1, 'maximum': 10, 'exclusiveMinimum': True}}), {'i': 1}, False, False),
+	('integer range excl max', 'body',
+		_body({'i': {'type': 'integer', 'minimum': 1, 'maximum': 10, 'exclusiveMaximum': True}}), {'i': 10}, False, False),
+	('integer min only', 'body', _body({'i': {'type': 'integer', 'minimum': 1}}), {'i': 1}, False, False),
+	('integer min only excl', 'body', _body({'i': {'type': 'integer', 'minimum': 1, 'exclusiveMinimum': True}}),
+		{'i': 1}, False, False),
+	('integer max only', 'body', _body({'i': {'type': 'integer', 'maximum': 1}}), {'i': 1}, False, False),
+	('integer max only excl', 'body', _body({'i': {'type': 'integer', 'maximum': 1, 'exclusiveMaximum': True}}),
+		{'i': 2}, False, False),
+	('number float', 'body', _body({'n': {'type': 'number', 'format': 'float', 'minimum': 1}}), {'n': 1.5}, False, False),
+	('number float cast', 'query', [{'in': 'query', 'name': 'n', 'type': 'number', 'format': 'float'}],
+		{'n': '1.5'}, True, False),
+	('number long', 'body', _body({'n': {'type': 'number', 'format': 'long'}}), {'n': 5}, False, False),
+	# - - ENUMS - -
+	('enum ok', 'body', _body({'s': {'type': 'string', 'enum': ['a', 'b']}}), {'s': 'a'}, False, False),
+	('enum bad', 'body', _body({'s': {'type': 'string', 'enum': ['a', 'b']}}), {'s': 'c'}, False, False),
+	('enum after cast', 'query', [{'in': 'query', 'name': 'i', 'type': 'integer', 'enum': [1, 2]}], {'i': '2'}, True, False),
+	# - - PRESENCE, DEFAULTS AND NULLS - -
+	('missing required', 'body', _body({'s': {'type': 'string'}, 'i': {'type': 'integer'}}, ['s', 'i']), {}, False, False),
+	('default inserted', 'query', [{'in': 'query', 'name': 's', 'type': 'string', 'default': 'x'}], {}, True, False),
+	('null not allowed', 'body', _body({'s': {'type': 'string', 'x-nullable': False}}), {'s': None}, False, False),
+	('null allowed', 'body', _body({'s': {'type': 'string'}}), {'s': None}, False, False),
+	# - - ARRAYS - -
+	('array csv', 'query',
+		[{'in': 'query', 'name': 'a', 'type': 'array', 'collectionFormat': 'csv', 'items': {'type': 'integer'}}],
+		{'a': '1,2,3'}, True, False),
+	('array csv bad item', 'query',
+		[{'in': 'query', 'name': 'a', 'type': 'array', 'collectionFormat': 'csv', 'items': {'type': 'integer'}}],
+		{'a': '1,x,3'}, True, False),
+	('array min items', 'query',
+		[{'in': 'query', 'name': 'a', 'type': 'array', 'collectionFormat': 'pipes', 'minItems': 3,
+			'items': {'type': 'string'}}],
+		{'a': 'a|b'}, True, False),
+	('array max items', 'body', _body({'a': {'type': 'array', 'maxItems': 1, 'items': {'type': 'integer'}}}),
+		{'a': [1, 2]}, False, False),
+	('array unique', 'body', _body({'a': {'type': 'array', 'uniqueItems': True, 'items': {'type': 'integer'}}}),
+		{'a': [1, 2, 2]}, False, False),
+	('array unique objects', 'body', _body({'a': {'type': 'array', 'uniqueItems': True, 'items': {'type': 'object'}}}),
+		{'a': [{}, {}]}, False, False),
+	('array not list', 'body', _body({'a': {'type': 'array', 'items': {'type': 'integer'}}}), {'a': '1,2'}, False, False),
+	('array no items', 'body', _body({'a': {'type': 'array'}}), {'a': [1, 'b', None]}, False, False),
+	# - - OBJECTS - -
+	('object ok', 'body', _body({'o': {'type': 'object', 'properties': {'s': {'type': 'string'}}, 'required': ['s']}}),
+		{'o': {'s': 'abc'}}, False, False),
+	('object missing', 'body', _body({'o': {'type': 'object', 'properties': {'s': {'type': 'string'}}, 'required': ['s']}}),
+		{'o': {}}, False, False),
+	('object not dict', 'body', _body({'o': {'type': 'object'}}), {'o': [1]}, False, False),
+	('nested array of objects', 'body',
+		_body({
+			'o': {
+				'type': 'object',
+				'properties': {
+					'a': {
+						'type': 'array',
+						'items': {
+							'type': 'object',
+							'properties': {
+								's': {'type': 'string', 'x-nullable': False},
+								'n': {'type': 'number', 'format': 'float', 'minimum': 1, 'maximum': 10},
+							},
+							'required': ['s', 'n'],
+						},
+					},
+				},
+				'required': ['a'],
+			},
+		}),
+		{'o': {'a': [{'s': 'x', 'n': 5.0}, {'s': None, 'n': 50.0}, {}]}}, False, False),
+	('valid object beside failure', 'body',
+		_body({
+			'o': {'type': 'object', 'properties': {'s': {'type': 'string'}, 't': {'type': 'string', 'default': 'x'}}},
+			'i': {'type': 'integer'},
+		}, ['i']),
+		{'o': {'s': 'abc'}}, False, False),
+	('null object beside failure', 'body',
+		_body({'o': {'type': 'object', 'properties': {'s': {'type': 'string'}}}, 'i': {'type': 'integer'}}, ['i']),
+		{'o': None}, False, False),
+	('valid array beside failure', 'body',
+		_body({
+			'a': {'type': 'array', 'items': {'type': 'object', 'properties': {'s': {'type': 'string'}}}},
+			'i': {'type': 'integer'},
+		}, ['i']),
+		{'a': [{'s': 'abc'}, {}, {'s': 'def'}]}, False, False),
+	# - - REFERENCES - -
+	('header ref', 'header', [{'$ref': '#/parameters/objs_api_key_header'}], {'IS-API-Key': 'abc'}, True, False),
+]
+
+def runEquivalenceCases(cases):
+	'''
+	@FUNC	Validates every case with both `swagRq.validate` and a compiled ValidationPlan, and compares the results.
+	@PARAM	cases : List of Tuples, see `EQUIVALENCE_CASES`
+	@RETURN	List of Strings, a description of every difference found. Empty if everything matched.
+	'''
+	failures = []
+	for name, location, parameters, data, doTypeCasting, isForResponse in cases:
+		signature = swagRq.getDataSignatureFromSwagger(
+			{'parameters': copy.deepcopy(parameters)}, 'incoming', location, swagStc, swagDf
+		)
+		plan = swagRq.compileSignature(signature)
+		outcomes = []
+		for validator in (swagRq.validate, plan.validate):
+			caseData = copy.deepcopy(data)
+			try:
+				if validator is swagRq.validate:
+					result = validator(caseData, signature, doTypeCasting=doTypeCasting, isForResponse=isForResponse)
+				else:
+					result = validator(caseData, doTypeCasting=doTypeCasting, isForResponse=isForResponse)
+				outcomes.append((result.ALL_VALID, dict(result), str(result), caseData, None))
+			except Exception, e:
+				outcomes.append((None, None, None, None, "{!s}: {!s}".format(type(e).__name__, e)))
+		#END FOR
+		(refValid, refTree, refStr, refData, refError), (planValid, planTree, planStr, planData, planError) = outcomes
+		if refError != planError:
+			failures.append("{!s}: raised {!r}, compiled plan raised {!r}".format(name, refError, planError))
+		elif refValid != planValid:
+			failures.append("{!s}: ALL_VALID was {!r}, compiled plan gave {!r}".format(name, refValid, planValid))
+		elif refStr != planStr:
+			failures.append("{!s}: message was {!r}, compiled plan gave {!r}".format(name, refStr, planStr))
+		elif not refValid and refTree != planTree:
+			failures.append("{!s}: validation details did not match".format(name))
+		elif refValid and refTree != plan.materialize(plan.run(copy.deepcopy(data), doTypeCasting, isForResponse)[1]):
+			failures.append("{!s}: materialized validation details did not match".format(name))
+		elif refData != planData:
+			failures.append("{!s}: data was {!r}, compiled plan gave {!r}".format(name, refData, planData))
+	#END FOR
+	return failures
+#END DEF
+
+
+
+class GET(swagRq.HttpMethod):
+	SWAGGER = {
+		 # CUSTOM KEYS FOR IA PURPOSES
+		PREFIX+'auth': [
+			{
+				'method': apiAuth.simple.allowAll,
+				'extraArgs': {},
+			},
+		],
+		PREFIX+'hide': True,
+		PREFIX+'validateRequest': False,
+		PREFIX+'validateResponse': False,
+		PREFIX+'tagGroup': 'Tests',
+		
+		 # ACTUAL SWAGGER DEFINITION
+		'operationId': 'tests_validation-plan_get',
+		'summary': 'GET Validation Plan Equivalence Test',
+		'description': '''Checks that compiled validation plans give exactly the same results as the `validate` function.''',
+		'tags': [
+			'Testing'
+		],
+		'consumes': [
+			'application/x-www-form-urlencoded',
+		],
+		'produces': [
+			'application/json',
+		],
+		'parameters': [],
+		'responses': {
+			'200': swagStc.GENERIC_SUCCESS_RESPONSE,
+			'default': swagStc.GENERIC_FAILURE_RESPONSE,
+		}
+	}
+	
+	@staticmethod
+	def __do__(wdr, LOGGER):
+		failures = runEquivalenceCases(EQUIVALENCE_CASES)
+		for failure in failures:
+			LOGGER.warn(failure)
+		return swagRsp.json(
+			success=(len(failures) == 0),
+			status=('SUCCESS' if len(failures) == 0 else 'FAILURE'),
+			data={'cases': len(EQUIVALENCE_CASES), 'failures': failures}
+		)
+	#END DEF
+#END CLASS